@@ -2,55 +2,281 @@
 """
 --- Day 10: Elves Look, Elves Say ---
 https://adventofcode.com/2015/day/10
-Themes: Look-and-Say sequence, iteration (over string objects), running totals
+Themes: Look-and-Say sequence, iteration (over string objects), running totals,
+Conway's audioactive decay, chemistry of the elements, transition matrices
 
 References
 - https://en.wikipedia.org/wiki/Look-and-say_sequence
 - https://www.youtube.com/watch?v=ea7lJkEhytA
+- https://en.wikipedia.org/wiki/Look-and-say_sequence#Cosmological_decay
+- https://www.nathanieljohnston.com/2010/10/a-derivation-of-conways-degree-71-look-and-say-polynomial/
+- https://en.wikipedia.org/wiki/Exponentiation_by_squaring
+- https://docs.python.org/3/howto/functional.html#generators
+- https://docs.python.org/3/library/re.html
 """
 import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from typing import TextIO
+import itertools
+import re
 
 DIRPATH = os.path.dirname(__file__)
 
+# Number of steps for which the heads of two strings are simulated to decide whether they split
+SPLIT_HORIZON: int = 25
+# Maximum number of distinct elements before falling back to direct simulation
+MAX_ELEMENTS: int = 1000
+# Maximum number of digits passed at a time between the stages of a streamed look-and-say pipeline
+CHUNK_SIZE: int = 1 << 12
+# A maximal run of a single repeated digit
+RUN_PATTERN = re.compile(r"(\d)\1*")
+
 
 def main():
     # Load input file
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
-        seed_digits = file.read()
-
-    # Apply the look-and-say process 40 times on the input seed
-    res1 = seed_digits
-    for _ in range(40):
-        res1 = look_and_say(res1)
-
-    # Apply the look-and-say process 50 times on the input seed, by applying it a further 10 times to the result of part 1
-    res2 = res1
-    for _ in range(10):
-        res2 = look_and_say(res2)
+        seed_digits = file.read().strip()
 
-    print(f"Part 1: The answer is {len(res1)}")
-    print(f"Part 2: The answer is {len(res2)}")
+    # Apply the look-and-say process 40 and 50 times on the input seed, without materialising the resulting strings
+    print(f"Part 1: The answer is {look_and_say_length(seed_digits, 40)}")
+    print(f"Part 2: The answer is {look_and_say_length(seed_digits, 50)}")
 
 
 def look_and_say(digits: str) -> str:
     """Return a string sequence of digits obtained by applying the look-and-say process
     on the input string sequence of digits (left-to-right)
     """
-    result = ""
+    return "".join(look_and_say_stream(digits))
+
+
+def look_and_say_stream(digits: Iterable[str]) -> Iterator[str]:
+    """Lazily yield the digits obtained by applying the look-and-say process on a stream of digits (left-to-right),
+    consuming the input stream only as far as needed to complete each run
+    """
+    iterator = iter(digits)
     # Initialise loop variables
-    val, count = digits[0], 1
-    for d in digits[1:]:
+    val = next(iterator, None)
+    if val is None:
+        return
+    count = 1
+    for d in iterator:
         if d == val:
             # Update the running count of occurrences of the current value
             count += 1
         else:
-            # Append the completed run to the result string
-            result += f"{count}{val}"
+            # Emit the completed run
+            yield from str(count)
+            yield val
             # Start a new running count
             val, count = d, 1
-    # Append the final running count to the result string
-    result += f"{count}{val}"
-    return result
+    # Emit the final run
+    yield from str(count)
+    yield val
+
+
+def iterate_look_and_say(seed: Iterable[str], n: int, chunk_size: int=CHUNK_SIZE) -> Iterator[str]:
+    """Lazily yield the digits obtained by applying the look-and-say process n times on the seed.
+
+    Each of the n stages of the pipeline is a run-length state machine holding the digit and count of the run
+    it is currently reading, and all the stages are driven by a single loop, without recursion, so that any number
+    of iterations can be streamed. Digits pass between stages in chunks of at most `chunk_size` digits, held on
+    a stack of chunks yet to be read by each stage, and the chunks read by a stage are split into runs by a regular
+    expression. The stack is worked depth first, so it holds a bounded number of chunks per stage, and the memory
+    used is proportional to the number of stages, rather than the size of the final result.
+    """
+    # The digit and count of the run currently being read by each stage, where the digit is empty before the first run
+    run_digits: list[str] = [""] * n
+    run_counts: list[int] = [0] * n
+    # Pairs of a stage and a chunk of digits it is yet to read, with the next chunk to be read on top
+    pending: list[tuple[int, str]] = []
+
+    def read_digits(k: int, digits: str) -> str:
+        """Read a chunk of digits into stage k, returning the digits describing the runs it completes"""
+        output: list[str] = []
+        for m in RUN_PATTERN.finditer(digits):
+            d, count = m.group(1), m.end() - m.start()
+            if d == run_digits[k]:
+                run_counts[k] += count
+            else:
+                if run_digits[k]:
+                    output.append(f"{run_counts[k]}{run_digits[k]}")
+                run_digits[k], run_counts[k] = d, count
+        return "".join(output)
+
+    def drain() -> Iterator[str]:
+        while pending:
+            k, digits = pending.pop()
+            if k == n:
+                yield from digits
+                continue
+            output = read_digits(k, digits)
+            # Push the chunks of output in reverse, so that the next stage reads them in order
+            pending.extend((k + 1, output[i:i + chunk_size]) for i in reversed(range(0, len(output), chunk_size)))
+
+    seed_iterator = iter(seed)
+    while digits := "".join(itertools.islice(seed_iterator, chunk_size)):
+        pending.append((0, digits))
+        yield from drain()
+    # Complete the final run of each stage in turn, which may extend or complete the final run of the next stage
+    for k in range(n):
+        if run_digits[k]:
+            pending.append((k + 1, f"{run_counts[k]}{run_digits[k]}"))
+            yield from drain()
+
+
+def write_look_and_say(seed: str, n: int, file: TextIO, chunk_size: int=1 << 16) -> int:
+    """Write the digits obtained by applying the look-and-say process n times on the seed to a text file,
+    in chunks of at most `chunk_size` digits at a time, returning the number of digits written
+    """
+    stream = iterate_look_and_say(seed, n)
+    n_digits = 0
+    while chunk := "".join(itertools.islice(stream, chunk_size)):
+        file.write(chunk)
+        n_digits += len(chunk)
+    return n_digits
+
+
+def splits(left: str, right: str) -> bool:
+    """Check whether the string `left + right` splits as `left` and `right`, meaning that for every number of
+    iterations, the look-and-say process applied to the concatenation is the concatenation of the results.
+
+    This holds exactly when the two parts never merge at their boundary. The last digit of `left` never changes
+    under the look-and-say process, so it suffices to check that the first digit of `right` never becomes equal to it.
+    Conway's Splitting Theorem shows that this depends only on a bounded number of leading digits and steps,
+    so only the head of `right` is simulated, for a fixed number of steps.
+    """
+    last_digit = left[-1]
+    head_length = 3 * SPLIT_HORIZON
+    head = right[:head_length]
+    for _ in range(SPLIT_HORIZON):
+        if head[0] == last_digit:
+            return False
+        # Each step changes at most the last few digits of a truncated head, which are never reached
+        head = look_and_say(head)[:head_length]
+    return True
+
+
+def split_into_elements(digits: str) -> list[str]:
+    """Split a string of digits into its elements, the shortest substrings which evolve independently under
+    the look-and-say process. For strings which are at least two iterations old, these are Conway's elements.
+    """
+    elements: list[str] = []
+    start = 0
+    head_length = 3 * SPLIT_HORIZON
+    for i in range(1, len(digits)):
+        # Only the last digit on the left and the head on the right decide a split, so only those are sliced,
+        # rather than copying the whole suffix at every position
+        if splits(digits[i - 1], digits[i:i + head_length]):
+            elements.append(digits[start:i])
+            start = i
+    elements.append(digits[start:])
+    return elements
+
+
+class AudioactiveDecay:
+    """Conway's audioactive decay of a seed string under the look-and-say process.
+
+    After two iterations, the string is split into elements, each of which decays into a sequence of elements
+    at each further iteration, independently of its neighbours. By Conway's Cosmological Theorem,
+    every string eventually decays into compounds of the 92 common elements (and two transuranic elements for
+    each digit of at least 4 in the seed), so only finitely many distinct elements arise. The string is then
+    represented by the count of each element, which is advanced by a transition matrix from element to decay products.
+    """
+    def __init__(self, seed: str):
+        """Find the elements of the seed after two iterations, and the decay products of every element that can arise.
+        Raises ValueError if there are more than `MAX_ELEMENTS` distinct elements.
+        """
+        if not seed:
+            raise ValueError("Seed must be a non-empty string of digits")
+        self.initial_digits: str = look_and_say(look_and_say(seed))
+        self.initial_counts: Counter[str] = Counter(split_into_elements(self.initial_digits))
+
+        # Breadth-first search over elements for the closure of decay products
+        self.decay_products: dict[str, Counter[str]] = {}
+        frontier: list[str] = list(self.initial_counts)
+        while frontier:
+            element = frontier.pop()
+            if element in self.decay_products:
+                continue
+            if len(self.decay_products) >= MAX_ELEMENTS:
+                raise ValueError(f"Seed decays into more than {MAX_ELEMENTS} distinct elements")
+            self.decay_products[element] = Counter(split_into_elements(look_and_say(element)))
+            frontier.extend(product for product in self.decay_products[element] if product not in self.decay_products)
+
+        self.elements: list[str] = sorted(self.decay_products, key=lambda element: (len(element), element))
+
+    def element_counts(self, n: int) -> Counter[str]:
+        """Return the number of occurrences of each element after n >= 2 iterations of the look-and-say process"""
+        counts = self.initial_counts
+        for _ in range(n - 2):
+            new_counts: Counter[str] = Counter()
+            for element, count in counts.items():
+                for product, multiplicity in self.decay_products[element].items():
+                    new_counts[product] += count * multiplicity
+            counts = new_counts
+        return counts
+
+    def transition_matrix(self) -> list[list[int]]:
+        """Return the matrix whose (i, j) entry is the number of occurrences of element i in the decay of element j"""
+        index: dict[str, int] = {element: i for i, element in enumerate(self.elements)}
+        matrix = [[0] * len(self.elements) for _ in self.elements]
+        for j, element in enumerate(self.elements):
+            for product, multiplicity in self.decay_products[element].items():
+                matrix[index[product]][j] = multiplicity
+        return matrix
+
+    def length(self, n: int, modulus: int | None=None) -> int:
+        """Return the length of the string after n >= 2 iterations of the look-and-say process, optionally modulo `modulus`.
+
+        The length is the product of the row vector of element lengths, the transition matrix to the power n - 2,
+        and the column vector of initial element counts.
+        Exact lengths grow exponentially, so the entries of matrix powers are far larger integers than the element
+        counts, and it is faster to advance the counts one iteration at a time. Modulo some number, the entries stay
+        small, so the row vector is multiplied by the matrix power using exponentiation by squaring in O(log n) products,
+        which makes even n = 10**18 iterations feasible.
+        """
+        if modulus is None:
+            return sum(len(element) * count for element, count in self.element_counts(n).items())
+
+        weights: list[int] = [len(element) % modulus for element in self.elements]
+        power: list[list[int]] = self.transition_matrix()
+        exponent = n - 2
+        while exponent:
+            if exponent & 1:
+                weights = [sum(w * m for w, m in zip(weights, column)) % modulus for column in zip(*power)]
+            exponent >>= 1
+            if exponent:
+                power = _matrix_product(power, power, modulus)
+        return sum(weight * self.initial_counts[element] for weight, element in zip(weights, self.elements)) % modulus
+
+
+def _matrix_product(a: list[list[int]], b: list[list[int]], modulus: int) -> list[list[int]]:
+    """Multiply two square matrices of integers modulo some number, skipping zero entries of the left matrix"""
+    product: list[list[int]] = []
+    for row in a:
+        new_row = [0] * len(b[0])
+        for k, a_ik in enumerate(row):
+            if a_ik:
+                for j, b_kj in enumerate(b[k]):
+                    new_row[j] += a_ik * b_kj
+        product.append([entry % modulus for entry in new_row])
+    return product
+
+
+def look_and_say_length(seed: str, n: int, modulus: int | None=None) -> int:
+    """Return the length of the result of applying the look-and-say process n times to the seed (optionally modulo some number),
+    using audioactive decay of elements when possible, otherwise falling back to direct simulation
+    """
+    if n >= 3:
+        try:
+            return AudioactiveDecay(seed).length(n, modulus)
+        except ValueError:
+            pass
+    digits = seed
+    for _ in range(n):
+        digits = look_and_say(digits)
+    return len(digits) if modulus is None else len(digits) % modulus
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+"""Testing functions for 2015 Day 10
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://docs.python.org/3/library/io.html#io.StringIO
+"""
+import io
+import itertools
+import random
+import pytest
+import sol
+from sol import (
+    look_and_say,
+    iterate_look_and_say,
+    write_look_and_say,
+    splits,
+    split_into_elements,
+    AudioactiveDecay,
+    look_and_say_length
+)
+
+
+def look_and_say_by_repetition(seed: str, n: int) -> str:
+    digits = seed
+    for _ in range(n):
+        digits = look_and_say(digits)
+    return digits
+
+
+@pytest.mark.parametrize("seed", ["1", "11", "1211", "3113322113", "2222", "1113222113"])
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 12])
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_iterate_look_and_say(seed: str, n: int, chunk_size: int):
+    """Small chunks make the runs of each stage straddle the chunks passed between stages"""
+    assert "".join(iterate_look_and_say(seed, n, chunk_size)) == look_and_say_by_repetition(seed, n)
+
+
+@pytest.mark.parametrize("seed", ["1", "1113222113"])
+@pytest.mark.parametrize("n", [0, 1, 6, 20])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_write_look_and_say(seed: str, n: int, chunk_size: int):
+    file = io.StringIO()
+    expected = look_and_say_by_repetition(seed, n)
+    assert write_look_and_say(seed, n, file, chunk_size) == len(expected)
+    assert file.getvalue() == expected
+
+
+def test_iterate_look_and_say_many_stages():
+    """Stream far more stages than nested generators allow under the default recursion limit, consuming only the head.
+    The heads of the sequence starting at 1 settle into a cycle of three, so the head after 1100 steps matches that after 38
+    """
+    head = "".join(itertools.islice(iterate_look_and_say("1", 1100), 30))
+    assert head == look_and_say_by_repetition("1", 38)[:30]
+
+
+@pytest.mark.parametrize(
+    "seed,n,expected",
+    [
+        ("1", 40, 82350),
+        ("1", 50, 1166642),
+        ("1113222113", 40, 252594),
+        ("1113222113", 50, 3579328),
+    ]
+)
+def test_look_and_say_length_puzzle(seed: str, n: int, expected: int):
+    assert look_and_say_length(seed, n) == expected
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_look_and_say_length_matches_direct_simulation(seed: int):
+    rng = random.Random(seed)
+    digits = "".join(rng.choice("1112223") for _ in range(rng.randint(1, 12)))
+    for n in range(20):
+        expected = len(look_and_say_by_repetition(digits, n))
+        assert look_and_say_length(digits, n) == expected
+        assert look_and_say_length(digits, n, modulus=1009) == expected % 1009
+
+
+@pytest.mark.parametrize("modulus", [2, 97, 10**9 + 7])
+def test_audioactive_decay_length_modulus(modulus: int):
+    """Exponentiation by squaring agrees with advancing the exact element counts, for both even and odd exponents"""
+    decay = AudioactiveDecay("1113222113")
+    for n in [2, 3, 10, 41, 64, 100]:
+        assert decay.length(n, modulus) == decay.length(n) % modulus
+
+
+def test_look_and_say_length_non_splittable_seed():
+    """A seed which never splits is a single element, such as 22, which is its own look-and-say description"""
+    assert split_into_elements("22") == ["22"]
+    assert look_and_say_length("22", 50) == 2
+    assert look_and_say_length("22", 10**18, modulus=1000) == 2
+
+
+def test_look_and_say_length_fallback(monkeypatch: pytest.MonkeyPatch):
+    """With too many distinct elements to build the transition matrix, the lengths are found by direct simulation"""
+    monkeypatch.setattr(sol, "MAX_ELEMENTS", 2)
+    with pytest.raises(ValueError):
+        AudioactiveDecay("1113222113")
+    for n in [3, 12]:
+        expected = len(look_and_say_by_repetition("1113222113", n))
+        assert look_and_say_length("1113222113", n) == expected
+        assert look_and_say_length("1113222113", n, modulus=7) == expected % 7
+
+
+def splits_by_simulation(left: str, right: str, steps: int) -> bool:
+    """Check that the look-and-say process applied to the concatenation is the concatenation of the results at every step"""
+    for _ in range(steps):
+        left, right, both = look_and_say(left), look_and_say(right), look_and_say(left + right)
+        if both != left + right:
+            return False
+    return True
+
+
+@pytest.mark.parametrize(
+    "left,right,expected",
+    [
+        ("1", "1", False),
+        ("2", "1", False),
+        ("2", "3", True),
+        ("22", "22", False),
+        ("12", "3", True),
+        ("3", "13", False),
+    ]
+)
+def test_splits_examples(left: str, right: str, expected: bool):
+    assert splits(left, right) == expected
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_splits_matches_simulation(seed: int):
+    rng = random.Random(seed)
+    for _ in range(10):
+        left = "".join(rng.choice("123") for _ in range(rng.randint(1, 4)))
+        right = "".join(rng.choice("123") for _ in range(rng.randint(1, 4)))
+        assert splits(left, right) == splits_by_simulation(left, right, sol.SPLIT_HORIZON + 1)
+
+
+@pytest.mark.parametrize("digits", ["1113222113", "311311222113111231133211121312", "3113322113"])
+def test_split_into_elements(digits: str):
+    elements = split_into_elements(digits)
+    assert "".join(elements) == digits
+    assert all(splits(a, b) for a, b in zip(elements, elements[1:]))
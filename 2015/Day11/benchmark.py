@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+--- Day 11: Corporate Policy ---
+Benchmark comparing the search for the next few valid passwords by incrementing a candidate password repeatedly
+until it is valid, against constructing each valid password directly from the longest prefix that can be kept.
+
+Uses the puzzle input if present, otherwise the example password 'ghijklmn'.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+import os
+import itertools
+from collections.abc import Callable, Iterator
+from time import perf_counter
+
+from sol import DIRPATH, find_next_valid_password, generate_valid_passwords
+
+
+def generate_valid_passwords_by_increment(s: str) -> Iterator[str]:
+    """Yield the valid passwords following the input string in order, using `find_next_valid_password`"""
+    candidate = s
+    while True:
+        candidate = find_next_valid_password(candidate)
+        yield candidate
+
+
+def main(n_passwords: int=10):
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            password = file.read().strip()
+    else:
+        print("No puzzle input found, so using the example password instead")
+        password = "ghijklmn"
+
+    implementations: dict[str, Callable[[str], Iterator[str]]] = {
+        "Increment until valid": generate_valid_passwords_by_increment,
+        "Constructive skip-ahead": generate_valid_passwords,
+    }
+
+    results: dict[str, tuple[str, ...]] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = tuple(itertools.islice(implementation(password), n_passwords))
+        t_stop = perf_counter()
+        print(f"{name}: {results[name][-1]} is the valid password {n_passwords} after {password}, "
+              f"found in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,10 @@ Possible themes:
 
 Main Functions
 - main: Calculate and print the puzzle answers
-  - find_next_valid_password: Find a new password by incrementing an old password string repeatedly until it is valid
+  - generate_valid_passwords: Yield the valid passwords following an old password in order, constructing each one directly
+    - next_valid_password: Find the next valid password by keeping the longest possible prefix and completing it with the smallest valid suffix
+      - can_complete_password: Determine whether a partial password can be completed into a valid password within a number of letters
+- find_next_valid_password: Find a new password by incrementing an old password string repeatedly until it is valid
     - next_password_candidate: Increment to next candidate in order or skip past forbidden letters if present to reduce the number of iterations
       - increment_password: Increment a string of lowercase ASCII letters in lexicographic order, maintaining a fixed string length and cycling from highest to lowest
     - is_valid_password: Determine whether the given string meets the applicable password policy requirements
@@ -30,13 +33,20 @@ References
 - https://docs.python.org/3/library/functions.html
 - https://www.joelonsoftware.com/2003/10/08/the-absolute-minimum-every-software-developer-absolutely-positively-must-know-about-unicode-and-character-sets-no-excuses/
 - https://mathspp.com/blog/base-conversion-in-python
+- https://docs.python.org/3/library/functools.html#functools.cache
 """
+from __future__ import annotations
 import os
+from collections.abc import Iterator
+from dataclasses import dataclass
 import enum
+import functools
+import itertools
 
 DIRPATH = os.path.dirname(__file__)
 
 FORBIDDEN_LETTERS: str = "iol"
+ALLOWED_LETTERS: str = "".join(c for c in "abcdefghijklmnopqrstuvwxyz" if c not in FORBIDDEN_LETTERS)
 
 
 def main():
@@ -44,13 +54,94 @@ def main():
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
         puzzle_input = file.read()
 
-    next_pass = find_next_valid_password(puzzle_input)
-    next_next_pass = find_next_valid_password(next_pass)
+    next_pass, next_next_pass = itertools.islice(generate_valid_passwords(puzzle_input), 2)
     print(f"The next two valid passwords after the initial string are {next_pass} and {next_next_pass}")
     n0, n1, n2 = map(from_base26_repr, (puzzle_input, next_pass, next_next_pass))
     print(f"The number of increments required for each part was {n1 - n0} and {n2 - n1}, respectively.")
 
 
+def generate_valid_passwords(s: str) -> Iterator[str]:
+    """Yield the valid passwords following the input string in order, cycling from highest to lowest"""
+    candidate = s
+    while True:
+        candidate = next_valid_password(candidate)
+        yield candidate
+
+
+def next_valid_password(s: str) -> str:
+    """Find the next valid password after the input string in the order of `increment_password`, without iterating over
+    the invalid passwords in between, which gives the same result as `find_next_valid_password`.
+
+    The next valid password keeps the longest possible prefix of the input string, followed by a greater letter,
+    followed by the smallest suffix which makes the password valid. Prefixes containing a forbidden letter are skipped,
+    as are letters after which no suffix of the remaining length can satisfy the straight and pairs requirements.
+    If there is no greater valid password of the same length, the order cycles around to the smallest valid password.
+    """
+    forbidden_idx = next((idx for idx, c in enumerate(s) if c in FORBIDDEN_LETTERS), len(s))
+    # The states after each prefix of the input string, up to the first forbidden letter
+    prefix_states: list[PasswordState] = [PasswordState()]
+    for c in s[:forbidden_idx]:
+        prefix_states.append(prefix_states[-1].append(c))
+
+    # Try changing letters from the rightmost, but no further right than the first forbidden letter
+    for idx in range(min(forbidden_idx, len(s) - 1), -1, -1):
+        remaining = len(s) - idx - 1
+        for c in ALLOWED_LETTERS:
+            if c > s[idx] and can_complete_password(state := prefix_states[idx].append(c), remaining):
+                return s[:idx] + c + _smallest_completion(state, remaining)
+
+    # Cycle around from the highest string of this length to the lowest
+    if not can_complete_password(PasswordState(), len(s)):
+        raise ValueError(f"There are no valid passwords of length {len(s)}")
+    return _smallest_completion(PasswordState(), len(s))
+
+
+@dataclass(frozen=True)
+class PasswordState:
+    """Summary of a partial password, sufficient to decide whether it can be completed into a valid password.
+    The length of the current increasing straight is capped at 3, as is the number of distinct repeated letter pairs at 2.
+    """
+    last_letter: str = ""
+    current_straight: int = 0
+    has_straight: bool = False
+    # Letters of the distinct repeated letter pairs found so far, with any beyond the second omitted
+    pair_letters: frozenset[str] = frozenset()
+
+    def append(self, c: str) -> PasswordState:
+        """Return the state of the partial password after appending a letter"""
+        current_straight = min(self.current_straight + 1, 3) if self.last_letter and ord(c) - ord(self.last_letter) == 1 else 1
+        pair_letters = self.pair_letters
+        if c == self.last_letter and len(pair_letters) < 2:
+            pair_letters = pair_letters | {c}
+        return PasswordState(c, current_straight, self.has_straight or current_straight >= 3, pair_letters)
+
+    @property
+    def is_valid(self) -> bool:
+        return self.has_straight and len(self.pair_letters) >= 2
+
+
+@functools.cache
+def can_complete_password(state: PasswordState, remaining: int) -> bool:
+    """Determine whether a partial password can be completed into a valid password by appending
+    exactly `remaining` allowed letters. Cached, since there are few distinct states for each number of remaining letters.
+    """
+    if remaining == 0:
+        return state.is_valid
+    return any(can_complete_password(state.append(c), remaining - 1) for c in ALLOWED_LETTERS)
+
+
+def _smallest_completion(state: PasswordState, remaining: int) -> str:
+    """Return the smallest suffix of `remaining` letters which completes a partial password into a valid password,
+    assuming that one exists, by choosing the smallest letter from which the password can still be completed at each step
+    """
+    suffix: str = ""
+    for n in range(remaining - 1, -1, -1):
+        c = next(c for c in ALLOWED_LETTERS if can_complete_password(state.append(c), n))
+        suffix += c
+        state = state.append(c)
+    return suffix
+
+
 def find_next_valid_password(s: str) -> str:
     """Find a new password by incrementing an old password string repeatedly until it is valid
     Apply a shortcut to skip past forbidden letters to reduce the number of iterations
@@ -89,6 +180,9 @@ def is_valid_password(s: str) -> str:
     Note that the requirement that the repeated letter pairs consist of different (repeated) letters implies that they would be non-overlapping.
     """
     forbidden_letter_set = set(FORBIDDEN_LETTERS)
+    # The loop below only checks the first letter of each adjacent pair for forbidden letters
+    if s[-1:] in forbidden_letter_set:
+        return False
     repeated_letters = set()
     longest_straight, current_straight = 1, 1
     for c1, c2 in zip(s, s[1:]):
@@ -0,0 +1,60 @@
+"""Testing functions for 2015 Day 11
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import itertools
+import random
+import pytest
+from sol import (
+    generate_valid_passwords,
+    next_valid_password,
+    find_next_valid_password,
+    is_valid_password
+)
+
+
+@pytest.mark.parametrize(
+    "password,expected",
+    [
+        ("hijklmmn", False),
+        ("abbceffg", False),
+        ("abbcegjk", False),
+        ("abcdffaa", True),
+        ("ghjaabcc", True),
+        # Forbidden letters are rejected in every position, including the last
+        ("ccmmno", False),
+        ("ccmmnp", False),
+        ("aabccl", False),
+    ]
+)
+def test_is_valid_password(password: str, expected: bool):
+    assert is_valid_password(password) == expected
+
+
+@pytest.mark.parametrize(
+    "password,expected",
+    [
+        ("abcdefgh", "abcdffaa"),
+        ("ghijklmn", "ghjaabcc"),
+        # The increment after 'ccmmnn' is 'ccmmno', which is invalid as it ends in a forbidden letter
+        ("ccmmnn", "ccppqr"),
+    ]
+)
+def test_next_valid_password(password: str, expected: str):
+    assert next_valid_password(password) == expected
+    assert find_next_valid_password(password) == expected
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_next_valid_password_matches_incrementing(seed: int):
+    rng = random.Random(seed)
+    password = "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=6))
+    assert next_valid_password(password) == find_next_valid_password(password)
+
+
+@pytest.mark.parametrize("password", ["aabcbb", "xxyzzz", "zzzzzz"])
+def test_generate_valid_passwords(password: str):
+    """Successive passwords, including cycling around from the highest to the lowest, match incrementing"""
+    expected = list(itertools.islice(itertools.accumulate(itertools.repeat(None), lambda s, _: find_next_valid_password(s), initial=password), 1, 6))
+    assert list(itertools.islice(generate_valid_passwords(password), 5)) == expected
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+--- Day 12: JSAbacusFramework.io ---
+Benchmark comparing loading the whole JSON document with `json.load` and collecting its numbers recursively
+against summing the numbers while streaming the document in chunks, by time taken and peak memory allocated.
+
+Uses the puzzle input if present, otherwise a randomly generated document like the puzzle input.
+Also writes a much larger randomly generated document to a temporary file and streams it.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/tracemalloc.html
+- https://docs.python.org/3/library/tempfile.html
+- https://docs.python.org/3/library/random.html
+"""
+import json
+import os
+import random
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from time import perf_counter
+from typing import TextIO
+
+from sol import (
+    DIRPATH,
+    find_all_numbers,
+    sum_numbers_streaming
+)
+
+COLOURS = ["red", "green", "blue", "orange", "violet", "yellow"]
+
+
+def generate_document(n_values: int=30_000, max_depth: int=6, seed: int=2015) -> str:
+    """Generate a random JSON document of nested arrays and objects of numbers and colours, like the puzzle input"""
+    rng = random.Random(seed)
+    remaining = n_values
+
+    def generate_value(depth: int) -> int | str | list | dict:
+        nonlocal remaining
+        remaining -= 1
+        if depth == max_depth or rng.random() < 0.6 or remaining <= 0:
+            return rng.choice([rng.randint(-50, 200), rng.choice(COLOURS)])
+        size = rng.randint(1, 8)
+        if rng.random() < 0.5:
+            return [generate_value(depth + 1) for _ in range(size)]
+        return {rng.choice("abcdefghij") + str(k): generate_value(depth + 1) for k in range(size)}
+
+    values = []
+    while remaining > 0:
+        values.append(generate_value(1))
+    return json.dumps(values)
+
+
+def sum_numbers_by_loading(file: TextIO) -> tuple[int, int]:
+    """Reference implementation which loads the whole document before collecting its numbers recursively"""
+    account = json.load(file)
+    return sum(find_all_numbers(account, [], exclude_red=False)), sum(find_all_numbers(account, [], exclude_red=True))
+
+
+def main(n_values_large: int=1_000_000):
+    input_path = os.path.join(DIRPATH, "input.txt")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if not os.path.exists(input_path):
+            print("No puzzle input found, so using a randomly generated document instead")
+            input_path = os.path.join(temp_dir, "input.txt")
+            with open(input_path, 'w') as file:
+                file.write(generate_document())
+
+        implementations: dict[str, Callable[[TextIO], tuple[int, int]]] = {
+            "Load and recurse": sum_numbers_by_loading,
+            "Streaming": sum_numbers_streaming,
+        }
+
+        large_path = os.path.join(temp_dir, "large.json")
+        with open(large_path, 'w') as file:
+            file.write(generate_document(n_values_large))
+
+        for path in (input_path, large_path):
+            print(f"Document of {os.path.getsize(path) / 2 ** 20:.1f} MiB")
+            results: dict[str, tuple[int, int]] = {}
+            for name, implementation in implementations.items():
+                tracemalloc.start()
+                t_start = perf_counter()
+                with open(path, 'r') as file:
+                    results[name] = implementation(file)
+                t_stop = perf_counter()
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                print(f"{name}: {results[name]} in {(t_stop - t_start) * 1000:.1f} milliseconds "
+                      f"with a peak of {peak_memory / 2 ** 20:.2f} MiB allocated")
+            assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
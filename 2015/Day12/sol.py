@@ -4,7 +4,17 @@
 https://adventofcode.com/2015/day/12
 Themes: JSON, recursion
 
+Loading the whole document with `json.load` keeps the full parse tree in memory, which does not scale to very large
+documents. Instead, the document can be read in chunks and split into tokens with a regular expression, keeping only a
+stack with one entry per open container (array or object) holding running sums of the numbers found inside it, both
+with and without the objects containing "red". When a container closes, its sums are added to those of its parent,
+except that an object with a property with value "red" adds nothing to the parent's sum excluding red.
+Both parts are answered in one pass, with memory bounded by the nesting depth rather than the size of the document.
+
 References
+- https://www.json.org/json-en.html
+- https://docs.python.org/3/library/re.html
+- https://docs.python.org/3/library/dataclasses.html
 - http://inspiredpython.com/course/pattern-matching/mastering-structural-pattern-matching
 - https://docs.python.org/3/tutorial/controlflow.html#match-statements
 - [PEP 636 – Structural Pattern Matching: Tutorial](https://peps.python.org/pep-0636/)
@@ -12,17 +22,105 @@ References
 """
 import os
 import json
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import TextIO
 
 DIRPATH = os.path.dirname(__file__)
 
+# A JSON token, preceded by any whitespace, with named groups for numbers, strings, punctuation and literals
+TOKEN_PATTERN = re.compile(
+    r'\s*(?:(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)|(?P<string>"(?:[^"\\]|\\.)*")|(?P<punctuation>[{}\[\]:,])|(?P<literal>true|false|null))'
+)
+WHITESPACE_PATTERN = re.compile(r"\s*")
+# Characters which end any number or literal token
+SEPARATORS: str = " \t\n\r{}[]:,"
+CHUNK_SIZE: int = 1 << 16
+
 
 def main():
-    # Load input file
+    # Stream the input file
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
-        account = json.load(file)
+        total, total_excluding_red = sum_numbers_streaming(file)
+
+    print(f"Part 1: The sum of all numbers in the document is {total}")
+    print(f"Part 2: Excluding objects with any property with value 'red', the sum of all numbers in the document is {total_excluding_red}")
+
+
+def generate_tokens(file: TextIO, chunk_size: int=CHUNK_SIZE) -> Iterator[tuple[str, str]]:
+    """Yield the kind and text of each token of a JSON document, reading the file in chunks of `chunk_size` characters.
+    Only tokens which cannot be continued by the next chunk are yielded before it is read, namely those ending before
+    the last whitespace or punctuation in the buffer, as numbers and literals cannot contain either,
+    so at most one chunk and one token are held in memory at a time.
+    Raises ValueError on any text which is not a JSON token.
+    """
+    buffer = ""
+    at_end = False
+    while not at_end:
+        chunk = file.read(chunk_size)
+        at_end = not chunk
+        buffer += chunk
+        limit = len(buffer) if at_end else max(buffer.rfind(c) for c in SEPARATORS)
+        pos = 0
+        for m in TOKEN_PATTERN.finditer(buffer, 0, limit):
+            # Stop at the first text which is not a token, such as the start of a string continuing in the next chunk
+            if m.start() != pos:
+                break
+            yield m.lastgroup, m.group(m.lastgroup)
+            pos = m.end()
+        buffer = buffer[pos:]
+    if WHITESPACE_PATTERN.fullmatch(buffer) is None:
+        raise ValueError(f"Invalid JSON at {buffer[:20]!r}")
 
-    print(f"Part 1: The sum of all numbers in the document is {sum(find_all_numbers(account, [], exclude_red=False))}")
-    print(f"Part 2: Excluding objects with any property with value 'red', the sum of all numbers in the document is {sum(find_all_numbers(account, [], exclude_red=True))}")
+
+@dataclass(slots=True)
+class ContainerSums:
+    """Running sums of the integers inside an open container of a JSON document, with and without any objects
+    which have a property with value "red"
+    """
+    is_object: bool
+    total: int = 0
+    total_excluding_red: int = 0
+    is_red: bool = False
+
+
+def sum_numbers_streaming(file: TextIO, chunk_size: int=CHUNK_SIZE) -> tuple[int, int]:
+    """Return the sum of all integers in a JSON document, and the sum excluding any object (and all of its children)
+    which has any property with the value "red", reading the file in chunks as a stream of tokens.
+    As with `find_all_numbers`, numbers which are not integers are ignored. Unlike `find_all_numbers`, where the
+    `case int()` pattern also matches booleans and so counts true and false as 1 and 0, the literals are ignored too.
+    Raises ValueError if the brackets of the document do not match.
+    """
+    # The bottom of the stack holds the sums for the whole document
+    stack: list[ContainerSums] = [ContainerSums(is_object=False)]
+    top = stack[-1]
+    # Whether the previous token was a colon, so that a string is a property value rather than a key
+    expecting_value = False
+    for kind, text in generate_tokens(file, chunk_size):
+        match kind:
+            case "number":
+                if text.lstrip('-').isdigit():
+                    top.total += int(text)
+                    top.total_excluding_red += int(text)
+            case "string":
+                if expecting_value and top.is_object and (text == '"red"' or ('\\' in text and json.loads(text) == "red")):
+                    top.is_red = True
+            case "punctuation" if text in "{[":
+                top = ContainerSums(is_object=text == '{')
+                stack.append(top)
+            case "punctuation" if text in "}]":
+                if len(stack) == 1 or top.is_object != (text == '}'):
+                    raise ValueError(f"Unmatched {text!r} in JSON document")
+                stack.pop()
+                stack[-1].total += top.total
+                if not top.is_red:
+                    stack[-1].total_excluding_red += top.total_excluding_red
+                top = stack[-1]
+        expecting_value = text == ':'
+    if len(stack) > 1:
+        raise ValueError("Unclosed container at the end of the JSON document")
+    return top.total, top.total_excluding_red
 
 
 def find_all_numbers(data: int | list | dict, num_cache: list[int], *, exclude_red: bool) -> list[int]:
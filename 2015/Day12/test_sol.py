@@ -0,0 +1,107 @@
+"""Testing functions for 2015 Day 12
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://docs.python.org/3/library/io.html#io.StringIO
+- https://docs.python.org/3/library/json.html
+"""
+import io
+import json
+import random
+import pytest
+from sol import (
+    generate_tokens,
+    sum_numbers_streaming,
+    find_all_numbers
+)
+
+# Strings which contain separators, quotes, escapes and near misses of "red"
+TRICKY_STRINGS: list[str] = [
+    "red", '"red"', "Red", "redd", "a, b]", "{[:,]}", " 12 ", "-3", "\\", "réd", "\\\"red\\\"", "true",
+]
+
+
+def sums_by_parsing(document: str) -> tuple[int, int]:
+    data = json.loads(document)
+    return sum(find_all_numbers(data, [], exclude_red=False)), sum(find_all_numbers(data, [], exclude_red=True))
+
+
+def random_value(rng: random.Random, depth: int=0):
+    """Generate a random JSON value without booleans, which `find_all_numbers` counts as integers"""
+    match rng.choice(["number", "string", "array", "object"] if depth < 4 else ["number", "string"]):
+        case "number":
+            return rng.choice([rng.randint(-1000, 1000), rng.randint(-9, 9), round(rng.uniform(-50, 50), 2), None])
+        case "string":
+            return rng.choice(TRICKY_STRINGS)
+        case "array":
+            return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+        case "object":
+            return {rng.choice(TRICKY_STRINGS + ["a", "b", "c"]): random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))}
+
+
+@pytest.mark.parametrize(
+    "document,expected",
+    [
+        ('[1,2,3]', (6, 6)),
+        ('{"a":2,"b":4}', (6, 6)),
+        ('[[[3]]]', (3, 3)),
+        ('{"a":{"b":4},"c":-1}', (3, 3)),
+        ('{"a":[-1,1]}', (0, 0)),
+        ('[-1,{"a":1}]', (0, 0)),
+        ('[]', (0, 0)),
+        ('{}', (0, 0)),
+        ('[1,{"c":"red","b":2},3]', (6, 4)),
+        ('{"d":"red","e":[1,2,3,4],"f":5}', (15, 0)),
+        ('[1,"red",5]', (6, 6)),
+    ]
+)
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_sum_numbers_streaming_examples(document: str, expected: tuple[int, int], chunk_size: int):
+    assert sum_numbers_streaming(io.StringIO(document), chunk_size) == expected == sums_by_parsing(document)
+
+
+@pytest.mark.parametrize(
+    "document,expected",
+    [
+        # "red" as a key, or inside an array within an object, does not exclude the object
+        ('{"red":1,"a":[2,"red"]}', (3, 3)),
+        # An escaped "red" is still the value red, whereas a value containing escaped quotes is not
+        ('[{"a":"r\\u0065d","b":1},2]', (3, 2)),
+        ('[{"a":"\\"red\\"","b":1},2]', (3, 3)),
+        # Separators inside strings, which may be split across chunks, are not punctuation
+        ('{"a, b]":"{[:,]}","c":[" 12 ", 7, "-3"]}', (7, 7)),
+        # Numbers which are not integers are ignored
+        ('[1.5, 2, -3e2, 4E+1, 5]', (7, 7)),
+    ]
+)
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_sum_numbers_streaming_strings(document: str, expected: tuple[int, int], chunk_size: int):
+    assert sum_numbers_streaming(io.StringIO(document), chunk_size) == expected == sums_by_parsing(document)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 8])
+def test_sum_numbers_streaming_ignores_booleans(chunk_size: int):
+    """The literals true and false are ignored, whereas `find_all_numbers` counts them as 1 and 0"""
+    document = '[true, false, null, {"a": true, "b": "red"}, 2]'
+    assert sum_numbers_streaming(io.StringIO(document), chunk_size) == (2, 2)
+    assert sums_by_parsing(document) == (4, 3)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sum_numbers_streaming_random_documents(seed: int):
+    """Random documents, dumped both compactly and with indentation, read in chunks of every size up to 8"""
+    rng = random.Random(seed)
+    data = [random_value(rng) for _ in range(5)]
+    for document in [json.dumps(data), json.dumps(data, separators=(",", ":")), json.dumps(data, indent=2)]:
+        expected = sums_by_parsing(document)
+        whole_tokens = list(generate_tokens(io.StringIO(document), len(document) + 1))
+        for chunk_size in range(1, 9):
+            assert list(generate_tokens(io.StringIO(document), chunk_size)) == whole_tokens
+            assert sum_numbers_streaming(io.StringIO(document), chunk_size) == expected
+
+
+@pytest.mark.parametrize("document", ['[1,2', '[1,2}}', '{"a":1]', ']', '[1, @]', '["unterminated'])
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_sum_numbers_streaming_invalid(document: str, chunk_size: int):
+    with pytest.raises(ValueError):
+        sum_numbers_streaming(io.StringIO(document), chunk_size)
@@ -6,34 +6,38 @@ https://adventofcode.com/2015/day/13
 Functions
 - main: Read the puzzle inputs, then calculate and print the puzzle answers
 - read_input_data: Read an input file of the payoffs (in happiness units), positive or negative, that a person would receive by sitting next to a particular other person
+- optimal_seating_arrangement: Find a circular seating arrangement with the greatest overall payoff, as a maximum weight Hamiltonian cycle
 - calculate_seating_arrangement_payoff: Calculate the overall payoff for a given circular seating arrangement
 - generate_all_circular_seating_arrangements: Generate all possible unique arrangments of the input elements into a circle
+
+The last two functions check every arrangement by brute force, and are kept as a reference for testing the optimum.
+
+References
+- https://en.wikipedia.org/wiki/Held%E2%80%93Karp_algorithm
 """
 import os
+import sys
 from collections.abc import Iterator
 import itertools
 
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
+
+from common.hamiltonian import hamiltonian_cycle
 
 
 def main():
     """Read the puzzle inputs, then calculate and print the puzzle answers"""
     guests, payoffs = read_input_data()
-    optimal_seating_arrangement_payoff = max(
-        calculate_seating_arrangement_payoff(arrangement, payoffs)
-        for arrangement in generate_all_circular_seating_arrangements(guests)
-    )
+    optimal_seating_arrangement_payoff, _ = optimal_seating_arrangement(payoffs)
     print(f"Part 1: The optimal seating arrangement yields {optimal_seating_arrangement_payoff} happiness units")
 
     # Part 2: Update the payoffs dictionary and set of attendees
     host = "You"
     for guest in guests:
         payoffs[(host, guest)] = payoffs[(guest, host)] = 0
-    optimal_seating_arrangement_payoff_inc_host = max(
-        calculate_seating_arrangement_payoff(arrangement, payoffs)
-        for arrangement in generate_all_circular_seating_arrangements({host} | guests)
-    )
+    optimal_seating_arrangement_payoff_inc_host, _ = optimal_seating_arrangement(payoffs)
     print(f"Part 2: Including yourself as the host, the optimal seating arrangement yields {optimal_seating_arrangement_payoff_inc_host} happiness units")
 
 
@@ -54,6 +58,15 @@ def read_input_data() -> tuple[set[str], dict[tuple[str, str], int]]:
     return people, payoffs
 
 
+def optimal_seating_arrangement(payoffs: dict[tuple[str, str], int]) -> tuple[int, list[str]]:
+    """Find a circular seating arrangement with the greatest overall payoff, along with that payoff.
+    Each pair of adjacent people contributes the payoffs in both directions, so this is a maximum weight
+    Hamiltonian cycle on the graph whose edge weights are those sums, found by the Held-Karp algorithm
+    """
+    weights = {(p1, p2): payoff + payoffs[(p2, p1)] for (p1, p2), payoff in payoffs.items()}
+    return hamiltonian_cycle(weights, maximise=True)
+
+
 def calculate_seating_arrangement_payoff(arrangement: list[str], payoffs: dict[tuple[str, str], int]) -> int:
     """Calculate the overall payoff for a given circular seating arrangement
     Accounts for payoffs in both directions and at the ends of the list representing the circle
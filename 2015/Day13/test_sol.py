@@ -0,0 +1,55 @@
+"""Testing functions for 2015 Day 13
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import random
+import pytest
+from sol import (
+    optimal_seating_arrangement,
+    calculate_seating_arrangement_payoff,
+    generate_all_circular_seating_arrangements
+)
+
+EXAMPLE_PAYOFFS: dict[tuple[str, str], int] = {
+    ("Alice", "Bob"): 54, ("Alice", "Carol"): -79, ("Alice", "David"): -2,
+    ("Bob", "Alice"): 83, ("Bob", "Carol"): -7, ("Bob", "David"): -63,
+    ("Carol", "Alice"): -62, ("Carol", "Bob"): 60, ("Carol", "David"): 55,
+    ("David", "Alice"): 46, ("David", "Bob"): -7, ("David", "Carol"): 41,
+}
+
+
+def best_payoff_by_brute_force(people: set[str], payoffs: dict[tuple[str, str], int]) -> int:
+    return max(
+        calculate_seating_arrangement_payoff(arrangement, payoffs)
+        for arrangement in generate_all_circular_seating_arrangements(people)
+    )
+
+
+def test_generate_all_circular_seating_arrangements():
+    """Arrangements which differ by a rotation are only generated once"""
+    arrangements = list(generate_all_circular_seating_arrangements({"A", "B", "C", "D"}))
+    assert len(arrangements) == len(set(arrangements)) == 6
+    assert len({arrangement[0] for arrangement in arrangements}) == 1
+
+
+def test_example():
+    payoff, arrangement = optimal_seating_arrangement(EXAMPLE_PAYOFFS)
+    assert payoff == 330 == best_payoff_by_brute_force({"Alice", "Bob", "Carol", "David"}, EXAMPLE_PAYOFFS)
+    assert calculate_seating_arrangement_payoff(arrangement, EXAMPLE_PAYOFFS) == 330
+
+
+@pytest.mark.parametrize("num_people", [2, 3, 5, 7])
+@pytest.mark.parametrize("seed", range(5))
+def test_optimal_seating_arrangement_matches_brute_force(num_people: int, seed: int):
+    """Random payoffs, with and without a host who is indifferent to every guest, as in part 2"""
+    rng = random.Random(seed)
+    guests = {f"Guest {k}" for k in range(num_people)}
+    payoffs = {(p1, p2): rng.randint(-100, 100) for p1 in guests for p2 in guests if p1 != p2}
+    for people in [guests, guests | {"You"}]:
+        if "You" in people:
+            for guest in guests:
+                payoffs[("You", guest)] = payoffs[(guest, "You")] = 0
+        payoff, arrangement = optimal_seating_arrangement(payoffs)
+        assert sorted(arrangement) == sorted(people)
+        assert payoff == calculate_seating_arrangement_payoff(arrangement, payoffs) == best_payoff_by_brute_force(people, payoffs)
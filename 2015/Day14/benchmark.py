@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+--- Day 14: Reindeer Olympics ---
+Benchmark comparing the points awarded by checking the leaders at every second of the race
+against the event driven simulation which awards points over whole intervals in which the leaders are unchanged.
+
+Uses the puzzle input if present, otherwise randomly generated reindeer.
+Also runs the event driven simulation for races of a billion seconds between thousands of reindeer,
+including a group of reindeer with the same average speed, which take turns in the lead forever.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    Reindeer,
+    read_input_data,
+    race_points,
+    race_points_by_second
+)
+
+
+def generate_reindeer(n_reindeer: int=9, seed: int=2015) -> dict[str, Reindeer]:
+    """Generate random reindeer racing characteristics, like the puzzle input"""
+    rng = random.Random(seed)
+    return {f"Reindeer{k}": Reindeer(rng.randint(2, 30), rng.randint(2, 20), rng.randint(40, 180)) for k in range(n_reindeer)}
+
+
+def main(race_duration: int=2503):
+    if os.path.exists(os.path.join(DIRPATH, "input.txt")):
+        racers = read_input_data()
+    else:
+        print("No puzzle input found, so using randomly generated reindeer instead")
+        racers = generate_reindeer()
+
+    implementations: dict[str, Callable[[dict[str, Reindeer], int], dict[str, int]]] = {
+        "Every second": race_points_by_second,
+        "Event driven": race_points,
+    }
+
+    results: dict[str, int] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        points = implementation(racers, race_duration)
+        t_stop = perf_counter()
+        results[name] = max(points.values())
+        print(f"{name}: winner has {results[name]} points in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+    race_duration = 10 ** 9
+    tied_racers = {f"Tied{k}": Reindeer(*characteristics) for k, characteristics in enumerate([(36, 3, 6), (28, 3, 4), (84, 1, 6), (60, 2, 8)])}
+    for n_reindeer in (1000, 5000):
+        for racers in (generate_reindeer(n_reindeer), generate_reindeer(n_reindeer) | tied_racers):
+            t_start = perf_counter()
+            points = race_points(racers, race_duration)
+            t_stop = perf_counter()
+            winner = max(points, key=points.get)
+            print(f"Event driven: {winner} wins with {points[winner]} points among {len(racers)} reindeer "
+                  f"after {race_duration} seconds in {(t_stop - t_start) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
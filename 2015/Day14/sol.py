@@ -2,10 +2,28 @@
 """
 --- Day 14: Reindeer Olympics ---
 https://adventofcode.com/2015/day/14
-Themes: Integer division with remainder
+Themes: Integer division with remainder, Event driven simulation
+
+Awarding points second by second takes O(seconds * reindeer) steps. Instead, the race is split into intervals between
+the times at which any reindeer starts flying or resting, taken in order from a heap of events, so that every distance
+is a linear function of time within an interval. Within an interval, the leaders only change when a faster reindeer
+catches up with them, so points are awarded over whole runs of seconds in which the leaders are unchanged.
+
+Reindeer which have fallen so far behind a reindeer with at least their average speed that they can never catch up
+are dropped from the race, as they can never score again. Once every remaining reindeer has the same average speed,
+all their distances increase by the same amount over the least common multiple of their cycles, so the points scored
+repeat with that period, and whole periods are skipped by multiplying the points scored in one.
+
+References
+- https://docs.python.org/3/library/heapq.html
+- https://en.wikipedia.org/wiki/Discrete-event_simulation
+- https://docs.python.org/3/library/fractions.html
 """
 import os
 from dataclasses import dataclass
+from fractions import Fraction
+import heapq
+import math
 
 DIRPATH = os.path.dirname(__file__)
 
@@ -20,13 +38,7 @@ def main():
 
     print(f"Part 1: After {race_duration} seconds, the winning reindeer is {part_1_winner}, who travelled {final_standings[part_1_winner]} km")
 
-    points: dict[str, int] = {name: 0 for name in racers}
-    for i in range(1, race_duration + 1):
-        standings = {name: reindeer.distance_travelled(i) for name, reindeer in racers.items()}
-        lead_distance = max(standings.values())
-        for name, distance in standings.items():
-            if distance == lead_distance:
-                points[name] += 1
+    points: dict[str, int] = race_points(racers, race_duration)
 
     part_2_winner: str = max(racers, key=points.get)
 
@@ -47,6 +59,125 @@ class Reindeer:
         num_full_cycles, remainder = divmod(seconds, self.flight_duration + self.cooldown)
         return self.flight_speed * (num_full_cycles * self.flight_duration + min(remainder, self.flight_duration))
 
+    @property
+    def cycle_length(self) -> int:
+        return self.flight_duration + self.cooldown
+
+    @property
+    def average_speed(self) -> Fraction:
+        """The distance travelled per second over a whole cycle of flying and resting"""
+        return Fraction(self.flight_speed * self.flight_duration, self.cycle_length)
+
+    @property
+    def max_lead_over_average(self) -> Fraction:
+        """The most that the distance travelled can exceed the average speed times the time, reached after each flight"""
+        return self.flight_duration * (self.flight_speed - self.average_speed)
+
+
+def race_points_by_second(racers: dict[str, Reindeer], race_duration: int) -> dict[str, int]:
+    """Award a point to each reindeer in the lead at the end of every second of the race, checking every second"""
+    points: dict[str, int] = {name: 0 for name in racers}
+    for i in range(1, race_duration + 1):
+        standings = {name: reindeer.distance_travelled(i) for name, reindeer in racers.items()}
+        lead_distance = max(standings.values())
+        for name, distance in standings.items():
+            if distance == lead_distance:
+                points[name] += 1
+    return points
+
+
+def race_points(racers: dict[str, Reindeer], race_duration: int) -> dict[str, int]:
+    """Award a point to each reindeer in the lead at the end of every second of the race,
+    by an event driven simulation which awards points over whole intervals in which the leaders are unchanged
+    """
+    reindeer: list[Reindeer] = list(racers.values())
+    n = len(reindeer)
+    points: list[int] = [0] * n
+    speeds: list[int] = [r.flight_speed for r in reindeer]
+    # Averages are ranked so that they are compared as integers, and the lead over average is rounded up
+    averages: list[Fraction] = [r.average_speed for r in reindeer]
+    average_ranks: dict[Fraction, int] = {average: rank for rank, average in enumerate(sorted(set(averages)))}
+    ranks: list[int] = [average_ranks[average] for average in averages]
+    max_leads: list[int] = [math.ceil(r.max_lead_over_average) for r in reindeer]
+
+    # Every reindeer starts flying at time zero, so their distances and velocities are known at the start of the race
+    active: list[int] = list(range(n))
+    distances: list[int] = [0] * n
+    velocities: list[int] = speeds.copy()
+    events: list[tuple[int, int]] = [(r.flight_duration, i) for i, r in enumerate(reindeer)]
+    heapq.heapify(events)
+
+    def award_interval(start: int, stop: int):
+        """Award points for each second after `start` up to and including `stop`, during which every reindeer
+        travels at constant velocity, dropping reindeer which can never catch up with the leaders again
+        """
+        nonlocal active
+        t = start + 1
+        while t <= stop:
+            elapsed = t - start
+            positions = {i: distances[i] + velocities[i] * elapsed for i in active}
+            lead_distance = max(positions.values())
+            leaders = [i for i in active if positions[i] == lead_distance]
+            for i in leaders:
+                points[i] += 1
+            leader = max(leaders, key=ranks.__getitem__)
+            active = [
+                i for i in active
+                if ranks[i] > ranks[leader] or lead_distance - positions[i] <= max_leads[i] + max_leads[leader]
+            ]
+            # The leaders with the greatest velocity stay in the lead until a faster reindeer catches up with them
+            lead_velocity = max(velocities[i] for i in leaders)
+            leaders = [i for i in leaders if velocities[i] == lead_velocity]
+            catch_up = min(
+                (t + -(-(lead_distance - positions[i]) // (velocities[i] - lead_velocity))
+                 for i in active if velocities[i] > lead_velocity),
+                default=stop + 1
+            )
+            for i in leaders:
+                points[i] += min(catch_up, stop + 1) - t - 1
+            t = catch_up
+
+    def advance(start: int, stop: int, until_periodic: bool=False) -> int:
+        """Run the race from `start` until `stop`, handling the events in order, and return the time reached,
+        optionally stopping early once the points scored are periodic
+        """
+        t = start
+        while t < stop:
+            t_next = min(events[0][0], stop)
+            award_interval(t, t_next)
+            for i in active:
+                distances[i] += velocities[i] * (t_next - t)
+            t = t_next
+            # Start or stop flying at each event, discarding the events of reindeer which have been dropped
+            active_set = set(active)
+            while events[0][0] == t:
+                _, i = heapq.heappop(events)
+                if i in active_set:
+                    velocities[i] = 0 if velocities[i] else speeds[i]
+                    heapq.heappush(events, (t + (reindeer[i].flight_duration if velocities[i] else reindeer[i].cooldown), i))
+            # Once all remaining reindeer have the same average speed, the points scored are periodic
+            if until_periodic and len({ranks[i] for i in active}) == 1:
+                return t
+        return t
+
+    t = advance(0, race_duration, until_periodic=True)
+    if t < race_duration:
+        period = math.lcm(*(reindeer[i].cycle_length for i in active))
+        num_periods = (race_duration - t) // period - 1
+        if num_periods > 0:
+            # Simulate one period and record the points scored, then skip ahead by whole periods
+            start_points = points.copy()
+            t = advance(t, t + period)
+            for i in range(n):
+                points[i] += num_periods * (points[i] - start_points[i])
+            for i in active:
+                distances[i] += num_periods * period * speeds[i] * reindeer[i].flight_duration // reindeer[i].cycle_length
+            t += num_periods * period
+            events = [(event_time + num_periods * period, i) for event_time, i in events]
+        advance(t, race_duration)
+
+    return {name: points[i] for i, name in enumerate(racers)}
+
 
 def read_input_data() -> dict[str, Reindeer]:
     """Read an input file of reindeer racing characteristics"""
@@ -0,0 +1,51 @@
+"""Testing functions for 2015 Day 14
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import random
+import pytest
+from sol import (
+    Reindeer,
+    race_points,
+    race_points_by_second
+)
+
+EXAMPLE_RACERS: dict[str, Reindeer] = {
+    "Comet": Reindeer(flight_speed=14, flight_duration=10, cooldown=127),
+    "Dancer": Reindeer(flight_speed=16, flight_duration=11, cooldown=162),
+}
+
+
+def test_race_points_example():
+    assert race_points(EXAMPLE_RACERS, 1000) == race_points_by_second(EXAMPLE_RACERS, 1000) == {"Comet": 312, "Dancer": 689}
+
+
+@pytest.mark.parametrize("race_duration", [1, 10, 11, 140, 2503])
+@pytest.mark.parametrize("seed", range(10))
+def test_race_points_random_roster(seed: int, race_duration: int):
+    """Rosters like the puzzle input, where some reindeer may rest for no time at all"""
+    rng = random.Random(seed)
+    racers = {
+        f"Reindeer{k}": Reindeer(rng.randint(2, 30), rng.randint(1, 20), rng.choice([0, rng.randint(1, 180)]))
+        for k in range(rng.randint(1, 9))
+    }
+    assert race_points(racers, race_duration) == race_points_by_second(racers, race_duration)
+
+
+@pytest.mark.parametrize("race_duration", [1, 7, 60, 997, 5000])
+@pytest.mark.parametrize("seed", range(10))
+def test_race_points_equal_averages(seed: int, race_duration: int):
+    """Reindeer with the same average speed take turns in the lead forever, including those which never rest,
+    so long races skip whole periods of the least common multiple of their cycles
+    """
+    rng = random.Random(seed)
+    average_speed = rng.randint(1, 4)
+    racers: dict[str, Reindeer] = {"Steady": Reindeer(average_speed, rng.randint(1, 5), 0)}
+    for k in range(rng.randint(1, 4)):
+        # Flying at a multiple m of the average speed for d seconds, then resting for (m - 1) * d seconds
+        multiple, flight_duration = rng.randint(1, 4), rng.randint(1, 6)
+        racers[f"Reindeer{k}"] = Reindeer(multiple * average_speed, flight_duration, (multiple - 1) * flight_duration)
+    # A slower reindeer which is soon dropped from the race
+    racers["Slow"] = Reindeer(average_speed, rng.randint(1, 5), rng.randint(1, 5))
+    assert race_points(racers, race_duration) == race_points_by_second(racers, race_duration)
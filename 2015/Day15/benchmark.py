@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+--- Day 15: Science for Hungry People ---
+Benchmark comparing the best cookie scores found by making a cookie for every recipe, against scoring every recipe
+in bulk with a NumPy matrix product, and against a branch and bound search over the amounts of each ingredient.
+
+Uses the puzzle input if present, otherwise randomly generated ingredients.
+Also runs the branch and bound search with more ingredients and teaspoons than checking every recipe allows.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    np,
+    CookieProperties,
+    read_input_data,
+    weak_compositions,
+    make_cookie,
+    best_score_bulk,
+    best_recipe_branch_and_bound
+)
+
+
+def generate_ingredients(n_ingredients: int=4, seed: int=2019) -> dict[str, CookieProperties]:
+    """Generate random ingredients, each good for one property and bad for some others, like the puzzle input"""
+    rng = random.Random(seed)
+    ingredients: dict[str, CookieProperties] = {}
+    for k in range(n_ingredients):
+        properties = [rng.randint(-2, 1) for _ in range(4)]
+        properties[k % 4] = rng.randint(2, 5)
+        ingredients[f"Ingredient{k}"] = CookieProperties(*properties, calories=rng.randint(2, 8))
+    return ingredients
+
+
+def best_scores_by_every_recipe(ingredients: dict[str, CookieProperties], total_teaspoons: int, calorie_requirement: int) -> tuple[int, int]:
+    """Reference implementation which makes the cookie for every recipe"""
+    cookies = [make_cookie(ingredients, recipe) for recipe in weak_compositions(total_teaspoons, len(ingredients))]
+    return (
+        max(cookie.score() for cookie in cookies),
+        max((cookie.score() for cookie in cookies if cookie.calories == calorie_requirement), default=0)
+    )
+
+
+def main(total_teaspoons: int=100, calorie_requirement: int=500):
+    if os.path.exists(os.path.join(DIRPATH, "input.txt")):
+        ingredients = read_input_data()
+    else:
+        print("No puzzle input found, so using randomly generated ingredients instead")
+        ingredients = generate_ingredients()
+
+    implementations: dict[str, Callable[[dict[str, CookieProperties], int, int], tuple[int, int]]] = {
+        "Every recipe": best_scores_by_every_recipe,
+        "Branch and bound": lambda ingredients, total_teaspoons, calorie_requirement: (
+            best_recipe_branch_and_bound(ingredients, total_teaspoons)[0],
+            best_recipe_branch_and_bound(ingredients, total_teaspoons, calorie_requirement)[0]
+        ),
+    }
+    if np is not None:
+        implementations["Bulk matrix product (NumPy)"] = lambda ingredients, total_teaspoons, calorie_requirement: (
+            best_score_bulk(ingredients, total_teaspoons),
+            best_score_bulk(ingredients, total_teaspoons, calorie_requirement)
+        )
+
+    results: dict[str, tuple[int, int]] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(ingredients, total_teaspoons, calorie_requirement)
+        t_stop = perf_counter()
+        print(f"{name}: {results[name]} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+    n_ingredients, total_teaspoons = 5, 200
+    ingredients = generate_ingredients(n_ingredients)
+    t_start = perf_counter()
+    score, recipe = best_recipe_branch_and_bound(ingredients, total_teaspoons)
+    t_stop = perf_counter()
+    print(f"Branch and bound with {n_ingredients} ingredients and {total_teaspoons} teaspoons: "
+          f"{score} with recipe {recipe} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,40 @@
 """
 --- Day 15: Science for Hungry People ---
 https://adventofcode.com/2015/day/15
-Themes: Combinatorics (Weak compositions), linear optimization problems
+Themes: Combinatorics (Weak compositions), linear optimization problems, branch and bound
+
+Checking every recipe makes a cookie for each of the C(n+m-1, m-1) weak compositions of n teaspoons into m ingredients.
+Two faster approaches are provided:
+- With NumPy, all compositions are generated as the rows of one integer array, so that the properties of every cookie
+  are found by a single matrix product with the array of ingredient properties, and scored in bulk.
+- A branch and bound search chooses the amount of each ingredient in turn, and skips every partial recipe
+  which cannot beat the best score found so far. Each property of the finished cookie is at most its current sum,
+  plus the remaining teaspoons times the greatest value of that property among the remaining ingredients,
+  so the product of these bounds bounds the score, and is zero when any property is forced to be non-positive.
+  The AM-GM inequality tightens this bound further (see `recipe_score_bound`).
+  Likewise, the calories of the finished cookie lie between the bounds given by the least and greatest calories
+  of the remaining ingredients, which cuts off every partial recipe unable to meet a calorie requirement exactly.
 
 References
 - https://docs.python.org/3/reference/datamodel.html#emulating-numeric-types
 - https://docs.python.org/3/library/itertools.html#itertools.combinations
 - https://en.wikipedia.org/wiki/Composition_(combinatorics)
 - https://en.wikipedia.org/wiki/Stars_and_bars_(combinatorics)
-
+- https://en.wikipedia.org/wiki/Branch_and_bound
+- https://en.wikipedia.org/wiki/Inequality_of_arithmetic_and_geometric_means
+- https://numpy.org/doc/stable/reference/generated/numpy.matmul.html
 """
 import os
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, astuple
 import math
 from collections.abc import Iterator
 from itertools import combinations
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 DIRPATH = os.path.dirname(__file__)
 
@@ -98,19 +117,171 @@ def make_cookie(ingredients: dict[str, CookieProperties], recipe: tuple[int]) ->
     )
 
 
+def weak_composition_array(n: int, m: int):
+    """Return a NumPy array whose rows are all the weak compositions of n of length m, in the same order as
+    `weak_compositions`. The array is built from the arrays of weak compositions of each k <= n of length m - 1,
+    prefixed by a column holding the remaining n - k, so no composition is generated one part at a time.
+    """
+    if np is None:
+        raise ImportError("NumPy is not installed")
+    def prefixed_compositions(arrays: list, k: int):
+        """Stack the compositions of k with each possible first part, given the compositions of each j <= k one shorter"""
+        return np.vstack([
+            np.column_stack([np.full(len(rest), first, dtype=np.int64), rest])
+            for first, rest in zip(range(k + 1), reversed(arrays[:k + 1]))
+        ])
+
+    # Weak compositions of each k = 0, ..., n of the current length, starting from length 1
+    arrays = [np.array([[k]], dtype=np.int64) for k in range(n + 1)]
+    for _ in range(2, m):
+        arrays = [prefixed_compositions(arrays, k) for k in range(n + 1)]
+    # Only the compositions of n itself are needed at the full length
+    return prefixed_compositions(arrays, n) if m > 1 else arrays[n]
+
+
+def best_score_bulk(ingredients: dict[str, CookieProperties], total_teaspoons: int, calorie_requirement: int | None=None) -> int:
+    """Return the best score of a cookie over all recipes (optionally, only those meeting the calorie requirement),
+    scoring every recipe in bulk with NumPy by multiplying the array of all recipes by the ingredient property matrix
+    """
+    recipe_array = weak_composition_array(total_teaspoons, len(ingredients))
+    property_matrix = np.array([astuple(ingredient) for ingredient in ingredients.values()], dtype=np.int64)
+    cookies = recipe_array @ property_matrix
+    scores = np.clip(cookies[:, :-1], 0, None).prod(axis=1)
+    if calorie_requirement is not None:
+        scores = scores[cookies[:, -1] == calorie_requirement]
+    return int(scores.max(initial=0))
+
+
+def best_recipe_branch_and_bound(
+    ingredients: dict[str, CookieProperties], total_teaspoons: int, calorie_requirement: int | None=None
+) -> tuple[int, tuple[int, ...] | None]:
+    """Return the best score of a cookie over all recipes (optionally, only those meeting the calorie requirement)
+    and a recipe achieving it, using a branch and bound search over the amount of each ingredient in turn.
+    The recipe is None if no recipe gives a cookie with a positive score.
+    """
+    coefficients: list[tuple[int, ...]] = [astuple(ingredient) for ingredient in ingredients.values()]
+    num_ingredients = len(coefficients)
+    num_properties = len(coefficients[0]) - 1 # Excluding calories, the last property
+    # Least and greatest calories among the ingredients from index i onwards
+    suffix_min_calories: list[int] = [min(coefficient[-1] for coefficient in coefficients[i:]) for i in range(num_ingredients)]
+    suffix_max_calories: list[int] = [max(coefficient[-1] for coefficient in coefficients[i:]) for i in range(num_ingredients)]
+
+    best_score: int = 0
+    best_recipe: tuple[int, ...] | None = None
+    recipe: list[int] = [0] * num_ingredients
+
+    def search(i: int, remaining: int, sums: tuple[int, ...]):
+        nonlocal best_score, best_recipe
+        if i == num_ingredients - 1:
+            # A single ingredient takes all of the teaspoons
+            cookie = [total + remaining * c for total, c in zip(sums, coefficients[i])]
+            score = math.prod(max(val, 0) for val in cookie[:-1])
+            if (calorie_requirement is None or cookie[-1] == calorie_requirement) and score > best_score:
+                best_score, best_recipe = score, (remaining,)
+            return
+        if i == num_ingredients - 2:
+            # With two ingredients left, the last one takes all the teaspoons not given to the other
+            score, amount = best_split(sums, remaining, coefficients[i], coefficients[-1], calorie_requirement)
+            if score > best_score:
+                recipe[i], recipe[-1] = amount, remaining - amount
+                best_score, best_recipe = score, tuple(recipe)
+            return
+
+        for amount in range(remaining + 1):
+            new_sums = tuple(total + amount * c for total, c in zip(sums, coefficients[i]))
+            rest = remaining - amount
+            if calorie_requirement is not None and not (
+                rest * suffix_min_calories[i + 1] <= calorie_requirement - new_sums[-1] <= rest * suffix_max_calories[i + 1]
+            ):
+                continue
+            if recipe_score_bound(new_sums[:-1], rest, coefficients[i + 1:]) > best_score:
+                recipe[i] = amount
+                search(i + 1, rest, new_sums)
+
+    search(0, total_teaspoons, (0,) * (num_properties + 1))
+    return best_score, best_recipe
+
+
+def best_split(
+    sums: tuple[int, ...], remaining: int, first: tuple[int, ...], last: tuple[int, ...], calorie_requirement: int | None=None
+) -> tuple[int, int]:
+    """Return the best score of a cookie completing a partial recipe by sharing the remaining teaspoons between
+    two ingredients, along with the amount of the first ingredient achieving it (the score is 0 if none is positive).
+
+    Giving a teaspoons to the first ingredient, each property is a linear function of a, so the amounts for which
+    every property is positive form an interval, on which the logarithm of the score is a sum of logarithms of
+    linear functions, which is concave. So the scores are unimodal on the interval, and the best amount is found by
+    a binary search for where the score stops increasing. Calories are also linear in a, so meeting a calorie
+    requirement exactly leaves only one possible amount, unless both ingredients have the same calories.
+    """
+    def cookie(a: int) -> list[int]:
+        return [total + a * c_first + (remaining - a) * c_last for total, c_first, c_last in zip(sums, first, last)]
+
+    def score(a: int) -> int:
+        return math.prod(max(val, 0) for val in cookie(a)[:-1])
+
+    low, high = 0, remaining
+    if calorie_requirement is not None:
+        excess = calorie_requirement - cookie(0)[-1]
+        step = first[-1] - last[-1]
+        if step == 0 and excess != 0 or step != 0 and (excess % step != 0 or not 0 <= excess // step <= remaining):
+            return 0, 0
+        if step != 0:
+            low = high = excess // step
+    # Restrict to the amounts for which each property is positive, i.e. intercept + a * slope > 0
+    for total, c_first, c_last in zip(sums[:-1], first[:-1], last[:-1]):
+        intercept, slope = total + remaining * c_last, c_first - c_last
+        if slope > 0:
+            low = max(low, -intercept // slope + 1)
+        elif slope < 0:
+            high = min(high, (intercept - 1) // -slope)
+        elif intercept <= 0:
+            return 0, 0
+    if low > high:
+        return 0, 0
+    # Binary search for the first amount at which the score stops increasing
+    while low < high:
+        middle = (low + high) // 2
+        if score(middle + 1) > score(middle):
+            low = middle + 1
+        else:
+            high = middle
+    return score(low), low
+
+
+def recipe_score_bound(sums: tuple[int, ...], remaining: int, coefficients: list[tuple[int, ...]]) -> float:
+    """Return an upper bound on the score of any cookie completing a partial recipe, given the property sums
+    (excluding calories) of the partial recipe, and the remaining teaspoons to share among the remaining ingredients.
+
+    Each property is at most its sum plus the remaining teaspoons times its greatest value among the remaining
+    ingredients, so the score is at most the product B of these per-property bounds, which is zero whenever any property
+    is forced to be non-positive. Writing the score as B times the product of the ratios of each property to its bound,
+    the AM-GM inequality bounds that product by the mean ratio to the power of the number of properties, and the mean ratio
+    is linear in the amounts of the remaining ingredients, so it is greatest when all teaspoons go to one ingredient.
+    """
+    num_properties = len(sums)
+    bounds = [
+        total + remaining * max(coefficient[p] for coefficient in coefficients)
+        for p, total in enumerate(sums)
+    ]
+    if min(bounds) <= 0:
+        return 0
+    mean_ratio = max(
+        sum((total + remaining * coefficient[p]) / bound for p, (total, bound) in enumerate(zip(sums, bounds)))
+        for coefficient in coefficients
+    ) / num_properties
+    # Allow for rounding errors in the floating point calculation
+    return math.prod(bounds) * min(mean_ratio, 1) ** num_properties * (1 + 1e-9)
+
+
 def main():
     """Read the puzzle inputs, then calculate and print the puzzle answers"""
     ingredients: dict[str, CookieProperties] = read_input_data()
-    num_ingredients: int = len(ingredients)
     total_teaspoons: int = 100
     calorie_requirement: int = 500
 
-    best_cookie_score = max(make_cookie(ingredients, recipe).score() for recipe in weak_compositions(total_teaspoons, num_ingredients))
-    best_meal_replacement_cookie_score = max(
-        cookie.score()
-        for recipe in weak_compositions(total_teaspoons, num_ingredients)
-        if (cookie := make_cookie(ingredients, recipe)).calories == calorie_requirement
-    )
+    best_cookie_score, _ = best_recipe_branch_and_bound(ingredients, total_teaspoons)
+    best_meal_replacement_cookie_score, _ = best_recipe_branch_and_bound(ingredients, total_teaspoons, calorie_requirement)
 
     print(f"Part 1: The best cookie has total score {best_cookie_score}")
     print(f"Part 2: The best 500-calorie meal replacement cookie has total score {best_meal_replacement_cookie_score}")
@@ -0,0 +1,95 @@
+"""Testing functions for 2015 Day 15
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://docs.pytest.org/en/stable/how-to/skipping.html
+"""
+import random
+import pytest
+from sol import (
+    np,
+    CookieProperties,
+    weak_compositions,
+    weak_composition_array,
+    make_cookie,
+    best_score_bulk,
+    best_recipe_branch_and_bound
+)
+
+requires_numpy = pytest.mark.skipif(np is None, reason="NumPy is not installed")
+
+EXAMPLE_INGREDIENTS: dict[str, CookieProperties] = {
+    "Butterscotch": CookieProperties(capacity=-1, durability=-2, flavor=6, texture=3, calories=8),
+    "Cinnamon": CookieProperties(capacity=2, durability=3, flavor=-2, texture=-1, calories=3),
+}
+
+
+def best_score_by_brute_force(ingredients: dict[str, CookieProperties], total_teaspoons: int, calorie_requirement: int | None=None) -> int:
+    """Score every recipe, given by all the weak compositions of the total"""
+    cookies = [make_cookie(ingredients, recipe) for recipe in weak_compositions(total_teaspoons, len(ingredients))]
+    return max(
+        (cookie.score() for cookie in cookies if calorie_requirement is None or cookie.calories == calorie_requirement),
+        default=0
+    )
+
+
+def random_ingredients(rng: random.Random, num_ingredients: int) -> dict[str, CookieProperties]:
+    return {
+        f"Ingredient {k}": CookieProperties(*(rng.randint(-2, 6) for _ in range(4)), calories=rng.randint(1, 8))
+        for k in range(num_ingredients)
+    }
+
+
+@requires_numpy
+@pytest.mark.parametrize("n,m", [(0, 1), (5, 1), (0, 3), (4, 2), (6, 3), (7, 4)])
+def test_weak_composition_array(n: int, m: int):
+    assert weak_composition_array(n, m).tolist() == [list(composition) for composition in weak_compositions(n, m)]
+
+
+@pytest.mark.parametrize(
+    "calorie_requirement,expected_score,expected_recipe",
+    [
+        (None, 62842880, (44, 56)),
+        (500, 57600000, (40, 60)),
+    ]
+)
+def test_best_recipe_branch_and_bound_example(calorie_requirement: int | None, expected_score: int, expected_recipe: tuple[int, ...]):
+    assert best_recipe_branch_and_bound(EXAMPLE_INGREDIENTS, 100, calorie_requirement) == (expected_score, expected_recipe)
+
+
+@pytest.mark.parametrize("num_ingredients", [2, 3, 4])
+@pytest.mark.parametrize("seed", range(8))
+def test_best_recipe_branch_and_bound_matches_brute_force(num_ingredients: int, seed: int):
+    """Compare the best score against scoring every recipe, with no calorie requirement and with calorie requirements
+    which some recipes meet exactly, or possibly none do, and check that the recipe found achieves the best score
+    """
+    rng = random.Random(seed)
+    ingredients = random_ingredients(rng, num_ingredients)
+    total_teaspoons = 20
+    for calorie_requirement in [None, total_teaspoons * rng.randint(2, 6), rng.randint(total_teaspoons, 8 * total_teaspoons)]:
+        best_score, best_recipe = best_recipe_branch_and_bound(ingredients, total_teaspoons, calorie_requirement)
+        assert best_score == best_score_by_brute_force(ingredients, total_teaspoons, calorie_requirement)
+        if best_recipe is None:
+            assert best_score == 0
+            continue
+        assert sum(best_recipe) == total_teaspoons
+        cookie = make_cookie(ingredients, best_recipe)
+        assert cookie.score() == best_score
+        assert calorie_requirement is None or cookie.calories == calorie_requirement
+
+
+@requires_numpy
+@pytest.mark.parametrize("num_ingredients", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed", range(8))
+def test_best_score_bulk_matches_brute_force(num_ingredients: int, seed: int):
+    rng = random.Random(seed)
+    ingredients = random_ingredients(rng, num_ingredients)
+    total_teaspoons = 20
+    for calorie_requirement in [None, total_teaspoons * rng.randint(2, 6), rng.randint(total_teaspoons, 8 * total_teaspoons)]:
+        assert best_score_bulk(ingredients, total_teaspoons, calorie_requirement) == best_score_by_brute_force(ingredients, total_teaspoons, calorie_requirement)
+
+
+@requires_numpy
+@pytest.mark.parametrize("calorie_requirement,expected_score", [(None, 62842880), (500, 57600000)])
+def test_best_score_bulk_example(calorie_requirement: int | None, expected_score: int):
+    assert best_score_bulk(EXAMPLE_INGREDIENTS, 100, calorie_requirement) == expected_score
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+--- Day 16: Aunt Sue ---
+Benchmark comparing answering many reference queries against a roster of aunts by checking every aunt,
+against the inverted property index, for both equality queries and the range queries of part 2.
+
+Uses the puzzle input if present, otherwise a randomly generated roster, and a much larger randomly generated roster.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import operator
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    AuntIndex,
+    parse_description
+)
+
+PROPERTIES = ["children", "cats", "samoyeds", "pomeranians", "akitas", "vizslas", "goldfish", "trees", "cars", "perfumes"]
+COMPARISONS = {
+    "cats": operator.gt, "trees": operator.gt,
+    "pomeranians": operator.lt, "goldfish": operator.lt
+}
+
+
+def generate_roster(n_aunts: int=500, n_known: int=3, max_val: int=10, seed: int=2015) -> list[str]:
+    """Generate random descriptions of aunts, each with a few known properties, like the puzzle input"""
+    rng = random.Random(seed)
+    return [
+        f"Sue {k}: " + ", ".join(f"{key}: {rng.randint(0, max_val)}" for key in rng.sample(PROPERTIES, n_known))
+        for k in range(1, n_aunts + 1)
+    ]
+
+
+def generate_references(n_references: int, max_val: int=10, seed: int=2016) -> list[dict[str, int]]:
+    """Generate random references, each with a value for every property"""
+    rng = random.Random(seed)
+    return [{key: rng.randint(0, max_val) for key in PROPERTIES} for _ in range(n_references)]
+
+
+def query_by_scan(aunts: dict[str, dict[str, int]], references: list[dict[str, int]], comparisons) -> list[list[str]]:
+    """Reference implementation which checks every aunt against each reference"""
+    return [
+        [aunt for aunt, props in aunts.items() if all(comparisons.get(key, operator.eq)(val, reference[key]) for key, val in props.items())]
+        for reference in references
+    ]
+
+
+def query_by_index(aunts: dict[str, dict[str, int]], references: list[dict[str, int]], comparisons) -> list[list[str]]:
+    index = AuntIndex(aunts)
+    return [index.query(reference, comparisons) for reference in references]
+
+
+def main(n_references: int=1000, n_aunts_large: int=100_000):
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            roster = file.readlines()
+    else:
+        print("No puzzle input found, so using a randomly generated roster instead")
+        roster = generate_roster()
+
+    implementations: dict[str, Callable[..., list[list[str]]]] = {
+        "Scan every aunt": query_by_scan,
+        "Inverted property index": query_by_index,
+    }
+
+    references = generate_references(n_references)
+    for roster, references in ((roster, references), (generate_roster(n_aunts_large), references[:n_references // 10])):
+        aunts = dict(map(parse_description, roster))
+        for part, comparisons in ((1, {}), (2, COMPARISONS)):
+            results: dict[str, list[list[str]]] = {}
+            for name, implementation in implementations.items():
+                t_start = perf_counter()
+                results[name] = implementation(aunts, references, comparisons)
+                t_stop = perf_counter()
+                print(f"Part {part}, {name}: {sum(map(len, results[name]))} matches for {len(references)} references "
+                      f"among {len(aunts)} aunts in {(t_stop - t_start) * 1000:.1f} milliseconds")
+            assert all(result == results["Scan every aunt"] for result in results.values())
+
+
+if __name__ == "__main__":
+    main()
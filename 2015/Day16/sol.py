@@ -2,13 +2,27 @@
 """
 --- Day 16: Aunt Sue ---
 https://adventofcode.com/2015/day/16
-Theme: Comparison operators
+Theme: Comparison operators, Inverted index
+
+Checking every aunt against the reference scans the whole roster for each query. Instead, an inverted index keeps,
+for each property, the values known for it in sorted order alongside the aunts they belong to (a posting list),
+so that the aunts whose value is compatible with the reference form a contiguous run found by binary search,
+for equality and for range comparisons alike. An aunt matches when every property known for them is compatible,
+so the matches are the aunts which appear in as many compatible runs as they have known properties.
+An equality query only visits the aunts sharing a value with the reference, but a range comparison can select most of
+a posting list, so a query with wide ranges still visits a large part of the roster, although by slicing posting lists
+rather than comparing each property of each aunt.
 
 References:
 - https://docs.python.org/3/library/operator.html
+- https://docs.python.org/3/library/bisect.html
+- https://en.wikipedia.org/wiki/Inverted_index
 """
 import os
 import operator
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Callable
 
 
 DIRPATH = os.path.dirname(__file__)
@@ -30,19 +44,72 @@ def main():
 
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
         aunts: dict[str, dict[str, int]] = dict(map(parse_description, file))
+    index = AuntIndex(aunts)
 
-    for aunt, props in aunts.items():
-        if all(val == reference[key] for key, val in props.items()):
-            print("Part 1: Reference match for", aunt, props)
+    for aunt in index.query(reference):
+        print("Part 1: Reference match for", aunt, aunts[aunt])
 
     comparisons = {
         "cats": operator.gt, "trees": operator.gt,
         "pomeranians": operator.lt, "goldfish": operator.lt
     }
 
-    for aunt, props in aunts.items():
-        if all(comparisons.get(key, operator.eq)(val, reference[key]) for key, val in props.items()):
-            print("Part 2: Reference match for", aunt, props)
+    for aunt in index.query(reference, comparisons):
+        print("Part 2: Reference match for", aunt, aunts[aunt])
+
+
+class AuntIndex:
+    """An inverted index of the properties of a roster of aunts, answering which aunts are compatible with a reference.
+    For each property, holds the values known for it in sorted order, and the aunts they belong to in the same order.
+    """
+    def __init__(self, aunts: dict[str, dict[str, int]]):
+        self.names: list[str] = list(aunts)
+        self.num_known: list[int] = [len(props) for props in aunts.values()]
+        # Aunts with no known properties are compatible with any reference, and are absent from every posting list
+        self.unknown: list[int] = [k for k, num_known in enumerate(self.num_known) if num_known == 0]
+        postings: dict[str, list[tuple[int, int]]] = {}
+        for k, props in enumerate(aunts.values()):
+            for key, val in props.items():
+                postings.setdefault(key, []).append((val, k))
+        self.values: dict[str, list[int]] = {}
+        self.postings: dict[str, list[int]] = {}
+        for key, entries in postings.items():
+            entries.sort()
+            self.values[key] = [val for val, _ in entries]
+            self.postings[key] = [k for _, k in entries]
+
+    def compatible(self, key: str, reference_val: int, comparison: Callable[[int, int], bool]=operator.eq) -> list[int]:
+        """Return the positions in the roster of the aunts whose value of a property compares true with the reference
+        value, as a contiguous run of the posting list of that property.
+        Supports the comparisons `operator.eq`, `operator.lt`, `operator.le`, `operator.gt` and `operator.ge`.
+        """
+        values = self.values.get(key, [])
+        match comparison:
+            case operator.eq:
+                start, stop = bisect_left(values, reference_val), bisect_right(values, reference_val)
+            case operator.lt:
+                start, stop = 0, bisect_left(values, reference_val)
+            case operator.le:
+                start, stop = 0, bisect_right(values, reference_val)
+            case operator.gt:
+                start, stop = bisect_right(values, reference_val), len(values)
+            case operator.ge:
+                start, stop = bisect_left(values, reference_val), len(values)
+            case _:
+                raise ValueError(f"Unsupported comparison {comparison}")
+        return self.postings.get(key, [])[start:stop]
+
+    def query(self, reference: dict[str, int], comparisons: dict[str, Callable[[int, int], bool]] | None=None) -> list[str]:
+        """Return the aunts, in roster order, for which every known property compares true with the reference,
+        comparing for equality unless another comparison is given for the property.
+        Properties missing from the reference are never compatible.
+        """
+        comparisons = comparisons or {}
+        num_compatible: Counter[int] = Counter()
+        for key, reference_val in reference.items():
+            num_compatible.update(self.compatible(key, reference_val, comparisons.get(key, operator.eq)))
+        matches = self.unknown + [k for k, count in num_compatible.items() if count == self.num_known[k]]
+        return [self.names[k] for k in sorted(matches)]
 
 
 def parse_description(line: str) -> tuple[str, dict[str, int]]:
@@ -0,0 +1,53 @@
+"""Testing functions for 2015 Day 16
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import operator
+import random
+import pytest
+from sol import AuntIndex, parse_description
+
+PROPERTIES = ["children", "cats", "samoyeds", "pomeranians", "akitas", "vizslas", "goldfish", "trees", "cars", "perfumes"]
+
+
+def query_by_scan(aunts: dict[str, dict[str, int]], reference: dict[str, int], comparisons) -> list[str]:
+    """Check every known property of every aunt against the reference"""
+    return [
+        aunt for aunt, props in aunts.items()
+        if all(key in reference and comparisons.get(key, operator.eq)(val, reference[key]) for key, val in props.items())
+    ]
+
+
+def test_parse_description():
+    assert parse_description("Sue 12: cars: 3, akitas: 0, goldfish: 10\n") == ("Sue 12", {"cars": 3, "akitas": 0, "goldfish": 10})
+
+
+@pytest.mark.parametrize("comparison", [operator.eq, operator.lt, operator.le, operator.gt, operator.ge])
+@pytest.mark.parametrize("seed", range(5))
+def test_query_matches_scan(comparison, seed: int):
+    rng = random.Random(seed)
+    # Some aunts have no known properties, and some references are missing properties
+    aunts = {
+        f"Sue {k}": {key: rng.randint(0, 4) for key in rng.sample(PROPERTIES, rng.randint(0, 3))}
+        for k in range(1, 301)
+    }
+    index = AuntIndex(aunts)
+    for _ in range(20):
+        reference = {key: rng.randint(0, 4) for key in rng.sample(PROPERTIES, rng.randint(6, 10))}
+        comparisons = {key: comparison for key in rng.sample(PROPERTIES, 4)}
+        assert index.query(reference, comparisons) == query_by_scan(aunts, reference, comparisons)
+        assert index.query(reference) == query_by_scan(aunts, reference, {})
+
+
+def test_query_aunts_with_no_known_properties():
+    aunts = {"Sue 1": {}, "Sue 2": {"cats": 7}, "Sue 3": {}, "Sue 4": {"cats": 2}}
+    index = AuntIndex(aunts)
+    assert index.query({"cats": 7}) == ["Sue 1", "Sue 2", "Sue 3"]
+    assert index.query({"cats": 7}, {"cats": operator.lt}) == ["Sue 1", "Sue 3", "Sue 4"]
+    assert index.query({}) == ["Sue 1", "Sue 3"]
+
+
+def test_compatible_rejects_unsupported_comparison():
+    with pytest.raises(ValueError):
+        AuntIndex({"Sue 1": {"cats": 7}}).compatible("cats", 7, operator.ne)
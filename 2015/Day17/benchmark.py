@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+--- Day 17: No Such Thing as Too Much ---
+Benchmark comparing counting the combinations of containers (in total, and of the fewest containers)
+by recursing over every subset, against the subset sum table indexed by volume and number of containers.
+
+Uses the puzzle input if present, otherwise randomly generated containers.
+Also counts the combinations among hundreds of containers, far beyond the reach of the recursion.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    count_combinations,
+    generate_combinations,
+    count_combinations_by_size,
+    generate_minimal_combinations
+)
+
+
+def generate_containers(n_containers: int=20, max_volume: int=50, seed: int=2015) -> list[int]:
+    """Generate random container volumes, like the puzzle input"""
+    rng = random.Random(seed)
+    return sorted((rng.randint(1, max_volume) for _ in range(n_containers)), reverse=True)
+
+
+def count_by_recursion(containers: list[int], target_total: int) -> tuple[int, int]:
+    """Reference implementation which recurses over every subset of the containers"""
+    num_combinations = count_combinations(containers, target_total)
+    min_size = min(map(len, generate_combinations(containers, target_total)))
+    return num_combinations, sum(1 for combo in generate_combinations(containers, target_total) if len(combo) == min_size)
+
+
+def count_by_table(containers: list[int], target_total: int) -> tuple[int, int]:
+    counts_by_size = count_combinations_by_size(containers, target_total)
+    return sum(counts_by_size), next(count for count in counts_by_size if count)
+
+
+def main(target_total: int=150):
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            containers: list[int] = sorted(map(int, file), reverse=True)
+    else:
+        print("No puzzle input found, so using randomly generated containers instead")
+        containers = generate_containers()
+
+    implementations: dict[str, Callable[[list[int], int], tuple[int, int]]] = {
+        "Recursion over subsets": count_by_recursion,
+        "Subset sum table": count_by_table,
+    }
+
+    results: dict[str, tuple[int, int]] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(containers, target_total)
+        t_stop = perf_counter()
+        print(f"{name}: {results[name]} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+    n_containers, target_total = 300, 1500
+    containers = generate_containers(n_containers)
+    t_start = perf_counter()
+    num_combinations, num_minimal_combinations = count_by_table(containers, target_total)
+    t_counted = perf_counter()
+    minimal_combinations = list(generate_minimal_combinations(containers, target_total))
+    t_stop = perf_counter()
+    assert len(minimal_combinations) == num_minimal_combinations
+    print(f"Subset sum table for {n_containers} containers: {num_combinations} combinations, "
+          f"{num_minimal_combinations} of the fewest {len(minimal_combinations[0])} containers, "
+          f"counted in {(t_counted - t_start) * 1000:.1f} milliseconds and enumerated in {(t_stop - t_counted) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,22 @@ https://adventofcode.com/2015/day/17
 Part 1: Count the number of different combinations of summands which sum to the target total
 Part 2: Count the number of different combinations of summands which sum to the target total using the minimum number of summands
 
-Themes: Combinatorics, Recursion, Variation of Combination Sum
+Themes: Combinatorics, Recursion, Variation of Combination Sum, Dynamic programming
+
+The recursive approach visits every subset of the containers, which is exponential in the number of containers.
+Instead, a subset sum table counts the combinations of containers by their total volume and number of containers,
+adding one container at a time, which takes O(n * target * n) operations and answers both parts at once.
+Keeping, for each suffix of the containers, which pairs of volume and number of containers are reachable,
+the combinations of a given size are then enumerated lazily without ever following a dead end.
 
 References
 - https://docs.python.org/3/library/functools.html#functools.partial
+- https://en.wikipedia.org/wiki/Subset_sum_problem#Pseudo-polynomial_time_dynamic_programming_solutions
+- https://en.wikipedia.org/wiki/Knapsack_problem#0-1_knapsack_problem
 """
 import os
 from collections.abc import Iterator
+import operator
 
 
 DIRPATH = os.path.dirname(__file__)
@@ -23,14 +32,92 @@ def main():
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
         jugs: list[int] = sorted(map(int, file), reverse=True)
 
-    num_combinations = count_combinations(jugs, target_total)
-    assert len(list(generate_combinations(jugs, target_total))) == num_combinations
+    counts_by_size = count_combinations_by_size(jugs, target_total)
+    num_combinations = sum(counts_by_size)
     print(f"Part 1: There are {num_combinations} possible combinations which sum to {target_total}.")
 
-    min_containers_required = min(map(len, generate_combinations(jugs, target_total)))
-    fewest_summand_solutions = [combo for combo in generate_combinations(jugs, target_total) if len(combo) == min_containers_required]
-    print(f"Part 2: There are {len(fewest_summand_solutions)} combinations which sum to {target_total} using the minimum possible {min_containers_required} containers.")
-    print(fewest_summand_solutions)
+    min_containers_required = next((size for size, count in enumerate(counts_by_size) if count), None)
+    if min_containers_required is None:
+        print(f"Part 2: There are no combinations which sum to {target_total}.")
+        return
+    print(f"Part 2: There are {counts_by_size[min_containers_required]} combinations which sum to {target_total} using the minimum possible {min_containers_required} containers.")
+    print(list(generate_minimal_combinations(jugs, target_total)))
+
+
+def count_combinations_by_size(summands: list[int], target_total: int) -> list[int]:
+    """Count the number of different combinations of summands which sum to the target total, by number of summands,
+    so that entry k of the returned list counts the combinations of exactly k summands.
+    Assumes target total and summands are nonnegative integers.
+    Summands are distinct containers, so each summand of zero can be included in or left out of any combination,
+    for example [10, 8, 5, 3, 2, 0] has 2 combinations summing to 0, of sizes 0 and 1. By contrast, the recursive
+    `count_combinations` stops once the target is reached, and so skips the summands of zero after that point.
+
+    Builds a table whose entry [v][k] counts the combinations of the summands seen so far which sum to v using k of them,
+    adding one summand at a time. Volumes are updated in decreasing order, so each summand is used at most once.
+    """
+    n = len(summands)
+    table: list[list[int]] = [[0] * (n + 1) for _ in range(target_total + 1)]
+    table[0][0] = 1
+    for num_seen, x in enumerate(summands):
+        for volume in range(target_total, x - 1, -1):
+            row, source = table[volume], table[volume - x]
+            # Slices are copied before assignment, so every entry is updated from the counts before adding x
+            row[1:num_seen + 2] = map(operator.add, row[1:num_seen + 2], source[:num_seen + 1])
+    return table[target_total]
+
+
+def reachability_table(summands: list[int], target_total: int) -> list[list[int]]:
+    """Return a table whose entry [i][v] is a bitmask with bit k set if some k of the summands from index i onwards
+    sum to v, for every volume v up to the target total. Assumes target total and summands are nonnegative integers.
+    """
+    n = len(summands)
+    reachable: list[list[int]] = [[0] * (target_total + 1) for _ in range(n + 1)]
+    reachable[n][0] = 1
+    for i in range(n - 1, -1, -1):
+        x, row, next_row = summands[i], reachable[i], reachable[i + 1]
+        for volume in range(target_total + 1):
+            row[volume] = next_row[volume] | (next_row[volume - x] << 1 if volume >= x else 0)
+    return reachable
+
+
+def generate_combinations_of_size(
+    summands: list[int], target_total: int, size: int, reachable: list[list[int]] | None=None
+) -> Iterator[tuple[int]]:
+    """Lazily yield all combinations of exactly `size` summands which sum to the target total,
+    in the same order as `generate_combinations`. Assumes target total and summands are nonnegative integers.
+    Summands of zero are distinct containers, which are counted as in `count_combinations_by_size`.
+
+    Using the reachability table, the search only includes or excludes a summand when the rest of the combination
+    can still be completed from the remaining summands. Every branch of the search therefore ends in a combination,
+    so after building the table, the time taken is proportional to the size of the output.
+    """
+    n = len(summands)
+    if reachable is None:
+        reachable = reachability_table(summands, target_total)
+
+    def generate_recursively(i: int, target: int, remaining: int, current_combo: tuple[int]) -> Iterator[tuple[int]]:
+        if i == n:
+            yield current_combo
+            return
+        x = summands[i]
+        if remaining > 0 and target >= x and reachable[i + 1][target - x] >> (remaining - 1) & 1:
+            yield from generate_recursively(i + 1, target - x, remaining - 1, current_combo + (x,))
+        if reachable[i + 1][target] >> remaining & 1:
+            yield from generate_recursively(i + 1, target, remaining, current_combo)
+
+    if 0 <= size <= n and reachable[0][target_total] >> size & 1:
+        yield from generate_recursively(0, target_total, size, tuple())
+
+
+def generate_minimal_combinations(summands: list[int], target_total: int) -> Iterator[tuple[int]]:
+    """Lazily yield all combinations of the fewest possible summands which sum to the target total,
+    where the fewest possible is the lowest bit set in the reachability table for all summands and the target total
+    """
+    reachable = reachability_table(summands, target_total)
+    sizes = reachable[0][target_total]
+    if sizes:
+        min_size = (sizes & -sizes).bit_length() - 1
+        yield from generate_combinations_of_size(summands, target_total, min_size, reachable)
 
 
 def count_combinations(summands: list[int], target_total: int) -> int:
@@ -0,0 +1,89 @@
+"""Testing functions for 2015 Day 17
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://docs.python.org/3/library/itertools.html#itertools.combinations
+"""
+import itertools
+import random
+import pytest
+from sol import (
+    count_combinations_by_size,
+    generate_combinations_of_size,
+    generate_minimal_combinations,
+    count_combinations,
+    generate_combinations
+)
+
+EXAMPLE_CONTAINERS: list[int] = [20, 15, 10, 5, 5]
+
+
+def combinations_by_subsets(summands: list[int], target_total: int) -> list[tuple[int]]:
+    """Every subset of the containers, by position, whose volumes sum to the target total"""
+    return [
+        combination
+        for size in range(len(summands) + 1)
+        for combination in itertools.combinations(summands, size)
+        if sum(combination) == target_total
+    ]
+
+
+def test_example():
+    assert count_combinations_by_size(EXAMPLE_CONTAINERS, 25) == [0, 0, 3, 1, 0, 0]
+    assert list(generate_minimal_combinations(EXAMPLE_CONTAINERS, 25)) == [(20, 5), (20, 5), (15, 10)]
+    assert list(generate_combinations_of_size(EXAMPLE_CONTAINERS, 25, 3)) == [(15, 5, 5)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_combinations_match_recursion(seed: int):
+    """Compare with the recursive functions on positive volumes, for reachable targets and those with no combination"""
+    rng = random.Random(seed)
+    summands = sorted((rng.randint(1, 30) for _ in range(rng.randint(0, 12))), reverse=True)
+    for target_total in [0, rng.randint(0, sum(summands)), sum(summands), sum(summands) + 1, rng.randint(1, 60)]:
+        expected = list(generate_combinations(summands, target_total))
+        counts_by_size = count_combinations_by_size(summands, target_total)
+        assert len(counts_by_size) == len(summands) + 1
+        assert sum(counts_by_size) == count_combinations(summands, target_total) == len(expected)
+        for size, count in enumerate(counts_by_size):
+            combinations = list(generate_combinations_of_size(summands, target_total, size))
+            assert combinations == [combination for combination in expected if len(combination) == size]
+            assert len(combinations) == count
+        min_size = min(map(len, expected), default=None)
+        assert list(generate_minimal_combinations(summands, target_total)) == [
+            combination for combination in expected if len(combination) == min_size
+        ]
+
+
+def test_no_combination():
+    assert count_combinations_by_size([10, 8, 5], 4) == [0, 0, 0, 0]
+    assert count_combinations([10, 8, 5], 4) == 0
+    assert list(generate_minimal_combinations([10, 8, 5], 4)) == []
+    assert list(generate_combinations_of_size([10, 8, 5], 4, 1)) == []
+    # Sizes beyond the number of summands have no combinations
+    assert list(generate_combinations_of_size([10, 8, 5], 23, 4)) == []
+
+
+@pytest.mark.parametrize(
+    "summands,target_total,expected",
+    [
+        ([10, 8, 5, 3, 2, 0], 0, [1, 1, 0, 0, 0, 0, 0]),
+        ([10, 8, 5, 3, 2, 0], 10, [0, 1, 2, 2, 1, 0, 0]),
+        ([5, 0, 0], 5, [0, 1, 2, 1]),
+        ([0, 0], 0, [1, 2, 1]),
+    ]
+)
+def test_zero_volume_containers(summands: list[int], target_total: int, expected: list[int]):
+    """Containers of zero volume are distinct, so they can be included in or left out of any combination"""
+    assert count_combinations_by_size(summands, target_total) == expected
+    combinations = combinations_by_subsets(summands, target_total)
+    assert sum(expected) == len(combinations)
+    for size in range(len(summands) + 1):
+        assert sorted(generate_combinations_of_size(summands, target_total, size)) == sorted(
+            combination for combination in combinations if len(combination) == size
+        )
+
+
+def test_zero_volume_containers_by_recursion():
+    """The recursive count stops once the target is reached, so it skips the zero at the end"""
+    assert count_combinations([10, 8, 5, 3, 2, 0], 0) == 1
+    assert list(generate_minimal_combinations([10, 8, 5, 3, 2, 0], 0)) == [()]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+--- Day 19: Medicine for Rudolph ---
+Benchmark comparing the fewest replacement steps to make a molecule found by searching forwards from 'e'
+against the A* search which reduces the molecule back to 'e'.
+Also compares counting the distinct molecules made by one replacement by building every outcome string from the
+matches of a regular expression, against hashing the outcomes found from the index of atom positions,
+on the molecule and on a much longer one.
+
+Uses the puzzle input if present, otherwise the replacements of a typical puzzle input and a molecule made from 'e'
+by random replacements, with as many steps as it takes to make a molecule of typical length.
+Both implementations are compared on a short molecule, as the forward search cannot make a full size molecule.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+import re
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    parse_puzzle_input,
+    tokenize_molecule,
+    count_distinct_substitution_outcomes,
+    reduce_to_electron,
+    forward_search_steps
+)
+
+REPLACEMENTS_INPUT = """\
+Al => ThF
+Al => ThRnFAr
+B => BCa
+B => TiB
+B => TiRnFAr
+Ca => CaCa
+Ca => PB
+Ca => PRnFAr
+Ca => SiRnFYFAr
+Ca => SiRnMgAr
+Ca => SiTh
+F => CaF
+F => PMg
+F => SiAl
+H => CRnAlAr
+H => CRnFYFYFAr
+H => CRnFYMgAr
+H => CRnMgYFAr
+H => HCa
+H => NRnFYFAr
+H => NRnMgAr
+H => NTh
+H => OB
+H => ORnFAr
+Mg => BF
+Mg => TiMg
+N => CRnFAr
+N => HSi
+O => CRnFYFAr
+O => CRnMgAr
+O => HP
+O => NRnFAr
+O => OTi
+P => CaP
+P => PTi
+P => SiRnFAr
+Si => CaSi
+Th => ThCa
+Ti => BP
+Ti => TiTi
+e => HF
+e => NAl
+e => OMg
+"""
+
+
+def generate_molecule(atom_replacements: dict[str, list[str]], n_atoms: int=280, seed: int=2015) -> str:
+    """Make a molecule of at least `n_atoms` atoms from 'e' by replacing random atoms with random replacements"""
+    rng = random.Random(seed)
+    rules: list[tuple[str, str]] = [
+        (atom, replacement) for atom, replacements in atom_replacements.items() if atom != 'e' for replacement in replacements
+    ]
+    molecule: list[str] = list(tokenize_molecule(rng.choice(atom_replacements['e'])))
+    while len(molecule) < n_atoms:
+        atom, replacement = rng.choice(rules)
+        positions = [i for i, token in enumerate(molecule) if token == atom]
+        if positions:
+            i = rng.choice(positions)
+            molecule[i:i + 1] = tokenize_molecule(replacement)
+    return "".join(molecule)
+
+
+def count_outcomes_by_regex(atom_replacements: dict[str, list[str]], molecule: str) -> int:
+    """Reference implementation which builds the outcome string for every match of every atom in the molecule"""
+    return len({
+        molecule[:m.start()] + replacement + molecule[m.end():]
+        for atom, replacements in atom_replacements.items()
+        for m in re.finditer(atom, molecule)
+        for replacement in replacements
+    })
+
+
+def main(n_atoms_long: int=20_000):
+    input_path = os.path.join(DIRPATH, "input.txt")
+    atom_replacements, _ = parse_puzzle_input(REPLACEMENTS_INPUT)
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            atom_replacements, medicine_molecule = parse_puzzle_input(file.read())
+    else:
+        print("No puzzle input found, so using a randomly generated molecule instead")
+        medicine_molecule = generate_molecule(atom_replacements)
+
+    implementations: dict[str, Callable[[dict[str, list[str]], str], int]] = {
+        "Forward search": forward_search_steps,
+        "Reverse A* search": reduce_to_electron,
+    }
+
+    short_molecule = generate_molecule(atom_replacements, n_atoms=8)
+    results: dict[str, int] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(atom_replacements, short_molecule)
+        t_stop = perf_counter()
+        print(f"{name}: {results[name]} steps for {short_molecule} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+    part_1_implementations: dict[str, Callable[[dict[str, list[str]], str], int]] = {
+        "Regular expression matches": count_outcomes_by_regex,
+        "Hashing indexed outcomes": count_distinct_substitution_outcomes,
+    }
+    long_molecule = generate_molecule(atom_replacements, n_atoms=n_atoms_long)
+    for molecule in (medicine_molecule, long_molecule):
+        results = {}
+        for name, implementation in part_1_implementations.items():
+            t_start = perf_counter()
+            results[name] = implementation(atom_replacements, molecule)
+            t_stop = perf_counter()
+            print(f"{name}: {results[name]} distinct molecules from a molecule of {len(molecule)} characters "
+                  f"in {(t_stop - t_start) * 1000:.1f} milliseconds")
+        assert len(set(results.values())) == 1, results
+
+    t_start = perf_counter()
+    steps = reduce_to_electron(atom_replacements, medicine_molecule)
+    t_stop = perf_counter()
+    print(f"Reverse A* search: {steps} steps for a molecule of {len(tokenize_molecule(medicine_molecule))} atoms "
+          f"in {(t_stop - t_start) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
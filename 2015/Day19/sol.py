@@ -5,17 +5,64 @@ https://adventofcode.com/2015/day/19
 Part 1: Substring substitution
 Part 2: Successive substring substitution and Search
 
+Commentary
+For part 1, the molecule is split into atoms once, with an index of the positions of each atom, so that each
+replacement is found directly rather than by searching the whole molecule string for every atom. Each outcome is
+described by the span of the molecule it replaces and the replacement, and outcomes are deduplicated by a polynomial
+rolling hash of (prefix, replacement, suffix), combined from precomputed prefix hashes of the molecule in constant
+time, so the outcome strings are never built. Distinct outcomes could collide on a hash, which is not checked for,
+but with a modulus of 2^61 - 1 this is vanishingly unlikely. Hashing only pays off for long molecules: for molecules
+the size of the puzzle input, building and deduplicating the outcome strings directly is quicker, so molecules shorter
+than HASHING_MIN_LENGTH are counted that way. Atoms are matched whole, so a replacement for C does not apply to the C
+of Ca, whereas a substring search (as in split_molecule_by_atom) would match both.
+
+Searching forwards from 'e' for the medicine molecule is hopeless, as the number of reachable molecules grows
+exponentially with the number of steps. Searching in reverse instead, every step reduces the molecule by replacing an
+occurrence of the right hand side of a replacement with its left hand side, and only reductions which are present in
+the molecule can be applied, so the search is guided by the target molecule. Molecules are split into atoms (tokens)
+once, so that replacements are matched atom by atom, and the search is an A* search over tuples of atoms.
+Reductions are only made in the order of a leftmost derivation in reverse, moving from right to left through the
+molecule, so that independent reductions are not tried in every possible order.
+
+The heuristic assigns a weight to each atom such that every replacement increases the total weight of a molecule
+by exactly one, when such weights exist, found by solving a linear system. Then the number of steps needed to reduce
+any molecule to 'e' is exactly its total weight less the weight of 'e', however the steps are chosen, and the search
+only has to find any reduction, diving depth first and backtracking from dead ends. (The puzzle input has such weights,
+which is why counting atoms such as Rn, Ar and Y gives the answer.) Otherwise, a heuristic of zero is used,
+making the search a uniform cost search in reverse, which is exact but far slower.
+The number of molecules visited is capped to bound the memory used.
+
 References
 - Regular expressions for pattern matching and substiution
   - https://docs.python.org/3/library/re.html
   - https://docs.python.org/3/howto/regex.html#regex-howto
+- https://en.wikipedia.org/wiki/Rolling_hash#Polynomial_rolling_hash
+- https://en.wikipedia.org/wiki/A*_search_algorithm
+- https://docs.python.org/3/library/heapq.html
+- https://docs.python.org/3/library/fractions.html
+- https://en.wikipedia.org/wiki/Gaussian_elimination
 """
 import os
 from collections import defaultdict
+from collections.abc import Iterator
+from fractions import Fraction
+import functools
+import heapq
+import itertools
 import re
 
 DIRPATH = os.path.dirname(__file__)
 
+# An atom is an uppercase letter followed by any lowercase letters, or any other single character, such as 'e'
+ATOM_PATTERN = re.compile(r"[A-Z][a-z]*|.")
+# Modulus and base of the polynomial rolling hash of molecule strings, with the modulus a Mersenne prime
+HASH_MODULUS: int = (1 << 61) - 1
+HASH_BASE: int = 1_000_003
+# Length of the shortest molecule whose single replacement outcomes are counted by hashing rather than building strings
+HASHING_MIN_LENGTH: int = 2048
+# Maximum number of molecules visited by the reverse search before giving up
+MAX_STATES: int = 1_000_000
+
 
 def main():
     """Read the puzzle inputs, then calculate and print the puzzle answers"""
@@ -38,11 +85,124 @@ def parse_puzzle_input(puzzle_input: str) -> tuple[dict[str, list[str]], str]:
 
 def solve_part_1(atom_replacements: dict[str, list[str]], start_molecule: str) -> int:
     """Given a list of substitutions, calculate how many distinct molecule strings that can be obtained by any possible single replacement on the starting molecule string"""
-    return len(distinct_substitution_outcomes(atom_replacements, start_molecule))
+    return count_distinct_substitution_outcomes(atom_replacements, start_molecule)
 
 
 def solve_part_2(atom_replacements: dict[str, list[str]], target_molecule: str) -> int:
     """Find the fewest number of replacement steps to obtain the target molecule starting from a single electron 'e'"""
+    return reduce_to_electron(atom_replacements, target_molecule)
+
+
+def tokenize_molecule(molecule: str) -> tuple[str, ...]:
+    """Split a molecule string into its atoms"""
+    return tuple(ATOM_PATTERN.findall(molecule))
+
+
+def atom_weights(atom_replacements: dict[str, list[str]]) -> dict[str, Fraction] | None:
+    """Find weights of atoms such that every replacement increases the total weight of a molecule by exactly one,
+    by Gaussian elimination over the rationals, or return None if no such weights exist.
+    Atoms whose weight is not determined by the replacements are given weight zero.
+    """
+    atoms: list[str] = sorted(
+        {atom for atom in atom_replacements}
+        | {token for replacements in atom_replacements.values() for replacement in replacements for token in tokenize_molecule(replacement)}
+    )
+    column: dict[str, int] = {atom: k for k, atom in enumerate(atoms)}
+    # Each row holds the coefficients of the atom weights followed by the right hand side of the equation
+    rows: list[list[Fraction]] = []
+    for atom, replacements in atom_replacements.items():
+        for replacement in replacements:
+            row = [Fraction(0)] * (len(atoms) + 1)
+            for token in tokenize_molecule(replacement):
+                row[column[token]] += 1
+            row[column[atom]] -= 1
+            row[-1] = Fraction(1)
+            rows.append(row)
+
+    # Reduce the system to reduced row echelon form, recording the pivot column of each row
+    pivots: list[int] = []
+    rank = 0
+    for k in range(len(atoms)):
+        pivot_row = next((r for r in range(rank, len(rows)) if rows[r][k] != 0), None)
+        if pivot_row is None:
+            continue
+        rows[rank], rows[pivot_row] = rows[pivot_row], rows[rank]
+        pivot = rows[rank][k]
+        rows[rank] = [value / pivot for value in rows[rank]]
+        for r in range(len(rows)):
+            if r != rank and rows[r][k] != 0:
+                factor = rows[r][k]
+                rows[r] = [value - factor * pivot_value for value, pivot_value in zip(rows[r], rows[rank])]
+        pivots.append(k)
+        rank += 1
+    # Any remaining equation reads 0 = 1 if the system is inconsistent
+    if any(row[-1] != 0 for row in rows[rank:]):
+        return None
+
+    weights: dict[str, Fraction] = {atom: Fraction(0) for atom in atoms}
+    for row, k in zip(rows, pivots):
+        weights[atoms[k]] = row[-1]
+    return weights
+
+
+def reduce_to_electron(atom_replacements: dict[str, list[str]], target_molecule: str, max_states: int=MAX_STATES) -> int:
+    """Find the fewest number of replacement steps to obtain the target molecule starting from a single electron 'e',
+    by an A* search which reduces the target molecule back to 'e' by applying the replacements in reverse.
+    Raises ValueError if the target molecule cannot be obtained, or if more than `max_states` molecules are visited.
+    """
+    weights = atom_weights(atom_replacements)
+
+    def weight(tokens: tuple[str, ...]) -> Fraction:
+        return sum((weights.get(token, Fraction(0)) for token in tokens), start=Fraction(0)) if weights is not None else Fraction(0)
+
+    # Reverse replacements indexed by the first atom of their right hand side, for matching at each position,
+    # along with the change in the heuristic when the reduction is applied (-1 when the weights exist)
+    reductions: dict[str, list[tuple[tuple[str, ...], str, Fraction]]] = defaultdict(list)
+    for atom, replacements in atom_replacements.items():
+        for replacement in replacements:
+            tokens = tokenize_molecule(replacement)
+            reductions[tokens[0]].append((tokens, atom, weight((atom,)) - weight(tokens)))
+
+    start = tokenize_molecule(target_molecule)
+    # Counting down, so that among molecules of equal estimated total cost and steps taken, the latest pushed is preferred
+    tie_breaker = itertools.count(0, -1)
+    # Heap entries are the estimated total cost, the negated steps taken, a tie breaker, the heuristic, the molecule
+    # and the position of the atom made by the last reduction. Among molecules of equal estimated total cost,
+    # prefer those with more steps taken, i.e. depth first, and then those reduced furthest right
+    start_heuristic = weight(start) - weight(('e',))
+    frontier: list[tuple[Fraction, int, int, Fraction, tuple[str, ...], int]] = [
+        (start_heuristic, 0, next(tie_breaker), start_heuristic, start, len(start))
+    ]
+    visited: set[tuple[tuple[str, ...], int]] = {(start, len(start))}
+    while frontier:
+        _, negative_steps, _, heuristic, molecule, last_position = heapq.heappop(frontier)
+        steps = -negative_steps
+        if molecule == ('e',):
+            return steps
+        for i, token in enumerate(molecule):
+            for tokens, atom, delta in reductions.get(token, []):
+                # Only make reductions in the order of a leftmost derivation in reverse, where each reduction starts
+                # at or before the atom made by the last one. Every derivation can be reordered to be leftmost,
+                # so this skips making the same independent reductions in every possible order
+                if i > last_position or molecule[i:i + len(tokens)] != tokens:
+                    continue
+                # An electron is only ever the starting molecule, so it can only replace the whole molecule
+                if atom == 'e' and len(tokens) != len(molecule):
+                    continue
+                reduced = molecule[:i] + (atom,) + molecule[i + len(tokens):]
+                if (reduced, i) in visited:
+                    continue
+                if len(visited) >= max_states:
+                    raise ValueError(f"Gave up after visiting {max_states} molecules")
+                visited.add((reduced, i))
+                heapq.heappush(frontier, (steps + 1 + heuristic + delta, -(steps + 1), next(tie_breaker), heuristic + delta, reduced, i))
+    raise ValueError(f"The molecule {target_molecule} cannot be made from 'e' with these replacements")
+
+
+def forward_search_steps(atom_replacements: dict[str, list[str]], target_molecule: str) -> int:
+    """Find the fewest number of replacement steps to obtain the target molecule starting from a single electron 'e',
+    by searching forwards from 'e'
+    """
     # Successively calculates sets of all possible molecules that can be reached after n replacements until the target molecule is found and `n` is returned
     # This implementation does not have the required performance (ops, memory) to complete within reasonable time on the main puzzle input
     # It may be possible to find algorithmic efficiencies by considering 'reachability' from one prefix to another to help filter out dead ends in searching
@@ -53,17 +213,91 @@ def solve_part_2(atom_replacements: dict[str, list[str]], target_molecule: str)
             for molecule in replacement_stages[-1]
             for new_molecule in distinct_substitution_outcomes(atom_replacements, molecule)
         })
-        print(replacement_stages[-1])
     return len(replacement_stages) - 1
 
 
+class IndexedMolecule:
+    """A molecule split into atoms, with the positions of each atom, and the prefix hashes of the molecule string,
+    which are only calculated when first needed
+    """
+    def __init__(self, molecule: str):
+        self.molecule = molecule
+        self.tokens = tokenize_molecule(molecule)
+        # The offsets of the start of each atom in the molecule string, followed by the length of the string
+        self.offsets: list[int] = list(itertools.accumulate(map(len, self.tokens), initial=0))
+        self.positions: dict[str, list[int]] = defaultdict(list)
+        for i, token in enumerate(self.tokens):
+            self.positions[token].append(i)
+
+    @functools.cached_property
+    def prefix_hashes(self) -> list[int]:
+        """The hash of each prefix of the molecule string, so that prefix_hashes[k] is the hash of molecule[:k]"""
+        return list(itertools.accumulate(map(ord, self.molecule), lambda h, c: (h * HASH_BASE + c) % HASH_MODULUS, initial=0))
+
+    @functools.cached_property
+    def powers(self) -> list[int]:
+        """HASH_BASE to the power of k, modulo HASH_MODULUS, for k up to the length of the molecule string"""
+        return list(itertools.accumulate(itertools.repeat(HASH_BASE, len(self.molecule)), lambda p, b: p * b % HASH_MODULUS, initial=1))
+
+    def substitution_spans(self, atom_replacements: dict[str, list[str]]) -> Iterator[tuple[int, int, str]]:
+        """Yield the start and end of the span of the molecule string replaced, and the replacement,
+        for every possible single replacement of an atom
+        """
+        for atom, replacements in atom_replacements.items():
+            for i in self.positions.get(atom, []):
+                for replacement in replacements:
+                    yield self.offsets[i], self.offsets[i + 1], replacement
+
+    def outcome_hash(self, start: int, end: int, replacement_hash: int, replacement_power: int) -> int:
+        """Return the hash of the molecule string with the span from start to end replaced, in constant time,
+        given the hash of the replacement and HASH_BASE to the power of its length.
+        Distinct outcomes have equal hashes with a probability of about one in 2^61, which is not checked for.
+        """
+        n = len(self.molecule)
+        suffix_power = self.powers[n - end]
+        suffix_hash = (self.prefix_hashes[n] - self.prefix_hashes[end] * suffix_power) % HASH_MODULUS
+        return ((self.prefix_hashes[start] * replacement_power + replacement_hash) * suffix_power + suffix_hash) % HASH_MODULUS
+
+
+def string_hash(s: str) -> int:
+    """Return the polynomial rolling hash of a string"""
+    h = 0
+    for c in s:
+        h = (h * HASH_BASE + ord(c)) % HASH_MODULUS
+    return h
+
+
+def count_distinct_substitution_outcomes(atom_replacements: dict[str, list[str]], molecule: str) -> int:
+    """Given a list of substitutions, count the distinct molecule strings that can be obtained by any possible single
+    replacement on the starting molecule string.
+
+    Molecules shorter than HASHING_MIN_LENGTH are counted by building every outcome string, which is quicker
+    for them, and longer molecules by hashing each outcome rather than building it. Hash collisions are not checked
+    for, so the count of a long molecule could in principle be too small, but collisions between distinct outcomes
+    are vanishingly unlikely.
+    """
+    if len(molecule) < HASHING_MIN_LENGTH:
+        return len(distinct_substitution_outcomes(atom_replacements, molecule))
+    indexed_molecule = IndexedMolecule(molecule)
+    replacement_hashes: dict[str, tuple[int, int]] = {
+        replacement: (string_hash(replacement), pow(HASH_BASE, len(replacement), HASH_MODULUS))
+        for replacements in atom_replacements.values() for replacement in replacements
+    }
+    # The length of the outcome is kept alongside its hash, as outcomes of different lengths are always distinct
+    return len({
+        (len(molecule) - (end - start) + len(replacement),
+         indexed_molecule.outcome_hash(start, end, *replacement_hashes[replacement]))
+        for start, end, replacement in indexed_molecule.substitution_spans(atom_replacements)
+    })
+
+
 def distinct_substitution_outcomes(atom_replacements: dict[str, list[str]], molecule: str) -> set[str]:
-    """Given a list of substitutions, return the set of distinct molecule strings that can be obtained by any possible single replacement on the starting molecule string"""
+    """Given a list of substitutions, return the set of distinct molecule strings that can be obtained by any possible single replacement on the starting molecule string.
+    Replacements apply to whole atoms, so a replacement for C does not apply to the C at the start of the atom Ca.
+    """
     return {
-        molecule[:m.start()] + replacement + molecule[m.end():]
-        for atom, replacements in atom_replacements.items()
-        for m in re.finditer(atom, molecule)
-        for replacement in replacements
+        molecule[:start] + replacement + molecule[end:]
+        for start, end, replacement in IndexedMolecule(molecule).substitution_spans(atom_replacements)
     }
 
 
@@ -9,7 +9,11 @@ from sol import (
     solve_part_1,
     solve_part_2,
     distinct_substitution_outcomes,
-    split_molecule_by_atom
+    split_molecule_by_atom,
+    HASHING_MIN_LENGTH,
+    tokenize_molecule,
+    count_distinct_substitution_outcomes,
+    reduce_to_electron
 )
 
 
@@ -43,13 +47,44 @@ def test_solve_part_2(atom_replacements: dict[str, list[str]], target_molecule:
         ({"O": ["HH"]}, "HOH", {"HHHH"}),
         ({"H": ["OO"]}, "H2O", {"OO2O"}),
         ({"H": ["HO", "OH"], "O": ["HH"]}, "HOH", {"HOOH", "HOHO", "OHOH", "HHHH"}),
-        ({"H": ["HO", "OH"], "O": ["HH"]}, "HOHOHO", {"HOOHOHO", "HOHOOHO", "HOHOHOO", "OHOHOHO", "HHHHOHO", "HOHHHHO", "HOHOHHH"})
+        ({"H": ["HO", "OH"], "O": ["HH"]}, "HOHOHO", {"HOOHOHO", "HOHOOHO", "HOHOHOO", "OHOHOHO", "HHHHOHO", "HOHHHHO", "HOHOHHH"}),
+        # Replacements apply to whole atoms, so the C of Ca is not replaced, unlike the substring match of split_molecule_by_atom
+        ({"C": ["X"]}, "CaC", {"CaX"}),
     ]
 )
 def test_distinct_substitution_outcomes(atom_replacements: dict[str, list[str]], start_molecule: str, expected: set[str]):
     assert distinct_substitution_outcomes(atom_replacements, start_molecule) == expected
 
 
+@pytest.mark.parametrize(
+    "atom_replacements,start_molecule,expected",
+    [
+        ({"H": ["HO", "OH"], "O": ["HH"]}, "HOH", 4),
+        ({"H": ["HO", "OH"], "O": ["HH"]}, "HOHOHO", 7),
+        ({"H": ["OO"]}, "H2O", 1),
+        ({"Ca": ["CaCa", "PB"], "Ti": ["TiTi"]}, "CaCaCaTiTi", 5),
+        ({"C": ["X"]}, "CaC", 1),
+    ]
+)
+def test_count_distinct_substitution_outcomes(atom_replacements: dict[str, list[str]], start_molecule: str, expected: int):
+    assert count_distinct_substitution_outcomes(atom_replacements, start_molecule) == expected
+
+
+@pytest.mark.parametrize(
+    "atom_replacements,start_molecule",
+    [
+        ({"H": ["HO", "OH"], "O": ["HH"]}, "HOH" * 1000),
+        ({"Ca": ["CaCa", "PB"], "Ti": ["TiTi"], "C": ["X"]}, "CaCaCTiTiCaTi" * 300),
+        ({"Ca": ["CaCa", "PB"], "Ti": ["TiTi"], "C": ["X"]}, "CaPBTi" + "Ca" * 2000),
+    ]
+)
+def test_count_distinct_substitution_outcomes_by_hashing(atom_replacements: dict[str, list[str]], start_molecule: str):
+    """Molecules at least HASHING_MIN_LENGTH long are counted by hashing, which must agree with building the outcomes"""
+    assert len(start_molecule) >= HASHING_MIN_LENGTH
+    expected = len(distinct_substitution_outcomes(atom_replacements, start_molecule))
+    assert count_distinct_substitution_outcomes(atom_replacements, start_molecule) == expected
+
+
 @pytest.mark.parametrize(
     "molecule,atom,replacement,expected",
     [
@@ -57,7 +92,40 @@ def test_distinct_substitution_outcomes(atom_replacements: dict[str, list[str]],
         ("HOH", "H", "OH", {"OHOH", "HOOH"}),
         ("HOH", "O", "HH", {"HHHH"}),
         ("H2O", "H", "OO", {"OO2O"}),
+        ("CaC", "C", "X", {"XaC", "CaX"}),
     ]
 )
 def test_split_molecule_by_atom(molecule: str, atom: str, replacement: str, expected: set[str]):
     assert split_molecule_by_atom(molecule, atom, replacement) == expected
+
+
+@pytest.mark.parametrize(
+    "molecule,expected",
+    [
+        ("HOH", ("H", "O", "H")),
+        ("CRnCaSiRnBFAr", ("C", "Rn", "Ca", "Si", "Rn", "B", "F", "Ar")),
+        ("e", ("e",)),
+        ("H2O", ("H", "2", "O")),
+    ]
+)
+def test_tokenize_molecule(molecule: str, expected: tuple[str, ...]):
+    assert tokenize_molecule(molecule) == expected
+
+
+@pytest.mark.parametrize(
+    "atom_replacements,target_molecule,expected",
+    [
+        ({"e": ["H", "O"], "H": ["HO", "OH"], "O": ["HH"]}, "HOHOHO", 6),
+        ({"e": ["HF", "NAl"], "Al": ["ThF", "ThRnFAr"], "F": ["CaF", "PMg"], "Ca": ["CaCa"]}, "NThRnCaCaFAr", 4),
+        ({"e": ["HF"], "F": ["CaF"]}, "HCaCaCaF", 4),
+    ]
+)
+def test_reduce_to_electron(atom_replacements: dict[str, list[str]], target_molecule: str, expected: int):
+    assert reduce_to_electron(atom_replacements, target_molecule) == expected
+
+
+def test_reduce_to_electron_impossible():
+    with pytest.raises(ValueError):
+        reduce_to_electron({"e": ["HF"], "F": ["CaF"]}, "HCaO")
+    with pytest.raises(ValueError):
+        reduce_to_electron({"e": ["H", "O"], "H": ["HO", "OH"], "O": ["HH"]}, "HOHOHOHOHO", max_states=10)
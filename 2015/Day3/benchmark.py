@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+--- Day 3: Perfectly Spherical Houses in a Vacuum ---
+Benchmark comparing counting the distinct houses visited by walking the path one `Vector` object at a time,
+against positions represented as complex numbers, and against positions packed into integers
+and accumulated by `itertools.accumulate`.
+
+Uses the puzzle input if present, and a randomly generated string of 10^7 instructions.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import itertools
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    count_locations_visited
+)
+from common.coordinates import Vector
+
+
+def generate_instructions(n_steps: int=10 ** 7, seed: int=2015) -> str:
+    """Generate a random string of arrows, like the puzzle input"""
+    rng = random.Random(seed)
+    return "".join(rng.choices("^v<>", k=n_steps))
+
+
+def count_by_vectors(instructions: str) -> int:
+    """Reference implementation which creates a new `Vector` for every step"""
+    directions: dict[str, Vector] = {'^': Vector(0, 1), 'v': Vector(0, -1), '>': Vector(1, 0), '<': Vector(-1, 0)}
+    location = Vector(0, 0)
+    visited: set[Vector] = {location}
+    for char in instructions:
+        location += directions[char]
+        visited.add(location)
+    return len(visited)
+
+
+def count_by_complex_numbers(instructions: str) -> int:
+    directions: dict[str, complex] = {'^': 1j, 'v': -1j, '>': 1, '<': -1}
+    return len(set(itertools.accumulate(map(directions.__getitem__, instructions), initial=0j)))
+
+
+def main():
+    implementations: dict[str, Callable[[str], int]] = {
+        "Vector objects": count_by_vectors,
+        "Complex numbers": count_by_complex_numbers,
+        "Packed integers": count_locations_visited,
+    }
+
+    instruction_strings = [generate_instructions()]
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            instruction_strings.insert(0, file.read().strip())
+    else:
+        print("No puzzle input found, so only using randomly generated instructions")
+
+    for instructions in instruction_strings:
+        results: dict[str, int] = {}
+        for name, implementation in implementations.items():
+            t_start = perf_counter()
+            results[name] = implementation(instructions)
+            t_stop = perf_counter()
+            print(f"{name}: {results[name]} houses visited in {len(instructions)} steps "
+                  f"in {(t_stop - t_start) * 1000:.1f} milliseconds")
+        assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
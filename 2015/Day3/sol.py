@@ -8,43 +8,28 @@ Part 1: Count distinct points visited by a pair of paths in a 2D grid
 Commentary
 Today's puzzle can be considered an extension of the ideas from 2015 Day 1 into 2-dimensional space
 Useful ideas: Customizing loops (different starting point, step size); use of `set` type to get unique values
+Locations are packed into integers by the shared coordinates module, so that the path is walked as a running sum
+of integers and the set of locations visited holds integers rather than `Vector` objects.
 """
 import os
-from dataclasses import dataclass
-from collections.abc import Iterator
+import sys
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
 
+from common.coordinates import walk_arrows
 
-@dataclass(frozen=True)
-class Vector:
-    i: int
-    j: int
 
-    def __add__(self, other):
-        return Vector(self.i + other.i, self.j + other.j)
-
-    def __sub__(self, other):
-        return Vector(self.i - other.i, self.j - other.j)
-
-
-def generate_travel_path(instructions: str) -> Iterator[Vector]:
-    directions: dict[str, Vector] = {
-        '^': Vector(0,1),
-        'v': Vector(0,-1),
-        '>': Vector(1,0),
-        '<': Vector(-1,0),
-    }
-
-    location: Vector = Vector(0,0)
-    yield location
-    for char in instructions:
-        location += directions[char]
-        yield location
+def count_locations_visited(*instructions: str) -> int:
+    """Count the distinct locations visited by agents following each string of instructions from the origin"""
+    visited: set[int] = set()
+    for agent_instructions in instructions:
+        visited.update(walk_arrows(agent_instructions))
+    return len(visited)
 
 
 def solution_part_1(instructions: str):
-    num_distinct_locations_visited: int = len(set(generate_travel_path(instructions)))
+    num_distinct_locations_visited: int = count_locations_visited(instructions)
     print(f"Part 1: The number of distinct locations visited is {num_distinct_locations_visited}")
 
 
@@ -52,10 +37,8 @@ def solution_part_2(instructions: str):
     """Part 2: Distinct locations visited by two agents with same starting location
     One agent follows instructions with odd index and the other follows instructions with even index
     """
-    houses_santa_visits = set(generate_travel_path(instructions[::2]))
-    houses_robo_santa_visits = set(generate_travel_path(instructions[1::2]))
-    houses_visited = houses_santa_visits | houses_robo_santa_visits
-    print(f"Part 2: The number of distinct locations visited is {len(houses_visited)}")
+    num_houses_visited = count_locations_visited(instructions[::2], instructions[1::2])
+    print(f"Part 2: The number of distinct locations visited is {num_houses_visited}")
 
 
 def main():
@@ -0,0 +1,18 @@
+"""Testing functions for 2015 Day 3
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import pytest
+from sol import count_locations_visited
+
+
+@pytest.mark.parametrize("instructions,expected", [(">", 2), ("^>v<", 4), ("^v^v^v^v^v", 2)])
+def test_count_locations_visited_part_1(instructions: str, expected: int):
+    assert count_locations_visited(instructions) == expected
+
+
+@pytest.mark.parametrize("instructions,expected", [("^v", 3), ("^>v<", 3), ("^v^v^v^v^v", 11)])
+def test_count_locations_visited_part_2(instructions: str, expected: int):
+    """Santa and Robo-Santa take turns following the instructions"""
+    assert count_locations_visited(instructions[::2], instructions[1::2]) == expected
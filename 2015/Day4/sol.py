@@ -14,39 +14,129 @@ References
 - https://www.geeksforgeeks.org/python/md5-hash-python/
 - https://en.wikipedia.org/wiki/Cryptographic_nonce
 - https://cryptopals.com/
+- https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
+- https://docs.python.org/3/library/multiprocessing.html#shared-ctypes-objects
+- https://docs.python.org/3/library/argparse.html
 """
 import os
-import hashlib
+import sys
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+import argparse
+import multiprocessing
 
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
 
+from common.hashing import INDEX_LIMIT, generate_valid_md5_digests
+
+# Exclusive upper bound on the nonce search space
+NONCE_LIMIT: int = INDEX_LIMIT
+# Number of consecutive nonces assigned to a worker process at a time
+CHUNK_SIZE: int = 1 << 16
+# Number of nonces a worker checks between polls of the shared upper bound
+POLL_INTERVAL: int = 1 << 10
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="number of worker processes used to search the nonce space (default: 1, i.e. search sequentially)"
+    )
+    args = parser.parse_args(argv)
 
-def main():
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
         secret_key = file.read()
 
-    print(f"Part 1: The answer is {find_smallest_valid_nonce(secret_key, 5)}")
-    print(f"Part 2: The answer is {find_smallest_valid_nonce(secret_key, 6)}")
+    print(f"Part 1: The answer is {find_smallest_valid_nonce(secret_key, 5, workers=args.workers)}")
+    print(f"Part 2: The answer is {find_smallest_valid_nonce(secret_key, 6, workers=args.workers)}")
 
 
-def find_smallest_valid_nonce(key: str, difficulty: int) -> int:
+def find_smallest_valid_nonce(key: str, difficulty: int, workers: int=1) -> int:
     """Returns the lowest positive integer which, when concatenated with the input key,
     yields an MD5 hash with a certain number of leading zeroes (the `difficulty`) when represented in hexadecimal.
     The 128-bit (16-byte) MD5 hashes (also termed message digests) are typically represented as a sequence of 32 hexadecimal digits.
     An arbitrary upper bound is used for the size of the search space to prevent the hypothetical risk of an infinite loop
+    With `workers` greater than 1, the search is sharded across a pool of processes (see `parallel_find_smallest_valid_nonce`)
     """
     if not (isinstance(difficulty, int) and 0 <= difficulty <= 32):
         raise ValueError("Difficulty must be an integer between 0 and 32")
+    if not (isinstance(workers, int) and workers >= 1):
+        raise ValueError("Number of workers must be a positive integer")
     elif difficulty == 0:
         return 0
+    elif workers > 1:
+        return parallel_find_smallest_valid_nonce(key, difficulty, workers)
+
+    for nonce, _ in generate_valid_md5_digests(key, difficulty, start=1, stop=NONCE_LIMIT):
+        return nonce
+
+
+def parallel_find_smallest_valid_nonce(key: str, difficulty: int, workers: int, chunk_size: int=CHUNK_SIZE) -> int | None:
+    """Search for the smallest valid nonce using a pool of worker processes.
+
+    The nonce space is split into consecutive chunks of `chunk_size` nonces, which are handed out to the workers
+    in increasing order, so that the chunks being searched at any one time are interleaved across the pool.
+    Since chunks may complete out of order, the first valid nonce found is not necessarily the smallest.
+    Instead, the smallest valid nonce found so far is an upper bound on the answer, which becomes proven once
+    every chunk starting below it has been searched.
+
+    Early cancellation protocol:
+    - The upper bound is published to the workers through a shared integer, which they poll periodically,
+      stopping as soon as they reach it, since the nonces beyond it cannot improve on the answer.
+    - No further chunks are submitted past the upper bound, and queued chunks lying wholly above it are cancelled.
+    - The search ends when no chunks remain in flight, at which point the upper bound is the answer.
+    """
+    upper_bound = multiprocessing.Value('q', NONCE_LIMIT, lock=False)
+    best: int = NONCE_LIMIT
+    # Map each chunk in flight to the first nonce it covers
+    in_flight: dict[Future, int] = {}
+    next_start: int = 1
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(upper_bound,)) as executor:
+        while True:
+            # Keep a small backlog of queued chunks so that workers never sit idle between chunks
+            while len(in_flight) < 2 * workers and next_start < best:
+                next_stop = min(next_start + chunk_size, best)
+                future = executor.submit(_search_chunk, key, difficulty, next_start, next_stop)
+                in_flight[future] = next_start
+                next_start = next_stop
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                del in_flight[future]
+                nonce = future.result()
+                if nonce is not None and nonce < best:
+                    best = upper_bound.value = nonce
+            # Drop queued chunks which can no longer contain the answer
+            for future, start in list(in_flight.items()):
+                if start >= best and future.cancel():
+                    del in_flight[future]
+
+    return best if best < NONCE_LIMIT else None
+
+
+# Upper bound shared between the parent process and the pool of worker processes
+_upper_bound = None
+
+
+def _init_worker(upper_bound) -> None:
+    """Store the shared upper bound as a global in each worker process, since it cannot be pickled as a task argument"""
+    global _upper_bound
+    _upper_bound = upper_bound
+
 
-    for i in range(1, 1 << 32):
-        message = key + str(i)
-        md5_hash = hashlib.md5(message.encode())
-        message_digest = md5_hash.hexdigest()
-        if message_digest.startswith("0" * difficulty):
-            return i
+def _search_chunk(key: str, difficulty: int, start: int, stop: int) -> int | None:
+    """Return the smallest valid nonce in the range [start, stop), or None if there is none below the shared upper bound"""
+    for sub_start in range(start, stop, POLL_INTERVAL):
+        if sub_start >= _upper_bound.value:
+            return None
+        for nonce, _ in generate_valid_md5_digests(key, difficulty, sub_start, min(sub_start + POLL_INTERVAL, stop)):
+            return nonce
+    return None
 
 
 if __name__ == "__main__":
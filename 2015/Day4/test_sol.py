@@ -4,7 +4,7 @@ References
 - https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
 """
 import pytest
-from sol import find_smallest_valid_nonce
+from sol import find_smallest_valid_nonce, parallel_find_smallest_valid_nonce
 
 
 @pytest.mark.parametrize(
@@ -16,3 +16,20 @@ from sol import find_smallest_valid_nonce
 )
 def test_find_smallest_valid_nonce(key: str, difficulty: int, expected: int):
     assert find_smallest_valid_nonce(key, difficulty) == expected
+
+
+@pytest.mark.parametrize(
+    "key,difficulty,workers,chunk_size",
+    [
+        ("abcdef", 3, 2, 64),
+        ("abcdef", 4, 3, 1000),
+        ("pqrstuv", 4, 4, 1 << 10),
+    ]
+)
+def test_parallel_find_smallest_valid_nonce(key: str, difficulty: int, workers: int, chunk_size: int):
+    expected = find_smallest_valid_nonce(key, difficulty)
+    assert parallel_find_smallest_valid_nonce(key, difficulty, workers, chunk_size) == expected
+
+
+def test_find_smallest_valid_nonce_with_workers():
+    assert find_smallest_valid_nonce("abcdef", 5, workers=2) == 609043
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+--- Day 6: Probably a Fire Hazard ---
+Benchmark comparing the elementwise callback implementation of the light grid
+against applying each instruction as a slice operation on whole rectangles, either of the full grid
+or of the coordinate compressed grid, with both the NumPy and the pure Python list backends.
+
+Uses the puzzle input if present, otherwise a randomly generated list of instructions on a 1000x1000 grid.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    np,
+    solve_with_elementwise_operations,
+    solve_with_rectangle_operations,
+    solve_with_coordinate_compression
+)
+
+
+def generate_instructions(n_instructions: int=300, n_rows: int=1000, n_cols: int=1000, seed: int=2015) -> list[str]:
+    """Generate random instructions in the format of the puzzle input"""
+    rng = random.Random(seed)
+    instructions: list[str] = []
+    for _ in range(n_instructions):
+        op_name = rng.choice(["turn on", "turn off", "toggle"])
+        start_i, end_i = sorted(rng.randrange(n_rows) for _ in range(2))
+        start_j, end_j = sorted(rng.randrange(n_cols) for _ in range(2))
+        instructions.append(f"{op_name} {start_i},{start_j} through {end_i},{end_j}")
+    return instructions
+
+
+def main():
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            instructions: list[str] = [line for line in file]
+    else:
+        print("No puzzle input found, so using randomly generated instructions instead")
+        instructions = generate_instructions()
+
+    implementations: dict[str, Callable[[list[str]], tuple[int, int]]] = {
+        "Elementwise callbacks": solve_with_elementwise_operations,
+        "Rectangle slices (lists)": lambda instructions: solve_with_rectangle_operations(instructions, use_numpy=False),
+    }
+    if np is not None:
+        implementations["Rectangle slices (NumPy)"] = lambda instructions: solve_with_rectangle_operations(instructions, use_numpy=True)
+    implementations["Coordinate compression (lists)"] = lambda instructions: solve_with_coordinate_compression(instructions, use_numpy=False)
+    if np is not None:
+        implementations["Coordinate compression (NumPy)"] = lambda instructions: solve_with_coordinate_compression(instructions, use_numpy=True)
+
+    results: dict[str, tuple[int, int]] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(instructions)
+        t_stop = perf_counter()
+        print(f"{name}: {results[name]} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
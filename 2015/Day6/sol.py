@@ -11,11 +11,20 @@ This would depend on the hypothetical wider context within which the puzzle/proj
 I find the disconnect in part 2 between the phrases 'turn on', turn off', and 'toggle' and their
 implementation meanings ('turn up', 'turn down', and 'turn up twice') somewhat irksome
 due the naming confusion/unintuitive behaviour it would cause in a real setting.
+
+References
+- https://numpy.org/doc/stable/user/basics.indexing.html#slicing-and-striding
+- https://docs.python.org/3/reference/datamodel.html#slice-objects
 """
 from __future__ import annotations
 from collections.abc import Callable
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 DIRPATH = os.path.dirname(__file__)
 
@@ -53,6 +62,101 @@ class LightGrid:
         return sum(sum(row) for row in self.state)
 
 
+class RectangleLightGrid:
+    """2D array of integers, representing the state of a light grid, with the same meaning as for `LightGrid`.
+    Rather than calling a function for each light, each operation is applied to a whole rectangle of lights
+    at once as a slice operation, on a 2D NumPy array if available, otherwise on slices of a list of lists.
+    """
+    def __init__(self, n_rows: int=1000, n_cols: int=1000, use_numpy: bool | None=None):
+        """Create a RectangleLightGrid of the specified size. The lights all start turned off.
+        By default, NumPy is used as the array backend whenever it can be imported.
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.use_numpy: bool = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy:
+            self.state = np.zeros((n_rows, n_cols), dtype=np.int64)
+        else:
+            self.state: list[list[int]] = [[0] * n_cols for _ in range(n_rows)]
+
+    def set_brightness(self, brightness: int, start: tuple[int, int], end: tuple[int, int]):
+        if self.use_numpy:
+            self.state[start[0]:end[0]+1, start[1]:end[1]+1] = brightness
+            return
+        values = [brightness] * (end[1] - start[1] + 1)
+        for row in self.state[start[0]:end[0]+1]:
+            row[start[1]:end[1]+1] = values
+
+    def toggle(self, start: tuple[int, int], end: tuple[int, int]):
+        """Switch lights which are on (1) to off (0), and vice versa"""
+        if self.use_numpy:
+            self.state[start[0]:end[0]+1, start[1]:end[1]+1] ^= 1
+            return
+        for row in self.state[start[0]:end[0]+1]:
+            row[start[1]:end[1]+1] = [1 - value for value in row[start[1]:end[1]+1]]
+
+    def increase_brightness(self, brightness: int, start: tuple[int, int], end: tuple[int, int]):
+        if self.use_numpy:
+            self.state[start[0]:end[0]+1, start[1]:end[1]+1] += brightness
+            return
+        for row in self.state[start[0]:end[0]+1]:
+            row[start[1]:end[1]+1] = [value + brightness for value in row[start[1]:end[1]+1]]
+
+    def decrease_brightness(self, brightness: int, start: tuple[int, int], end: tuple[int, int]):
+        """Decrease the brightness of the lights in a rectangle, to a minimum of zero"""
+        if self.use_numpy:
+            rectangle = self.state[start[0]:end[0]+1, start[1]:end[1]+1]
+            np.maximum(rectangle - brightness, 0, out=rectangle)
+            return
+        for row in self.state[start[0]:end[0]+1]:
+            row[start[1]:end[1]+1] = [max(value - brightness, 0) for value in row[start[1]:end[1]+1]]
+
+    def total_brightness(self) -> int:
+        if self.use_numpy:
+            return int(self.state.sum())
+        return sum(sum(row) for row in self.state)
+
+    def weighted_total_brightness(self, row_weights: list[int], col_weights: list[int]) -> int:
+        """Total brightness where each element stands for a block of lights of size given by its row and column weights"""
+        if self.use_numpy:
+            return int(np.asarray(row_weights, dtype=np.int64) @ self.state @ np.asarray(col_weights, dtype=np.int64))
+        return sum(
+            row_weight * sum(value * col_weight for value, col_weight in zip(row, col_weights))
+            for row, row_weight in zip(self.state, row_weights)
+        )
+
+
+# Elementwise operations on a light grid, called for each light in a rectangle
+ELEMENTWISE_OPERATIONS: dict[str, dict[str, Callable[[LightGrid, int, int], None]]] = {
+    "Part 1": {
+        "turn on": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 1, i, j),
+        "turn off": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 0, i, j),
+        "toggle": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 1 - light_grid.state[i][j], i, j)
+    },
+    "Part 2": {
+        "turn on": lambda light_grid, i, j : LightGrid.increase_brightness_single(light_grid, 1, i, j),
+        "turn off": lambda light_grid, i, j : LightGrid.decrease_brightness_single(light_grid, 1, i, j),
+        "toggle": lambda light_grid, i, j : LightGrid.increase_brightness_single(light_grid, 2, i, j)
+    }
+}
+
+# Rectangle operations on a light grid, given the coordinates of opposite corners
+RectangleOperation = Callable[[RectangleLightGrid, tuple[int, int], tuple[int, int]], None]
+
+RECTANGLE_OPERATIONS: dict[str, dict[str, RectangleOperation]] = {
+    "Part 1": {
+        "turn on": lambda light_grid, start, end: light_grid.set_brightness(1, start, end),
+        "turn off": lambda light_grid, start, end: light_grid.set_brightness(0, start, end),
+        "toggle": lambda light_grid, start, end: light_grid.toggle(start, end)
+    },
+    "Part 2": {
+        "turn on": lambda light_grid, start, end: light_grid.increase_brightness(1, start, end),
+        "turn off": lambda light_grid, start, end: light_grid.decrease_brightness(1, start, end),
+        "toggle": lambda light_grid, start, end: light_grid.increase_brightness(2, start, end)
+    }
+}
+
+
 def parse_array_switch_instruction(instruction: str) -> tuple[str, tuple[int, int], tuple[int, int]]:
     # Separate string components
     rest, _, end_s = instruction.partition(" through ")
@@ -71,28 +175,72 @@ def main():
     with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
         instructions: list[str] = [line for line in file]
 
-    operations: dict[str, dict[str, Callable[[LightGrid, int, int]]]] = {
-        "Part 1": {
-            "turn on": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 1, i, j),
-            "turn off": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 0, i, j),
-            "toggle": lambda light_grid, i, j : LightGrid.set_brightness_single(light_grid, 1 - light_grid.state[i][j], i, j)
-        },
-        "Part 2": {
-            "turn on": lambda light_grid, i, j : LightGrid.increase_brightness_single(light_grid, 1, i, j),
-            "turn off": lambda light_grid, i, j : LightGrid.decrease_brightness_single(light_grid, 1, i, j),
-            "toggle": lambda light_grid, i, j : LightGrid.increase_brightness_single(light_grid, 2, i, j)
-        }
+    part_1_answer, part_2_answer = solve_with_rectangle_operations(instructions)
+    print(f"Part 1: After the light display, {part_1_answer} lights are lit.")
+    print(f"Part 2: After the light display, the total brightness is {part_2_answer}.")
+
+
+def solve_with_rectangle_operations(instructions: list[str], use_numpy: bool | None=None) -> tuple[int, int]:
+    """Follow the instructions on a RectangleLightGrid for each part, returning the total brightness for each part"""
+    light_grids = {"Part 1": RectangleLightGrid(use_numpy=use_numpy), "Part 2": RectangleLightGrid(use_numpy=use_numpy)}
+
+    for instruction in instructions:
+        op_name, start_coords, end_coords = parse_array_switch_instruction(instruction)
+        for part, light_grid in light_grids.items():
+            RECTANGLE_OPERATIONS[part][op_name](light_grid, start_coords, end_coords)
+
+    return light_grids["Part 1"].total_brightness(), light_grids["Part 2"].total_brightness()
+
+
+def solve_with_coordinate_compression(instructions: list[str], use_numpy: bool | None=None) -> tuple[int, int]:
+    """Follow the instructions for each part without materialising the full light grid, returning the total brightness for each part
+
+    The rectangle boundaries in the instructions split each axis into intervals of lights which are always
+    operated on together, so every light in a block formed by a row interval and a column interval has the same
+    brightness throughout. The instructions are applied to a RectangleLightGrid with one element per block,
+    whose size scales with the number of instructions rather than the grid's area,
+    and the total brightness is weighted by the number of lights in each block.
+    """
+    parsed_instructions = [parse_array_switch_instruction(instruction) for instruction in instructions]
+
+    # Sorted breakpoints, at which a block starts or ends, along each axis
+    row_breakpoints: list[int] = sorted({i for _, start, end in parsed_instructions for i in (start[0], end[0]+1)})
+    col_breakpoints: list[int] = sorted({j for _, start, end in parsed_instructions for j in (start[1], end[1]+1)})
+    row_index: dict[int, int] = {i: idx for idx, i in enumerate(row_breakpoints)}
+    col_index: dict[int, int] = {j: idx for idx, j in enumerate(col_breakpoints)}
+    row_weights: list[int] = [b - a for a, b in zip(row_breakpoints, row_breakpoints[1:])]
+    col_weights: list[int] = [b - a for a, b in zip(col_breakpoints, col_breakpoints[1:])]
+
+    light_grids = {
+        part: RectangleLightGrid(len(row_weights), len(col_weights), use_numpy=use_numpy)
+        for part in RECTANGLE_OPERATIONS
     }
+    for op_name, start_coords, end_coords in parsed_instructions:
+        # Convert the inclusive range of lights to the inclusive range of blocks it covers
+        block_start = row_index[start_coords[0]], col_index[start_coords[1]]
+        block_end = row_index[end_coords[0]+1] - 1, col_index[end_coords[1]+1] - 1
+        for part, light_grid in light_grids.items():
+            RECTANGLE_OPERATIONS[part][op_name](light_grid, block_start, block_end)
+
+    return tuple(
+        light_grids[part].weighted_total_brightness(row_weights, col_weights)
+        for part in ("Part 1", "Part 2")
+    )
+
+
+def solve_with_elementwise_operations(instructions: list[str]) -> tuple[int, int]:
+    """Follow the instructions on a LightGrid for each part, calling an operation per light,
+    returning the total brightness for each part
+    """
     light_grids = {"Part 1": LightGrid(), "Part 2": LightGrid()}
 
     for instruction in instructions:
         op_name, start_coords, end_coords = parse_array_switch_instruction(instruction)
         for part, light_grid in light_grids.items():
-            operation = operations[part][op_name]
+            operation = ELEMENTWISE_OPERATIONS[part][op_name]
             light_grid.array_operation(operation, start_coords, end_coords)
 
-    print(f"Part 1: After the light display, {light_grids['Part 1'].total_brightness()} lights are lit.")
-    print(f"Part 2: After the light display, the total brightness is {light_grids['Part 2'].total_brightness()}.")
+    return light_grids["Part 1"].total_brightness(), light_grids["Part 2"].total_brightness()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""Testing functions for 2015 Day 6
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://docs.pytest.org/en/stable/how-to/skipping.html
+"""
+import random
+import pytest
+from sol import (
+    np,
+    LightGrid,
+    RectangleLightGrid,
+    ELEMENTWISE_OPERATIONS,
+    RECTANGLE_OPERATIONS,
+    parse_array_switch_instruction,
+    solve_with_rectangle_operations,
+    solve_with_coordinate_compression,
+    solve_with_elementwise_operations
+)
+
+BACKENDS = [False] + ([True] if np is not None else [])
+requires_numpy = pytest.mark.skipif(np is None, reason="NumPy is not installed")
+
+def random_instructions(rng: random.Random, n_instructions: int, n_rows: int, n_cols: int, max_size: int | None=None) -> list[str]:
+    """Generate random instructions in the format of the puzzle input, optionally limiting the size of each rectangle"""
+    instructions: list[str] = []
+    for _ in range(n_instructions):
+        start_i, start_j = rng.randrange(n_rows), rng.randrange(n_cols)
+        end_i = rng.randrange(start_i, min(n_rows, start_i + (max_size or n_rows)))
+        end_j = rng.randrange(start_j, min(n_cols, start_j + (max_size or n_cols)))
+        op_name = rng.choice(["turn on", "turn off", "toggle"])
+        instructions.append(f"{op_name} {start_i},{start_j} through {end_i},{end_j}")
+    return instructions
+
+
+@pytest.mark.parametrize(
+    "instruction,expected",
+    [
+        ("turn on 0,0 through 999,999", ("turn on", (0, 0), (999, 999))),
+        ("toggle 0,0 through 999,0", ("toggle", (0, 0), (999, 0))),
+        ("turn off 499,499 through 500,500\n", ("turn off", (499, 499), (500, 500))),
+    ]
+)
+def test_parse_array_switch_instruction(instruction: str, expected: tuple[str, tuple[int, int], tuple[int, int]]):
+    assert parse_array_switch_instruction(instruction) == expected
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("part", RECTANGLE_OPERATIONS)
+@pytest.mark.parametrize("seed", range(10))
+def test_rectangle_light_grid_matches_light_grid(seed: int, part: str, use_numpy: bool):
+    """Apply random instructions to both grids, checking every light after each instruction"""
+    rng = random.Random(seed)
+    n_rows, n_cols = rng.randint(1, 12), rng.randint(1, 12)
+    light_grid = LightGrid(n_rows, n_cols)
+    rectangle_light_grid = RectangleLightGrid(n_rows, n_cols, use_numpy=use_numpy)
+    assert rectangle_light_grid.use_numpy == use_numpy
+    for instruction in random_instructions(rng, 40, n_rows, n_cols):
+        op_name, start, end = parse_array_switch_instruction(instruction)
+        light_grid.array_operation(ELEMENTWISE_OPERATIONS[part][op_name], start, end)
+        RECTANGLE_OPERATIONS[part][op_name](rectangle_light_grid, start, end)
+        state = rectangle_light_grid.state.tolist() if use_numpy else rectangle_light_grid.state
+        assert state == light_grid.state
+    assert rectangle_light_grid.total_brightness() == light_grid.total_brightness()
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_weighted_total_brightness(use_numpy: bool):
+    rectangle_light_grid = RectangleLightGrid(2, 3, use_numpy=use_numpy)
+    rectangle_light_grid.increase_brightness(1, (0, 0), (1, 2))
+    rectangle_light_grid.increase_brightness(2, (1, 1), (1, 1))
+    assert rectangle_light_grid.weighted_total_brightness([1, 1], [1, 1, 1]) == 8
+    assert rectangle_light_grid.weighted_total_brightness([10, 100], [1, 2, 3]) == 60 + 600 + 2 * 200
+
+
+@requires_numpy
+def test_rectangle_light_grid_default_backend():
+    assert RectangleLightGrid(2, 2).use_numpy
+
+
+@pytest.mark.skipif(np is not None, reason="NumPy is installed")
+def test_rectangle_light_grid_without_numpy():
+    assert not RectangleLightGrid(2, 2).use_numpy
+    with pytest.raises(ImportError):
+        RectangleLightGrid(2, 2, use_numpy=True)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("seed", range(3))
+def test_solve_with_rectangle_operations(seed: int, use_numpy: bool):
+    """Compare with the elementwise solver on the full grid, with small rectangles so that the callbacks are quick"""
+    instructions = random_instructions(random.Random(seed), 30, 1000, 1000, max_size=60)
+    assert solve_with_rectangle_operations(instructions, use_numpy) == solve_with_elementwise_operations(instructions)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("seed", range(10))
+def test_solve_with_coordinate_compression(seed: int, use_numpy: bool):
+    """Compare with the full grid, on instructions whose rectangles often share or abut their boundaries"""
+    rng = random.Random(seed)
+    instructions = random_instructions(rng, rng.randint(1, 20), 1000, 1000)
+    # Corners drawn from a few coordinates, including both ends of each axis
+    coordinates = sorted(rng.sample(range(1, 999), 6) + [0, 999])
+    for _ in range(20):
+        (start_i, end_i), (start_j, end_j) = sorted(rng.sample(coordinates, 2)), sorted(rng.sample(coordinates, 2))
+        instructions.append(f"{rng.choice(['turn on', 'turn off', 'toggle'])} {start_i},{start_j} through {end_i},{end_j}")
+    rng.shuffle(instructions)
+    assert solve_with_coordinate_compression(instructions, use_numpy) == solve_with_rectangle_operations(instructions, use_numpy)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_solve_with_coordinate_compression_large_coordinates(use_numpy: bool):
+    """The compressed grid only depends on the number of instructions, so coordinates can reach 10**6"""
+    instructions = [
+        "turn on 0,0 through 999999,999999",
+        "toggle 0,0 through 999999,0",
+        "turn off 499999,499999 through 500000,500000",
+        "turn off 499999,499999 through 500000,500000",
+        "toggle 250000,1 through 250000,999999",
+    ]
+    lights = 10**12
+    part_1 = lights - 10**6 - 4 - (10**6 - 1)
+    # Turning off the block a second time leaves its brightness at zero
+    part_2 = lights + 2 * 10**6 - 4 + 2 * (10**6 - 1)
+    assert solve_with_coordinate_compression(instructions, use_numpy) == (part_1, part_2)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+--- Day 7: Some Assembly Required ---
+Benchmark comparing the recursive resolution of the signals of all wires with a shared cache against
+compiling the circuit into a topologically ordered gate array and evaluating it in a single pass.
+
+Uses the puzzle input if present, otherwise a randomly generated circuit.
+Then compares answering what-if queries, each overriding a random wire, by evaluating the whole circuit again
+against incrementally recomputing the gates downstream of the overridden wire.
+Also evaluates a generated circuit of 10^6 gates chained one after another, which is far too deep for recursion.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import DIRPATH, calculate_signal, compile_circuit, IncrementalCircuit
+
+
+def wire_name(k: int) -> str:
+    """Return a name of lowercase letters for the wire numbered k, in the style of the puzzle input"""
+    name = ""
+    k += 1
+    while k:
+        k, remainder = divmod(k - 1, 26)
+        name = chr(ord('a') + remainder) + name
+    return name
+
+
+def generate_instructions(n_gates: int=100_000, depth: int | None=None, seed: int=2015) -> dict[str, str]:
+    """Generate random wire instructions, as a dictionary from target wire to source, where each gate takes its inputs
+    from randomly chosen earlier wires, or from the previous wire only if `depth` is set (for a chain of that depth).
+    Wires are listed in a shuffled order, as in the puzzle input.
+    """
+    rng = random.Random(seed)
+    names: list[str] = [wire_name(k) for k in range(n_gates)]
+    instructions: dict[str, str] = {}
+    for k, target in enumerate(names):
+        if k < 2:
+            instructions[target] = str(rng.randrange(1 << 16))
+            continue
+        x = names[k - 1] if depth is not None else names[rng.randrange(k)]
+        y = names[rng.randrange(k)]
+        op = rng.choice(["WIRE", "NOT", "AND", "OR", "LSHIFT", "RSHIFT"])
+        match op:
+            case "WIRE": instructions[target] = x
+            case "NOT": instructions[target] = f"NOT {x}"
+            case "LSHIFT" | "RSHIFT": instructions[target] = f"{x} {op} {rng.randrange(16)}"
+            case _: instructions[target] = f"{x} {op} {y}"
+    shuffled = list(instructions.items())
+    rng.shuffle(shuffled)
+    return dict(shuffled)
+
+
+def recursive_signals(instructions: dict[str, str]) -> dict[str, int]:
+    """Return the signals provided to all wires, using `calculate_signal` with a shared cache"""
+    signals: dict[str, int] = {}
+    for wire in instructions:
+        calculate_signal(wire, signals, instructions)
+    return signals
+
+
+def compiled_signals(instructions: dict[str, str]) -> dict[str, int]:
+    """Return the signals provided to all wires, by compiling the circuit and evaluating it"""
+    circuit = compile_circuit(instructions)
+    return {wire: signal for wire, signal in zip(circuit.wires, circuit.evaluate()) if wire in instructions}
+
+
+def main():
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        instructions: dict[str, str] = {}
+        with open(input_path, 'r') as file:
+            for line in file:
+                source, _, target = line.strip().partition(" -> ")
+                instructions[target] = source
+    else:
+        print("No puzzle input found, so using a randomly generated circuit instead")
+        instructions = generate_instructions()
+
+    implementations: dict[str, Callable[[dict[str, str]], dict[str, int]]] = {
+        "Recursive with cache": recursive_signals,
+        "Compiled gate array": compiled_signals,
+    }
+
+    results: dict[str, dict[str, int]] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(instructions)
+        t_stop = perf_counter()
+        print(f"{name}: {len(results[name])} signals in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert all(signals == results["Compiled gate array"] for signals in results.values())
+
+    # Once compiled, the circuit can be evaluated again (e.g. with overrides) without parsing or sorting
+    circuit = compile_circuit(instructions)
+    t_start = perf_counter()
+    circuit.evaluate()
+    t_stop = perf_counter()
+    print(f"Evaluating the compiled circuit again: {len(circuit)} gates in {(t_stop - t_start) * 1000:.1f} milliseconds")
+
+    rng = random.Random(2015)
+    queries: list[tuple[str, int]] = [(rng.choice(list(instructions)), rng.randrange(1 << 16)) for _ in range(100)]
+    t_start = perf_counter()
+    full_results = [circuit.evaluate({wire: value}) for wire, value in queries]
+    t_stop = perf_counter()
+    print(f"What-if queries by full evaluation: {len(queries)} queries in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    incremental_circuit = IncrementalCircuit(circuit)
+    incremental_results: list[list[int]] = []
+    t_start = perf_counter()
+    for wire, value in queries:
+        incremental_circuit.override(wire, value)
+        incremental_results.append(list(incremental_circuit.signals))
+        incremental_circuit.remove_overrides([wire])
+    t_stop = perf_counter()
+    print(f"What-if queries by incremental recomputation: {len(queries)} queries in {(t_stop - t_start) * 1000:.1f} milliseconds "
+          f"(including copying the signals)")
+    assert full_results == incremental_results
+
+    n_gates = 10 ** 6
+    instructions = generate_instructions(n_gates, depth=n_gates)
+    t_start = perf_counter()
+    circuit = compile_circuit(instructions)
+    t_compiled = perf_counter()
+    signal = circuit.signal(wire_name(n_gates - 1))
+    t_stop = perf_counter()
+    print(f"Chain of {n_gates} gates: {signal}, compiled in {(t_compiled - t_start) * 1000:.1f} milliseconds "
+          f"and evaluated in {(t_stop - t_compiled) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
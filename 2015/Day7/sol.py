@@ -14,13 +14,25 @@ another way to incrementally populate a cache (dictionary) of known signals (wir
 would be using a while loop to repeated iterate over the list of circuit instructions
 and resolving/removing instructions which can be evaluated directly from literals and currently cached values.
 
+Better still, the instructions can be compiled once into an array of gates, indexed by integers and sorted into
+topological order (every gate after the gates providing its inputs), so that the whole circuit is evaluated
+in a single iterative pass, with no recursion and no repeated parsing of instruction strings.
+Keeping the signals and the dependents of each gate afterwards, overriding a wire only requires recomputing
+the gates downstream of it, in topological order, stopping wherever a recomputed signal turns out unchanged.
+
 References
 - http://inspiredpython.com/course/pattern-matching/mastering-structural-pattern-matching
 - https://docs.python.org/3/tutorial/controlflow.html#match-statements
 - [PEP 636 – Structural Pattern Matching: Tutorial](https://peps.python.org/pep-0636/)
 - [Raymond Hettinger's video on structural pattern matching](https://www.youtube.com/watch?v=ZTvwxXL37XI)
+- https://en.wikipedia.org/wiki/Topological_sorting#Kahn's_algorithm
+- https://docs.python.org/3/library/enum.html#enum.IntEnum
+- https://en.wikipedia.org/wiki/Incremental_computing
+- https://docs.python.org/3/library/heapq.html
 """
 import os
+import enum
+import heapq
 
 DIRPATH = os.path.dirname(__file__)
 
@@ -36,8 +48,10 @@ def main():
             source, _, target = line.strip().partition(" -> ")
             instructions[target] = source
 
-    part_1_answer = calculate_signal('a', {}, instructions)
-    part_2_answer = calculate_signal('a', {'b': part_1_answer}, instructions)
+    circuit = IncrementalCircuit(compile_circuit(instructions))
+    part_1_answer = circuit.signal('a')
+    circuit.override('b', part_1_answer)
+    part_2_answer = circuit.signal('a')
 
     print(f"Part 1: The signal provided to wire 'a' is {part_1_answer}")
     print(f"Part 2: After overriding wire 'b' to signal {part_1_answer} and resetting the wires, "
@@ -83,5 +97,241 @@ def calculate_signal(target: str, signals: dict[str, int], instructions: dict[st
     return signals[target]
 
 
+class Gate(enum.IntEnum):
+    """Operations of the compiled circuit, whose operands are the integer indexes of the gates providing their inputs"""
+    CONST = enum.auto() # Provide the integer literal `x`
+    WIRE = enum.auto() # Pass on the signal of gate `x`
+    NOT = enum.auto()
+    AND = enum.auto()
+    OR = enum.auto()
+    LSHIFT = enum.auto()
+    RSHIFT = enum.auto()
+
+
+# A compiled gate is an operation followed by two operands, which are gate indexes, or an integer literal for constants
+CompiledGate = tuple[Gate, int | None, int | None]
+
+
+class CompiledCircuit:
+    """A circuit compiled into a list of gates in topological order, so that every gate comes after its inputs.
+
+    Each wire and each distinct integer literal in the instructions is given a gate, whose position in the list
+    is its index. Signals are then calculated for all gates in a single pass over the list.
+    """
+    def __init__(self, wires: list[str], gates: list[CompiledGate]):
+        self.wires: list[str] = wires
+        self.gates: list[CompiledGate] = gates
+        self.index: dict[str, int] = {wire: k for k, wire in enumerate(wires)}
+
+    def __len__(self) -> int:
+        return len(self.gates)
+
+    def evaluate(self, overrides: dict[str, int] | None=None) -> list[int]:
+        """Return the signals provided to every gate, in order of gate index, after replacing the signals of
+        the overridden wires with the given values (the overridden wires keep their place in the order)
+        """
+        gates = self.gates
+        if overrides:
+            gates = list(gates)
+            for wire, value in overrides.items():
+                gates[self.index[wire]] = (Gate.CONST, value & ONES, None)
+
+        CONST, WIRE, NOT, AND, OR, LSHIFT = Gate.CONST, Gate.WIRE, Gate.NOT, Gate.AND, Gate.OR, Gate.LSHIFT
+        signals: list[int] = [0] * len(gates)
+        for k, (op, x, y) in enumerate(gates):
+            if op == WIRE:
+                signals[k] = signals[x]
+            elif op == AND:
+                signals[k] = signals[x] & signals[y]
+            elif op == OR:
+                signals[k] = signals[x] | signals[y]
+            elif op == LSHIFT:
+                signals[k] = (signals[x] << signals[y]) & ONES
+            elif op == NOT:
+                signals[k] = signals[x] ^ ONES
+            elif op == CONST:
+                signals[k] = x
+            else:
+                signals[k] = signals[x] >> signals[y]
+        return signals
+
+    def signal(self, wire: str, overrides: dict[str, int] | None=None) -> int:
+        """Return the 16-bit signal provided to the wire, optionally after overriding the signals of some wires"""
+        return self.evaluate(overrides)[self.index[wire]]
+
+
+def gate_signal(gate: CompiledGate, signals: list[int]) -> int:
+    """Return the signal output by a single compiled gate, given the signals of all gates before it"""
+    match gate:
+        case (Gate.CONST, x, _): return x
+        case (Gate.WIRE, x, _): return signals[x]
+        case (Gate.NOT, x, _): return signals[x] ^ ONES
+        case (Gate.AND, x, y): return signals[x] & signals[y]
+        case (Gate.OR, x, y): return signals[x] | signals[y]
+        case (Gate.LSHIFT, x, y): return (signals[x] << signals[y]) & ONES
+        case (Gate.RSHIFT, x, y): return signals[x] >> signals[y]
+        case _: raise ValueError(f"Could not evaluate gate {gate}")
+
+
+class IncrementalCircuit:
+    """A compiled circuit which keeps its signals up to date as the signals of wires are overridden and restored.
+
+    The signals of all gates are computed once, along with the dependents of each gate (the gates taking it as input).
+    When overrides change, only the gates downstream of the changed wires are recomputed, in topological order
+    using a heap of gate indexes, and the dependents of a gate are only visited if its signal actually changed.
+    """
+    def __init__(self, circuit: CompiledCircuit):
+        self.circuit: CompiledCircuit = circuit
+        # Gates currently in effect, with overridden wires replaced by constant gates
+        self.gates: list[CompiledGate] = list(circuit.gates)
+        self.overrides: dict[str, int] = {}
+        self.signals: list[int] = circuit.evaluate()
+        self.dependents: list[list[int]] = [[] for _ in circuit.gates]
+        for k, (op, x, y) in enumerate(circuit.gates):
+            if op != Gate.CONST:
+                self.dependents[x].append(k)
+                if y is not None:
+                    self.dependents[y].append(k)
+
+    def signal(self, wire: str) -> int:
+        """Return the current 16-bit signal provided to the wire"""
+        return self.signals[self.circuit.index[wire]]
+
+    def override(self, wire: str, value: int) -> set[str]:
+        """Override the signal of a wire, returning the set of wires whose signals changed as a result"""
+        return self.apply_overrides({wire: value})
+
+    def apply_overrides(self, overrides: dict[str, int]) -> set[str]:
+        """Override the signals of a batch of wires at once, returning the set of wires whose signals changed.
+        Wires downstream of several overridden wires are only recomputed once for the whole batch.
+        """
+        changed_gates: list[int] = []
+        for wire, value in overrides.items():
+            k = self.circuit.index[wire]
+            self.overrides[wire] = value & ONES
+            self.gates[k] = (Gate.CONST, value & ONES, None)
+            changed_gates.append(k)
+        return self._propagate(changed_gates)
+
+    def remove_overrides(self, wires: list[str] | None=None) -> set[str]:
+        """Restore the original instructions of some overridden wires (all of them by default),
+        returning the set of wires whose signals changed as a result
+        """
+        changed_gates: list[int] = []
+        for wire in list(self.overrides) if wires is None else wires:
+            if self.overrides.pop(wire, None) is not None:
+                k = self.circuit.index[wire]
+                self.gates[k] = self.circuit.gates[k]
+                changed_gates.append(k)
+        return self._propagate(changed_gates)
+
+    def _propagate(self, changed_gates: list[int]) -> set[str]:
+        """Recompute the signals of the given gates and of the gates downstream of them whose inputs changed,
+        returning the set of wires whose signals changed. Gates are taken in increasing order of index,
+        which is a topological order, so every gate is recomputed at most once, after all of its inputs.
+        """
+        gates, signals, dependents = self.gates, self.signals, self.dependents
+        queued: set[int] = set(changed_gates)
+        heap: list[int] = list(queued)
+        heapq.heapify(heap)
+        changed: set[str] = set()
+        while heap:
+            k = heapq.heappop(heap)
+            new_signal = gate_signal(gates[k], signals)
+            if new_signal == signals[k]:
+                continue
+            signals[k] = new_signal
+            changed.add(self.circuit.wires[k])
+            for dependent in dependents[k]:
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, dependent)
+        return changed
+
+
+def parse_instruction(source: str) -> tuple[Gate, list[str]]:
+    """Parse the source of a wire instruction into its operation and the names of its input wires or literals"""
+    match words := source.split(" "):
+        case [x]:
+            return Gate.WIRE, [x]
+        case ["NOT", x]:
+            return Gate.NOT, [x]
+        case [x, "AND" | "OR" | "LSHIFT" | "RSHIFT" as op, y]:
+            return Gate[op], [x, y]
+        case _:
+            raise ValueError(f"Could not parse instruction {' '.join(words)}")
+
+
+def compile_circuit(instructions: dict[str, str]) -> CompiledCircuit:
+    """Compile wire instructions, given as a dictionary from target wire to source, into a `CompiledCircuit`.
+
+    Each instruction is parsed once, then the wires are sorted into topological order using Kahn's algorithm,
+    which repeatedly takes a wire whose inputs have all been placed already, so circuits of any depth are compiled
+    iteratively. Raises ValueError if some wire has no instruction, or if the circuit has a cycle.
+    """
+    # Number the wires in the order given, followed by each distinct integer literal as it is first seen
+    names: list[str] = list(instructions)
+    node_ids: dict[str, int] = {name: node for node, name in enumerate(names)}
+    n_wires = len(names)
+    # Operation and input nodes of each wire, where -1 marks a missing second input.
+    # Flat lists of integers are used throughout, rather than a list per node, to keep large circuits compact.
+    ops: list[Gate] = []
+    x_inputs: list[int] = []
+    y_inputs: list[int] = []
+    for source in instructions.values():
+        op, operands = parse_instruction(source)
+        input_ids: list[int] = []
+        for name in operands:
+            node = node_ids.get(name)
+            if node is None:
+                if not name.isdigit():
+                    raise ValueError(f"No instruction provides a signal to wire {name}")
+                node = node_ids[name] = len(names)
+                names.append(name)
+            input_ids.append(node)
+        ops.append(op)
+        x_inputs.append(input_ids[0])
+        y_inputs.append(input_ids[1] if len(input_ids) > 1 else -1)
+
+    # The wires which take each node as an input, as a linked list of edges starting from `first_edge[node]`,
+    # and the number of inputs of each node not yet placed in the order, where integer literals have no inputs
+    first_edge: list[int] = [-1] * len(names)
+    next_edge: list[int] = []
+    edge_targets: list[int] = []
+    pending_inputs: list[int] = [0] * len(names)
+    for target in range(n_wires):
+        for node in (x_inputs[target], y_inputs[target]):
+            if node >= 0:
+                next_edge.append(first_edge[node])
+                first_edge[node] = len(edge_targets)
+                edge_targets.append(target)
+                pending_inputs[target] += 1
+
+    order: list[int] = [node for node, count in enumerate(pending_inputs) if count == 0]
+    # The order list doubles as the queue of Kahn's algorithm, read from the front
+    for node in order:
+        edge = first_edge[node]
+        while edge >= 0:
+            target = edge_targets[edge]
+            pending_inputs[target] -= 1
+            if pending_inputs[target] == 0:
+                order.append(target)
+            edge = next_edge[edge]
+    if len(order) < len(names):
+        raise ValueError("The circuit contains a cycle, so some signals are undefined")
+
+    position: list[int] = [0] * len(names)
+    for k, node in enumerate(order):
+        position[node] = k
+    gates: list[CompiledGate] = []
+    for node in order:
+        if node >= n_wires:
+            gates.append((Gate.CONST, int(names[node]) & ONES, None))
+        else:
+            y = y_inputs[node]
+            gates.append((ops[node], position[x_inputs[node]], position[y] if y >= 0 else None))
+    return CompiledCircuit([names[node] for node in order], gates)
+
+
 if __name__ == "__main__":
     main()
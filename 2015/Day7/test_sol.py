@@ -0,0 +1,210 @@
+"""Testing functions for 2015 Day 7
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import random
+import sys
+import pytest
+from sol import (
+    calculate_signal,
+    Gate,
+    compile_circuit,
+    IncrementalCircuit
+)
+
+EXAMPLE_INSTRUCTIONS: dict[str, str] = {
+    "x": "123",
+    "y": "456",
+    "d": "x AND y",
+    "e": "x OR y",
+    "f": "x LSHIFT 2",
+    "g": "y RSHIFT 2",
+    "h": "NOT x",
+    "i": "NOT y",
+}
+EXAMPLE_SIGNALS: dict[str, int] = {"d": 72, "e": 507, "f": 492, "g": 114, "h": 65412, "i": 65079, "x": 123, "y": 456}
+
+# A small circuit shaped like the puzzle input, where wire a depends on wire b, which is then overridden for part 2
+FEEDBACK_INSTRUCTIONS: dict[str, str] = {
+    "b": "14146",
+    "c": "0",
+    "q": "b RSHIFT 2",
+    "r": "b AND 3",
+    "s": "q OR r",
+    "t": "NOT s",
+    "u": "t LSHIFT c",
+    "a": "u AND 65535",
+    # Only the lowest bit of b reaches wire m, so overriding b can leave m (and everything after it) unchanged
+    "m": "b AND 1",
+    "n": "m OR 2",
+    "p": "n LSHIFT 1",
+}
+
+
+def signals_by_recursion(instructions: dict[str, str], overrides: dict[str, int] | None=None) -> dict[str, int]:
+    """Calculate every signal from scratch, with the overridden wires replaced by their values"""
+    instructions = instructions | {wire: str(value) for wire, value in (overrides or {}).items()}
+    signals: dict[str, int] = {}
+    return {wire: calculate_signal(wire, signals, instructions) for wire in instructions}
+
+
+def random_instructions(rng: random.Random, n_wires: int) -> dict[str, str]:
+    """Generate a random acyclic circuit, where each wire only takes inputs from earlier wires or literals"""
+    instructions: dict[str, str] = {}
+    for k in range(n_wires):
+        def operand() -> str:
+            return f"w{rng.randrange(k)}" if k and rng.random() < 0.8 else str(rng.randrange(1 << 16))
+        match rng.choice(["WIRE", "NOT", "AND", "OR", "LSHIFT", "RSHIFT"]) if k else "CONST":
+            case "CONST":
+                instructions[f"w{k}"] = str(rng.randrange(1 << 16))
+            case "WIRE":
+                instructions[f"w{k}"] = operand()
+            case "NOT":
+                instructions[f"w{k}"] = f"NOT {operand()}"
+            case "LSHIFT" | "RSHIFT" as op:
+                instructions[f"w{k}"] = f"{operand()} {op} {rng.randrange(16)}"
+            case op:
+                instructions[f"w{k}"] = f"{operand()} {op} {operand()}"
+    # Shuffle the instructions, so that they are not already in topological order
+    wires = list(instructions)
+    rng.shuffle(wires)
+    return {wire: instructions[wire] for wire in wires}
+
+
+def compiled_signals(instructions: dict[str, str], overrides: dict[str, int] | None=None) -> dict[str, int]:
+    circuit = compile_circuit(instructions)
+    signals = circuit.evaluate(overrides)
+    return {wire: signals[circuit.index[wire]] for wire in instructions}
+
+
+def test_compiled_circuit_example():
+    assert compiled_signals(EXAMPLE_INSTRUCTIONS) == EXAMPLE_SIGNALS
+
+
+def test_compiled_circuit_part_2_override():
+    circuit = compile_circuit(FEEDBACK_INSTRUCTIONS)
+    part_1_answer = circuit.signal('a')
+    assert part_1_answer == signals_by_recursion(FEEDBACK_INSTRUCTIONS)['a']
+    expected = signals_by_recursion(FEEDBACK_INSTRUCTIONS, {'b': part_1_answer})
+    assert compiled_signals(FEEDBACK_INSTRUCTIONS, {'b': part_1_answer}) == expected
+    assert circuit.signal('a', {'b': part_1_answer}) == expected['a']
+    # Overrides are not kept between evaluations, and are trimmed to 16 bits
+    assert circuit.signal('a') == part_1_answer
+    assert circuit.signal('b', {'b': (1 << 16) + 5}) == 5
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_compiled_circuit_matches_recursion(seed: int):
+    rng = random.Random(seed)
+    instructions = random_instructions(rng, 200)
+    circuit = compile_circuit(instructions)
+    # Every gate comes after the gates providing its inputs
+    for k, (op, x, y) in enumerate(circuit.gates):
+        assert op == Gate.CONST or (x < k and (y is None or y < k))
+    assert compiled_signals(instructions) == signals_by_recursion(instructions)
+    overrides = {wire: rng.randrange(1 << 16) for wire in rng.sample(sorted(instructions), 5)}
+    assert compiled_signals(instructions, overrides) == signals_by_recursion(instructions, overrides)
+
+
+def test_compiled_circuit_deeper_than_recursion_limit():
+    """A chain of inverters far longer than the recursion limit, given in reverse order"""
+    depth = 10 * sys.getrecursionlimit()
+    instructions = {f"w{k}": f"NOT w{k - 1}" for k in range(depth, 0, -1)} | {"w0": "123"}
+    circuit = compile_circuit(instructions)
+    assert circuit.signal(f"w{depth}") == 123
+    assert circuit.signal(f"w{depth - 1}") == 123 ^ 0xFFFF
+
+
+@pytest.mark.parametrize(
+    "instructions",
+    [
+        {"a": "b AND 1"},
+        {"a": "NOT b", "b": "c OR a", "c": "1"},
+        {"a": "a"},
+        {"a": "1 XOR 2"},
+    ]
+)
+def test_compile_circuit_invalid(instructions: dict[str, str]):
+    """Undefined wires, cycles and unknown operations are rejected"""
+    with pytest.raises(ValueError):
+        compile_circuit(instructions)
+
+
+def current_signals(circuit: IncrementalCircuit, wires) -> dict[str, int]:
+    return {wire: circuit.signal(wire) for wire in wires}
+
+
+def test_incremental_circuit_example():
+    circuit = IncrementalCircuit(compile_circuit(EXAMPLE_INSTRUCTIONS))
+    assert current_signals(circuit, EXAMPLE_INSTRUCTIONS) == EXAMPLE_SIGNALS
+
+
+def test_incremental_circuit_part_2_override():
+    """Override wire b with the signal of wire a, then remove the override to restore the original signals"""
+    circuit = IncrementalCircuit(compile_circuit(FEEDBACK_INSTRUCTIONS))
+    original = signals_by_recursion(FEEDBACK_INSTRUCTIONS)
+    assert current_signals(circuit, FEEDBACK_INSTRUCTIONS) == original
+
+    part_1_answer = circuit.signal('a')
+    changed = circuit.override('b', part_1_answer)
+    expected = signals_by_recursion(FEEDBACK_INSTRUCTIONS, {'b': part_1_answer})
+    assert current_signals(circuit, FEEDBACK_INSTRUCTIONS) == expected
+    assert changed == {wire for wire in FEEDBACK_INSTRUCTIONS if expected[wire] != original[wire]}
+    assert circuit.signal('a') == compile_circuit(FEEDBACK_INSTRUCTIONS).signal('a', {'b': part_1_answer})
+
+    assert circuit.remove_overrides(['b']) == changed
+    assert circuit.overrides == {}
+    assert current_signals(circuit, FEEDBACK_INSTRUCTIONS) == original
+    # Removing an override which is not in effect changes nothing
+    assert circuit.remove_overrides(['b']) == set()
+
+
+class RecordingList(list):
+    """List which records the indexes read from it"""
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads: list[int] = []
+
+    def __getitem__(self, k):
+        self.reads.append(k)
+        return super().__getitem__(k)
+
+
+def test_incremental_circuit_stops_at_unchanged_signals():
+    circuit = IncrementalCircuit(compile_circuit(FEEDBACK_INSTRUCTIONS))
+    # Record which gates are recomputed, as each is read from the list of gates in effect
+    circuit.gates = RecordingList(circuit.gates)
+    def recomputed_wires() -> set[str]:
+        wires = {circuit.circuit.wires[k] for k in circuit.gates.reads}
+        circuit.gates.reads.clear()
+        return wires
+
+    # Overriding a wire with its current signal changes nothing, and nothing downstream of it is recomputed
+    assert circuit.override('b', circuit.signal('b')) == set()
+    assert recomputed_wires() == {'b'}
+    # Changing a high bit of b reaches q, but not the lowest bits which reach m and r, so nothing after those is recomputed
+    changed = circuit.override('b', circuit.signal('b') ^ (1 << 10))
+    assert changed == {'b', 'q', 's', 't', 'u', 'a'}
+    assert recomputed_wires() == {'b', 'q', 'r', 'm', 's', 't', 'u', 'a'}
+    assert current_signals(circuit, FEEDBACK_INSTRUCTIONS) == signals_by_recursion(FEEDBACK_INSTRUCTIONS, circuit.overrides)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_incremental_circuit_matches_recursion(seed: int):
+    """Apply and remove random batches of overrides, checking every signal and the reported changes each time"""
+    rng = random.Random(seed)
+    instructions = random_instructions(rng, 60)
+    circuit = IncrementalCircuit(compile_circuit(instructions))
+    previous = signals_by_recursion(instructions)
+    for _ in range(20):
+        if circuit.overrides and rng.random() < 0.3:
+            changed = circuit.remove_overrides(rng.sample(sorted(circuit.overrides), rng.randint(1, len(circuit.overrides))))
+        else:
+            changed = circuit.apply_overrides({wire: rng.randrange(1 << 16) for wire in rng.sample(sorted(instructions), 3)})
+        expected = signals_by_recursion(instructions, circuit.overrides)
+        assert current_signals(circuit, instructions) == expected
+        assert changed == {wire for wire in instructions if expected[wire] != previous[wire]}
+        previous = expected
+    circuit.remove_overrides()
+    assert current_signals(circuit, instructions) == signals_by_recursion(instructions)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+--- Day 8: Matchsticks ---
+Benchmark comparing the lengths of the string literals, of the strings they evaluate to and of the encoded literals
+found by evaluating and encoding every line, against scanning a memory map of the input for byte counts.
+
+Uses the puzzle input if present, and a randomly generated file of escape heavy string literals
+of about 100 MB written to a temporary directory.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+- https://docs.python.org/3/library/tempfile.html
+- https://docs.python.org/3/library/random.html
+"""
+import os
+import random
+import tempfile
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    StringLengths,
+    count_string_lengths,
+    count_string_lengths_by_evaluation
+)
+
+
+def generate_literal(rng: random.Random, max_length: int=40) -> str:
+    """Generate a random string literal, with about half of its characters escaped, like the puzzle input"""
+    parts: list[str] = []
+    for _ in range(rng.randint(0, max_length)):
+        match rng.randrange(8):
+            case 0:
+                parts.append("\\\\")
+            case 1:
+                parts.append("\\\"")
+            case 2 | 3:
+                parts.append(f"\\x{rng.randrange(256):02x}")
+            case _:
+                parts.append(rng.choice("abcdefghijklmnopqrstuvwxyz"))
+    return f"\"{"".join(parts)}\""
+
+
+def generate_file(path: str, n_bytes: int=100_000_000, n_distinct: int=10_000, seed: int=2015):
+    """Write string literals, one per line, to a file until it is at least `n_bytes` long,
+    choosing from `n_distinct` randomly generated literals to save time
+    """
+    rng = random.Random(seed)
+    literals = [generate_literal(rng) for _ in range(n_distinct)]
+    n_written = 0
+    with open(path, 'w') as file:
+        while n_written < n_bytes:
+            lines = "\n".join(rng.choices(literals, k=10_000)) + "\n"
+            file.write(lines)
+            n_written += len(lines)
+
+
+def count_lengths_by_evaluation(path: str) -> StringLengths:
+    with open(path, 'r') as file:
+        return count_string_lengths_by_evaluation([line.strip() for line in file])
+
+
+def main():
+    implementations: dict[str, Callable[[str], StringLengths]] = {
+        "Evaluate and encode every line": count_lengths_by_evaluation,
+        "Memory mapped byte scan": count_string_lengths,
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        generated_path = os.path.join(temp_dir, "generated.txt")
+        generate_file(generated_path)
+        paths = [generated_path]
+        input_path = os.path.join(DIRPATH, "input.txt")
+        if os.path.exists(input_path):
+            paths.insert(0, input_path)
+        else:
+            print("No puzzle input found, so only using a randomly generated file")
+
+        for path in paths:
+            print(f"File of {os.path.getsize(path) / 10 ** 6:.1f} MB")
+            results: dict[str, StringLengths] = {}
+            for name, implementation in implementations.items():
+                t_start = perf_counter()
+                results[name] = implementation(path)
+                t_stop = perf_counter()
+                print(f"{name}: {results[name]} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+            assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
@@ -4,35 +4,98 @@
 https://adventofcode.com/2015/day/8
 Themes: Escaping special characters, representation in computer memory, string encoding and decoding
 
+Evaluating every string literal with `ast.literal_eval` and encoding every string just to measure their lengths
+allocates a new string per line. Instead, the lengths can be accounted for directly from the bytes of the input,
+which is memory mapped and scanned in chunks of whole lines:
+- the literal length is the number of bytes, less line endings
+- each escape sequence shortens the in-memory string by one character (\\\\ and \\") or three characters (\\x..),
+  and each literal loses its two enclosing double quotes
+- encoding adds a backslash before every backslash and double quote, and two enclosing double quotes
+The byte counts and the matches of the escape sequences are found by `bytes.count` and a compiled regular expression,
+which scan each chunk in C, and no strings are evaluated or built.
+
 References
 - https://docs.python.org/3/library/ast.html#ast.literal_eval
 - https://www.joelonsoftware.com/2003/10/08/the-absolute-minimum-every-software-developer-absolutely-positively-must-know-about-unicode-and-character-sets-no-excuses/
+- https://docs.python.org/3/library/mmap.html
+- https://docs.python.org/3/library/re.html
 """
 import os
 import ast
+import mmap
+import re
+from dataclasses import dataclass
 
 DIRPATH = os.path.dirname(__file__)
 
+# An escape sequence within a string literal, with a group which is nonempty only for hexadecimal escapes
+ESCAPE_PATTERN = re.compile(rb'\\(?:[\\"]|(x)[0-9a-fA-F]{2})')
+# Number of bytes of the input scanned at a time, extended to the end of the line
+CHUNK_SIZE: int = 1 << 20
+
+
+@dataclass(frozen=True)
+class StringLengths:
+    """Total lengths of the string literals, of the strings they evaluate to, and of the encoded string literals"""
+    literal: int
+    in_memory: int
+    encoded: int
+
+    def __add__(self, other):
+        return StringLengths(self.literal + other.literal, self.in_memory + other.in_memory, self.encoded + other.encoded)
+
 
 def main():
-    """Note: This script uses a couple of examples of runtime testing using `assert` statements to verify intended program behaviour"""
-    with open(os.path.join(DIRPATH, "input.txt"), 'r') as file:
-        literal_strings: list[str] = [line.strip() for line in file]
-
-    character_counts: dict[str, int] = {
-        "literal_strings": sum(len(s_literal) for s_literal in literal_strings),
-        "in-memory strings": sum(len(ast.literal_eval(s_literal)) for s_literal in literal_strings),
-        "encoded string literals": sum(len(encode_string(s_literal)) for s_literal in literal_strings)
-    }
-
-    part_1_answer = character_counts["literal_strings"] - character_counts["in-memory strings"]
-    part_2_answer_direct = character_counts["encoded string literals"] - character_counts["literal_strings"]
-    # It is possible to calculate the answer to part 2 without directly encoding the input string literals
-    part_2_answer_indirect = sum(2 + s.count("\\") + s.count("\"") for s in literal_strings)
-    assert part_2_answer_direct == part_2_answer_indirect
+    """Read the puzzle inputs, then calculate and print the puzzle answers"""
+    lengths = count_string_lengths(os.path.join(DIRPATH, "input.txt"))
+
+    part_1_answer = lengths.literal - lengths.in_memory
+    part_2_answer = lengths.encoded - lengths.literal
 
     print(f"Part 1: The answer is {part_1_answer}")
-    print(f"Part 2: The answer is {part_2_answer_direct}")
+    print(f"Part 2: The answer is {part_2_answer}")
+
+
+def count_string_lengths(path: str, chunk_size: int=CHUNK_SIZE) -> StringLengths:
+    """Calculate the total lengths of the string literals in a file, one per line, of the strings they evaluate to,
+    and of the encoded string literals, by scanning a memory map of the file in chunks of whole lines
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return StringLengths(0, 0, 0)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            lengths = StringLengths(0, 0, 0)
+            start = 0
+            while start < len(data):
+                # Chunks end with a line ending, so that no escape sequence or string literal is split between chunks
+                end = data.find(b"\n", start + chunk_size)
+                end = len(data) if end == -1 else end + 1
+                lengths += count_chunk_string_lengths(data[start:end])
+                start = end
+            return lengths
+
+
+def count_chunk_string_lengths(chunk: bytes) -> StringLengths:
+    """Calculate the total lengths of the string literals in a chunk of whole lines, of the strings they evaluate to,
+    and of the encoded string literals, without evaluating or building any strings
+    """
+    literal_length = len(chunk) - chunk.count(b"\n") - chunk.count(b"\r")
+    # Every literal starts with a double quote at the start of a line
+    n_literals = chunk.count(b"\n\"") + chunk.startswith(b"\"")
+    escapes = ESCAPE_PATTERN.findall(chunk)
+    # Each escape sequence shortens the string by one character, and each hexadecimal escape by two more
+    in_memory_length = literal_length - 2 * n_literals - len(escapes) - 2 * escapes.count(b"x")
+    encoded_length = literal_length + 2 * n_literals + chunk.count(b"\\") + chunk.count(b"\"")
+    return StringLengths(literal_length, in_memory_length, encoded_length)
+
+
+def count_string_lengths_by_evaluation(literal_strings: list[str]) -> StringLengths:
+    """Reference implementation which evaluates and encodes every string literal"""
+    return StringLengths(
+        literal=sum(len(s_literal) for s_literal in literal_strings),
+        in_memory=sum(len(ast.literal_eval(s_literal)) for s_literal in literal_strings),
+        encoded=sum(len(encode_string(s_literal)) for s_literal in literal_strings)
+    )
 
 
 def encode_string(s: str) -> str:
@@ -0,0 +1,37 @@
+"""Testing functions for 2015 Day 8
+
+References
+- https://docs.pytest.org/en/stable/how-to/tmp_path.html
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import pytest
+from sol import StringLengths, count_string_lengths, count_string_lengths_by_evaluation
+
+EXAMPLE_LITERALS: list[str] = ['""', '"abc"', r'"aaa\"aaa"', r'"\x27"']
+# Escapes next to the enclosing quotes, doubled backslashes, and hexadecimal escapes with either case of digit
+ESCAPED_LITERALS: list[str] = [r'"\\"', r'"\""', r'"\\\\x27"', r'"\xaB\x0f\\\"z"', r'"x\"\\x"', r'"\\\x41"']
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 13, 1 << 20])
+@pytest.mark.parametrize("line_ending", ["\n", "\r\n"])
+@pytest.mark.parametrize("trailing_line_ending", [True, False])
+@pytest.mark.parametrize("literal_strings", [EXAMPLE_LITERALS, ESCAPED_LITERALS, EXAMPLE_LITERALS + ESCAPED_LITERALS * 3])
+def test_count_string_lengths(tmp_path, literal_strings: list[str], trailing_line_ending: bool, line_ending: str, chunk_size: int):
+    path = tmp_path / "input.txt"
+    path.write_bytes((line_ending.join(literal_strings) + (line_ending if trailing_line_ending else "")).encode())
+    assert count_string_lengths(str(path), chunk_size) == count_string_lengths_by_evaluation(literal_strings)
+
+
+def test_count_string_lengths_of_example(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("\n".join(EXAMPLE_LITERALS) + "\n")
+    lengths = count_string_lengths(str(path))
+    assert lengths.literal - lengths.in_memory == 12
+    assert lengths.encoded - lengths.literal == 19
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1 << 20])
+def test_count_string_lengths_of_empty_file(tmp_path, chunk_size: int):
+    path = tmp_path / "input.txt"
+    path.write_bytes(b"")
+    assert count_string_lengths(str(path), chunk_size) == StringLengths(0, 0, 0) == count_string_lengths_by_evaluation([])
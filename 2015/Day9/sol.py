@@ -23,10 +23,15 @@ check the lengths of only half of all possible paths to find the max/min possibl
 
 In our case, there are 8 different locations, leading to 8! = 40,320 possible paths through each location.
 
+The Held-Karp algorithm instead finds the best path over each subset of locations ending at each location,
+by extending the best paths over smaller subsets, which takes O(n^2 2^n) time. This is shared with Day 13
+in `common.hamiltonian`, and remains feasible for 20 or more locations, where checking every permutation is not.
+
 Relevant References
 - https://docs.python.org/3/library/itertools.html
 - https://en.wikipedia.org/wiki/Hamiltonian_path
 - https://en.wikipedia.org/wiki/Hamiltonian_path_problem
+- https://en.wikipedia.org/wiki/Held%E2%80%93Karp_algorithm
 - https://cs.stackexchange.com/questions/163259/shortest-hamiltonian-path-in-a-complete-graph
 - https://stackoverflow.com/questions/9092741/algorithm-to-find-a-linear-path-of-minimum-weight-in-a-graph-that-connects-all-t
 
@@ -38,21 +43,22 @@ Extra Reading
 - https://theory.stanford.edu/~amitp/GameProgramming/AStarComparison.html
 """
 import os
-import itertools
+import sys
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
+
+from common.hamiltonian import hamiltonian_path
 
 
 def main():
-    locations, distances = read_weighted_graph_data()
+    _, distances = read_weighted_graph_data()
 
-    route_lengths = {
-        route: sum(distances[(loc_1, loc_2)] for loc_1, loc_2 in zip(route, route[1:]))
-        for route in itertools.permutations(locations)
-    }
+    shortest_length, _ = hamiltonian_path(distances)
+    longest_length, _ = hamiltonian_path(distances, maximise=True)
 
-    print(f"Part 1: The length of a shortest path through all of the locations is {min(route_lengths.values())}")
-    print(f"Part 1: The length of a longest path through all of the locations is {max(route_lengths.values())}")
+    print(f"Part 1: The length of a shortest path through all of the locations is {shortest_length}")
+    print(f"Part 1: The length of a longest path through all of the locations is {longest_length}")
 
 
 def read_weighted_graph_data() -> tuple[set[str], dict[tuple[str, str], int]]:
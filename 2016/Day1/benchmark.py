@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+--- Day 1: No Time for a Taxicab ---
+Benchmark comparing finding the first location visited twice by driving one step at a time
+with a new `Vector` object per step, against checking and recording whole straight segments of packed positions.
+
+Uses the puzzle input if present, and generated instructions for a route of about 10^7 steps,
+which spirals outwards without crossing itself, then finally turns back into the spiral.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+import os
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import (
+    DIRPATH,
+    Vector,
+    CARDINAL_DIRECTIONS,
+    parse_puzzle_input,
+    solve_part_2
+)
+
+
+def generate_spiral_instructions(n_steps: int=10 ** 7) -> list[tuple[str, int]]:
+    """Generate instructions for an outward spiral of at least `n_steps` steps, which visits no location twice,
+    followed by a final turn back towards the centre of the spiral
+    """
+    instructions: list[tuple[str, int]] = []
+    total, length = 0, 1
+    while total < n_steps:
+        instructions.extend([("R", length), ("R", length)])
+        total += 2 * length
+        length += 1
+    instructions.append(("R", length))
+    return instructions
+
+
+def first_location_visited_twice_by_vectors(instructions: list[tuple[str, int]]) -> int:
+    """Reference implementation which drives one step at a time, creating a new `Vector` for every step"""
+    position, facing = Vector(0, 0), 0
+    visited: set[Vector] = {position}
+    for direction, distance in instructions:
+        facing = (facing + {"R": 1, "L": -1}[direction]) % 4
+        for _ in range(distance):
+            position += CARDINAL_DIRECTIONS[facing]
+            if position in visited:
+                return abs(position)
+            visited.add(position)
+    return abs(position)
+
+
+def main():
+    implementations: dict[str, Callable[[list[tuple[str, int]]], int]] = {
+        "Vector per step": first_location_visited_twice_by_vectors,
+        "Packed segments": solve_part_2,
+    }
+
+    instruction_lists = [generate_spiral_instructions()]
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            instruction_lists.insert(0, parse_puzzle_input(file.read()))
+    else:
+        print("No puzzle input found, so only using generated instructions")
+
+    for instructions in instruction_lists:
+        n_steps = sum(distance for _, distance in instructions)
+        results: dict[str, int] = {}
+        for name, implementation in implementations.items():
+            t_start = perf_counter()
+            results[name] = implementation(instructions)
+            t_stop = perf_counter()
+            print(f"{name}: {results[name]} blocks away on a route of up to {n_steps} steps "
+                  f"in {(t_stop - t_start) * 1000:.1f} milliseconds")
+        assert len(set(results.values())) == 1, results
+
+
+if __name__ == "__main__":
+    main()
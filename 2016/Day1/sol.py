@@ -4,11 +4,19 @@
 https://adventofcode.com/2016/day/1
 Part 1: Follow instructions to move along a 2D grid of city streets
 Part 2: Find the first location visited twice (not only including intersections for turning)
+
+Positions are packed into integers by the shared coordinates module, so that each straight segment of the route
+is a `range` of packed positions, which is checked against and added to the set of visited positions without
+creating an object per step.
 """
 import os
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
+
+from common.coordinates import Vector, CARDINAL_STEPS, line, manhattan_norm
 
 
 def main():
@@ -40,46 +48,20 @@ def solve_part_2(instructions: list[tuple[str, int]]) -> int:
     to the first location that is visited twice (L1 taxicab metric)
     """
     taxi = Taxi()
-    visited: set[Vector] = {taxi.position}
+    visited: set[int] = {taxi.location}
     for direction, distance in instructions:
         taxi.turn(direction)
-        # Drive distince in one unit intervals, recording visited positions
-        for _ in range(distance):
-            taxi.drive(1)
-            if taxi.position in visited:
-                return abs(taxi.position)
-            visited.add(taxi.position)
+        # Drive the distance in one unit intervals, recording visited positions
+        segment = line(taxi.location, CARDINAL_STEPS[taxi.facing], distance)
+        if not visited.isdisjoint(segment):
+            return manhattan_norm(next(location for location in segment if location in visited))
+        visited.update(segment)
+        taxi.drive(distance)
     return abs(taxi.position)
 
 
-@dataclass(frozen=True)
-class Vector:
-    i: int
-    j: int
-
-    def __add__(self, other):
-        return Vector(self.i + other.i, self.j + other.j)
-
-    def __mul__(self, scalar: int):
-        return Vector(self.i * scalar, self.j * scalar)
-
-    def __rmul__(self, scalar: int):
-        """Swap order of operands to re-use implementation of __mul__
-        https://docs.python.org/3/reference/datamodel.html#emulating-numeric-types
-        """
-        return self * scalar
-
-    def __abs__(self):
-        return abs(self.i) + abs(self.j)
-
-
 # List of unit vectors representing the cardinal directions on a 2D grid
-CARDINAL_DIRECTIONS: list[Vector] = [
-    Vector(0,1), # North
-    Vector(1,0), # East
-    Vector(0,-1), # South
-    Vector(-1,0) # West
-]
+CARDINAL_DIRECTIONS: list[Vector] = [Vector.from_packed(step) for step in CARDINAL_STEPS]
 
 
 @dataclass
@@ -87,9 +69,14 @@ class Taxi:
     """Taxi which can move along a 2D grid of streets
     The `facing` attribute represents the number of quarter-turns clockwise from North
     i.e. North = 0, East = 1, South = 2, West = 3
+    The `location` attribute is the packed `position` of the taxi, which is kept in step with it as the taxi drives
     """
     position: Vector = Vector(0,0)
     facing: int = 0
+    location: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.location = self.position.packed
 
     def turn(self, direction: str):
         """Turn left (L) or right (R) to change direction"""
@@ -97,8 +84,8 @@ class Taxi:
 
     def drive(self, distance: int):
         """Drive forward in the direction of travel by a given distance"""
-        self.position += CARDINAL_DIRECTIONS[self.facing % 4] * distance
-
+        self.location += CARDINAL_STEPS[self.facing % 4] * distance
+        self.position = Vector.from_packed(self.location)
 
 if __name__ == "__main__":
     main()
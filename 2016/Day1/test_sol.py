@@ -0,0 +1,34 @@
+"""Testing functions for 2016 Day 1
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import pytest
+from sol import (
+    Vector,
+    Taxi,
+    parse_puzzle_input,
+    solve_part_1,
+    solve_part_2
+)
+
+
+@pytest.mark.parametrize("puzzle_input,expected", [("R2, L3", 5), ("R2, R2, R2", 2), ("R5, L5, R5, R3", 12)])
+def test_solve_part_1(puzzle_input: str, expected: int):
+    assert solve_part_1(parse_puzzle_input(puzzle_input)) == expected
+
+
+def test_solve_part_2():
+    assert solve_part_2(parse_puzzle_input("R8, R4, R4, R8")) == 4
+
+
+def test_taxi_starting_position():
+    """A taxi can start away from the origin, and its packed location follows its position as it drives"""
+    taxi = Taxi(position=Vector(3, -2), facing=1)
+    assert Vector.from_packed(taxi.location) == Vector(3, -2)
+    taxi.drive(5)
+    taxi.turn("R")
+    taxi.drive(4)
+    assert taxi.position == Vector(8, -6)
+    assert Vector.from_packed(taxi.location) == taxi.position
+    assert Taxi() == Taxi(position=Vector(0, 0), facing=0)
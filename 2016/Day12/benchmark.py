@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+--- Day 12: Leonardo's Monorail ---
+Benchmark comparing the assembunny interpreter, which matches on lists of strings at every step,
+against executing the compiled program in the bytecode virtual machine, with and without loop idiom recognition.
+
+Uses the puzzle input if present, otherwise a program with the same structure as the puzzle inputs.
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+import os
+from collections.abc import Callable
+from time import perf_counter
+
+from sol import DIRPATH, Computer, compile_program
+
+# Calculates the 28th (or 35th, if register c starts at 1) Fibonacci number, then adds the product of 13 and 14
+EXAMPLE_PROGRAM: str = """\
+cpy 1 a
+cpy 1 b
+cpy 26 d
+jnz c 2
+jnz 1 5
+cpy 7 c
+inc d
+dec c
+jnz c -2
+cpy a c
+inc a
+dec b
+jnz b -2
+cpy c b
+dec d
+jnz d -6
+cpy 13 c
+cpy 14 d
+inc a
+dec d
+jnz d -2
+dec c
+jnz c -5
+"""
+
+
+def main():
+    input_path = os.path.join(DIRPATH, "input.txt")
+    if os.path.exists(input_path):
+        with open(input_path, 'r') as file:
+            instructions: list[str] = file.read().splitlines()
+    else:
+        print("No puzzle input found, so using an example program instead")
+        instructions = EXAMPLE_PROGRAM.splitlines()
+
+    implementations: dict[str, Callable[[Computer, list[str]], None]] = {
+        "Interpreter": Computer.interpret_program,
+        "Compiled VM": lambda computer, instructions: computer.execute(compile_program(instructions, optimise_loops=False)),
+        "Compiled VM with loop idioms": Computer.run_program,
+    }
+    for part, c0 in enumerate((0, 1), 1):
+        results: dict[str, dict[str, int]] = {}
+        for name, implementation in implementations.items():
+            computer = Computer(c=c0)
+            t_start = perf_counter()
+            implementation(computer, instructions)
+            t_stop = perf_counter()
+            results[name] = computer.registers
+            print(f"Part {part}, {name}: {computer.registers} in {(t_stop - t_start) * 1000:.1f} milliseconds")
+        assert all(registers == results["Interpreter"] for registers in results.values()), results
+
+
+if __name__ == "__main__":
+    main()
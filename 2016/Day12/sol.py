@@ -8,8 +8,15 @@ calculate integer sums, products, and Fibonacci numbers
 References
 - Structural Pattern Matching
   - https://peps.python.org/pep-0636/
+- Bytecode compilation
+  - https://en.wikipedia.org/wiki/Bytecode
+  - https://docs.python.org/3/library/enum.html#enum.IntEnum
+- Peephole optimisation and loop idiom recognition
+  - https://en.wikipedia.org/wiki/Peephole_optimization
+  - https://llvm.org/doxygen/LoopIdiomRecognize_8cpp_source.html
 """
 import os
+import enum
 
 DIRPATH = os.path.dirname(__file__)
 
@@ -29,6 +36,123 @@ def main():
     print(f"Part 2: The answer is {computer.registers}")
 
 
+class Opcode(enum.IntEnum):
+    """Operations of the compiled program, specialised by whether each operand is a register or an integer literal"""
+    NOP = enum.auto()
+    CPY_VAL = enum.auto() # Copy the integer literal `x` into register `y`
+    CPY_REG = enum.auto() # Copy the value of register `x` into register `y`
+    INC = enum.auto() # Increase the value of register `x` by one
+    DEC = enum.auto() # Decrease the value of register `x` by one
+    JNZ = enum.auto() # Jump to instruction `y` if register `x` is not zero
+    JMP = enum.auto() # Jump to instruction `x`
+    JNZ_DYN = enum.auto() # Jump by the value of register `y` if register `x` is not zero (or `x` is None)
+    # Macro-operations replacing whole loops, whose operand `x` is a tuple of parameters of the loop,
+    # and operand `y` is the original instruction to execute instead if the loop would not terminate as expected
+    ADD_LOOP = enum.auto()
+    MUL_LOOP = enum.auto()
+
+
+# A compiled instruction is an opcode followed by two operands, which are register slots, integer literals,
+# or absolute jump targets depending on the opcode, or tuples of parameters for macro-operations
+CompiledInstruction = tuple[Opcode, int | tuple | None, int | tuple | None]
+
+REGISTER_SLOTS: dict[str, int] = {char: slot for slot, char in enumerate("abcd")}
+
+
+def compile_program(instructions: list[str], optimise_loops: bool=True) -> list[CompiledInstruction]:
+    """Compile assembunny instructions into a list of (opcode, x, y) triples, for use by `Computer.execute`
+
+    Register names are replaced by integer register slots, integer literals are parsed once,
+    relative jump offsets are converted to absolute instruction indexes, and jumps on a literal condition
+    are resolved to an unconditional jump or no operation. Instructions with invalid operands are compiled to
+    no operation, matching the interpreter, which skips any instruction that matches no pattern.
+    Optionally, loops which perform additions and multiplications are then replaced by macro-operations.
+    """
+    program: list[CompiledInstruction] = []
+    for pointer, instruction in enumerate(instructions):
+        words = instruction.split()
+        operands: list[int | str] = []
+        for operand in words[1:]:
+            try:
+                operands.append(int(operand))
+            except ValueError:
+                operands.append(operand)
+        registers = [REGISTER_SLOTS.get(operand) if isinstance(operand, str) else None for operand in operands]
+
+        match words[0], operands, registers:
+            case "cpy", [int(x), _], [_, int(y)]: program.append((Opcode.CPY_VAL, x, y))
+            case "cpy", [_, _], [int(x), int(y)]: program.append((Opcode.CPY_REG, x, y))
+            case "inc", [_], [int(x)]: program.append((Opcode.INC, x, None))
+            case "dec", [_], [int(x)]: program.append((Opcode.DEC, x, None))
+            case "jnz", [int(x), int(y)], _: program.append((Opcode.JMP, pointer + y, None) if x != 0 else (Opcode.NOP, None, None))
+            case "jnz", [_, int(y)], [int(x), _]: program.append((Opcode.JNZ, x, pointer + y))
+            case "jnz", [int(x), _], [_, int(y)]: program.append((Opcode.JNZ_DYN, None, y) if x != 0 else (Opcode.NOP, None, None))
+            case "jnz", [_, _], [int(x), int(y)]: program.append((Opcode.JNZ_DYN, x, y))
+            case _: program.append((Opcode.NOP, None, None))
+    return recognise_loop_idioms(program) if optimise_loops else program
+
+
+def _match_add_loop(program: list[CompiledInstruction], start: int) -> tuple[int, int, int, int] | None:
+    """Match an add-loop of three instructions starting at `start`, which steps a target register and a counter
+    register by one (in either direction, in either order), then jumps back to `start` while the counter is nonzero,
+    such as `inc a, dec b, jnz b -2`. Return the tuple (target, target_step, counter, counter_step) if found.
+    """
+    steps: dict[Opcode, int] = {Opcode.INC: 1, Opcode.DEC: -1}
+    match program[start:start+3]:
+        case [(op_1, int(reg_1), None), (op_2, int(reg_2), None), (Opcode.JNZ, int(counter), int(target))] if (
+            op_1 in steps and op_2 in steps and reg_1 != reg_2 and counter in {reg_1, reg_2} and target == start
+        ):
+            target_reg, target_step = (reg_2, steps[op_2]) if counter == reg_1 else (reg_1, steps[op_1])
+            counter_step = steps[op_1] if counter == reg_1 else steps[op_2]
+            return target_reg, target_step, counter, counter_step
+    return None
+
+
+def recognise_loop_idioms(program: list[CompiledInstruction]) -> list[CompiledInstruction]:
+    """Replace the first instruction of each recognised loop with a macro-operation which performs the whole loop in O(1).
+
+    - Add-loop: `inc a, dec b, jnz b -2` repeats `b` times, so performs `a += b, b = 0`
+    - Multiply-loop: `cpy s c, inc a, dec c, jnz c -2, dec d, jnz d -5` repeats the add-loop `d` times,
+      so performs `a += s * d, c = 0, d = 0`
+
+    The macro-operations are only safe to apply when the loop counters start with the sign that makes the loop
+    terminate (otherwise the original program would loop forever), so each macro-operation keeps the original
+    instruction to execute instead when this is not the case. The rest of the loop body is left in place,
+    so jumps into the middle of a loop, and the fallback path, behave exactly as before.
+    """
+    optimised: list[CompiledInstruction] = list(program)
+    for start in range(len(program)):
+        add_loop = _match_add_loop(program, start)
+        if add_loop is not None:
+            optimised[start] = (Opcode.ADD_LOOP, (*add_loop, start + 3), program[start])
+            continue
+
+        # Multiply-loop: an add-loop which copies its counter from a source operand beforehand,
+        # then steps an outer counter by one and jumps back to the copy while the outer counter is nonzero
+        inner_loop = _match_add_loop(program, start + 1)
+        if inner_loop is None or start + 6 > len(program):
+            continue
+        target, target_step, inner, inner_step = inner_loop
+        match program[start], program[start+4], program[start+5]:
+            case (
+                (Opcode.CPY_VAL | Opcode.CPY_REG as copy_op, int(source), int(copy_dest)),
+                (Opcode.INC | Opcode.DEC as outer_op, int(outer), None),
+                (Opcode.JNZ, int(jnz_reg), int(jnz_target))
+            ) if (
+                copy_dest == inner and jnz_reg == outer and jnz_target == start
+                and outer not in {target, inner}
+                and (copy_op == Opcode.CPY_VAL or source not in {target, inner, outer})
+            ):
+                outer_step = 1 if outer_op == Opcode.INC else -1
+                source_is_register = copy_op == Opcode.CPY_REG
+                optimised[start] = (
+                    Opcode.MUL_LOOP,
+                    (target, target_step, source, source_is_register, inner, inner_step, outer, outer_step, start + 6),
+                    program[start]
+                )
+    return optimised
+
+
 class Computer:
     def __init__(self, **kwargs):
         """Initialise the four registers (a, b, c, and d) to start at 0
@@ -40,7 +164,69 @@ class Computer:
                 self.registers[key] = val
 
     def run_program(self, instructions: list[str], pointer: int=0) -> None:
-        """"""
+        """Compile the instructions, then execute the compiled program"""
+        self.execute(compile_program(instructions), pointer)
+
+    def execute(self, program: list[CompiledInstruction], pointer: int=0) -> None:
+        """Execute a compiled program, holding the registers in a list indexed by register slot during execution"""
+        registers: list[int] = [self.registers[char] for char in REGISTER_SLOTS]
+        n_instructions = len(program)
+        # Bind opcodes to local variables to avoid repeated attribute lookups in the dispatch loop
+        INC, DEC, JNZ, CPY_REG, CPY_VAL, JMP, JNZ_DYN, ADD_LOOP, MUL_LOOP = (
+            Opcode.INC, Opcode.DEC, Opcode.JNZ, Opcode.CPY_REG, Opcode.CPY_VAL, Opcode.JMP, Opcode.JNZ_DYN,
+            Opcode.ADD_LOOP, Opcode.MUL_LOOP
+        )
+
+        # Opcodes are tested in roughly decreasing order of how frequently they are executed in typical programs
+        while 0 <= pointer < n_instructions:
+            op, x, y = program[pointer]
+            if op == INC:
+                registers[x] += 1
+            elif op == DEC:
+                registers[x] -= 1
+            elif op == JNZ:
+                if registers[x] != 0:
+                    pointer = y
+                    continue
+            elif op == CPY_REG:
+                registers[y] = registers[x]
+            elif op == CPY_VAL:
+                registers[y] = x
+            elif op == JMP:
+                pointer = x
+                continue
+            elif op == JNZ_DYN:
+                if x is None or registers[x] != 0:
+                    pointer += registers[y]
+                    continue
+            elif op == ADD_LOOP:
+                target, target_step, counter, counter_step, exit_pointer = x
+                # The loop's number of iterations is positive only if its counter steps towards zero
+                iterations = -registers[counter] * counter_step
+                if iterations > 0:
+                    registers[target] += target_step * iterations
+                    registers[counter] = 0
+                    pointer = exit_pointer
+                    continue
+                # Otherwise execute the original instruction, which steps a register
+                registers[y[1]] += 1 if y[0] == INC else -1
+            elif op == MUL_LOOP:
+                target, target_step, source, source_is_register, inner, inner_step, outer, outer_step, exit_pointer = x
+                inner_iterations = -(registers[source] if source_is_register else source) * inner_step
+                outer_iterations = -registers[outer] * outer_step
+                if inner_iterations > 0 and outer_iterations > 0:
+                    registers[target] += target_step * inner_iterations * outer_iterations
+                    registers[inner] = registers[outer] = 0
+                    pointer = exit_pointer
+                    continue
+                # Otherwise execute the original instruction, which copies into the inner counter
+                registers[inner] = registers[source] if source_is_register else source
+            pointer += 1
+
+        self.registers = {char: registers[slot] for char, slot in REGISTER_SLOTS.items()}
+
+    def interpret_program(self, instructions: list[str], pointer: int=0) -> None:
+        """Run the instructions directly, without compiling them first"""
         # Split each instruction into operands
         split_instructions = [instruction.split() for instruction in instructions]
 
@@ -0,0 +1,116 @@
+"""Testing functions for 2016 Day 12
+
+The compiled program, with and without loop idiom recognition, is compared against the interpreter,
+which runs the instructions as written.
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import random
+import pytest
+from sol import Computer, Opcode, compile_program
+
+
+def run_all_ways(instructions: list[str], **initial_registers: int) -> list[dict[str, int]]:
+    """Return the final registers after interpreting the instructions, executing the compiled program,
+    and executing the compiled program with loop idioms replaced by macro-operations
+    """
+    interpreter, compiled, optimised = (Computer(**initial_registers) for _ in range(3))
+    interpreter.interpret_program(instructions)
+    compiled.execute(compile_program(instructions, optimise_loops=False))
+    optimised.execute(compile_program(instructions))
+    return [interpreter.registers, compiled.registers, optimised.registers]
+
+
+EXAMPLE_PROGRAM: list[str] = ["cpy 41 a", "inc a", "inc a", "dec a", "jnz a 2", "dec a"]
+
+# The structure of the puzzle inputs, calculating a smaller Fibonacci number
+FIBONACCI_PROGRAM: list[str] = [
+    "cpy 1 a", "cpy 1 b", "cpy 12 d", "jnz c 2", "jnz 1 5", "cpy 4 c", "inc d", "dec c", "jnz c -2",
+    "cpy a c", "inc a", "dec b", "jnz b -2", "cpy c b", "dec d", "jnz d -6",
+    "cpy 13 c", "cpy 14 d", "inc a", "dec d", "jnz d -2", "dec c", "jnz c -5",
+]
+
+
+def test_example_program():
+    assert run_all_ways(EXAMPLE_PROGRAM) == [{"a": 42, "b": 0, "c": 0, "d": 0}] * 3
+
+
+@pytest.mark.parametrize("c", [0, 1])
+def test_fibonacci_program(c: int):
+    interpreted, compiled, optimised = run_all_ways(FIBONACCI_PROGRAM, c=c)
+    assert interpreted == compiled == optimised
+
+
+@pytest.mark.parametrize(
+    "instructions,expected_opcode,expected_a",
+    [
+        # Add-loops with the counter stepping down from a positive value, and up from a negative value
+        (["cpy 5 b", "inc a", "dec b", "jnz b -2"], Opcode.ADD_LOOP, 5),
+        (["cpy -5 b", "inc a", "inc b", "jnz b -2"], Opcode.ADD_LOOP, 5),
+        (["cpy -5 b", "inc b", "dec a", "jnz b -2"], Opcode.ADD_LOOP, -5),
+        # Multiply-loops with negative inner, outer, and source counters
+        (["cpy -4 d", "cpy 3 c", "inc a", "dec c", "jnz c -2", "inc d", "jnz d -5"], Opcode.MUL_LOOP, 12),
+        (["cpy 4 d", "cpy -3 c", "inc a", "inc c", "jnz c -2", "dec d", "jnz d -5"], Opcode.MUL_LOOP, 12),
+        (["cpy -3 b", "cpy -4 d", "cpy b c", "inc c", "dec a", "jnz c -2", "inc d", "jnz d -5"], Opcode.MUL_LOOP, -12),
+    ]
+)
+def test_loop_idioms(instructions: list[str], expected_opcode: Opcode, expected_a: int):
+    assert expected_opcode in {op for op, _, _ in compile_program(instructions)}
+    interpreted, compiled, optimised = run_all_ways(instructions)
+    assert interpreted == compiled == optimised
+    assert optimised["a"] == expected_a
+
+
+@pytest.mark.parametrize(
+    "instructions",
+    [
+        # Jumps over the first instruction of an add-loop into the middle of its body
+        ["cpy 3 b", "jnz 1 2", "inc a", "dec b", "jnz b -2"],
+        ["cpy 1 b", "jnz 1 2", "inc a", "dec b", "jnz b -2"],
+        # Jumps into the inner add-loop of a multiply-loop, skipping the copy into its counter
+        ["cpy 2 c", "cpy 3 d", "jnz 1 3", "cpy 4 c", "inc a", "dec c", "jnz c -2", "dec d", "jnz d -5"],
+        # Jumps to the last instructions of a multiply-loop
+        ["cpy 1 d", "jnz 1 5", "cpy 4 c", "inc a", "dec c", "jnz c -2", "dec d", "jnz d -5"],
+    ]
+)
+def test_jumps_into_loop_body(instructions: list[str]):
+    interpreted, compiled, optimised = run_all_ways(instructions)
+    assert interpreted == compiled == optimised
+
+
+def generate_terminating_program(rng: random.Random, n_blocks: int) -> list[str]:
+    """Generate a random program of straight line code, add-loops, multiply-loops, and jumps into loop bodies,
+    whose counters start with the sign that makes each loop terminate
+    """
+    steps = {1: "inc", -1: "dec"}
+    instructions: list[str] = []
+    for _ in range(n_blocks):
+        target, counter, outer, source = rng.sample("abcd", 4)
+        target_step, counter_step, outer_step = (rng.choice([1, -1]) for _ in range(3))
+        count = -counter_step * rng.randint(1, 5)
+        body = [f"{steps[target_step]} {target}", f"{steps[counter_step]} {counter}"]
+        rng.shuffle(body)
+        match rng.randrange(4):
+            case 0:
+                instructions += rng.choices([f"inc {target}", f"dec {target}", f"cpy {rng.randint(-3, 3)} {target}", f"cpy {source} {target}"], k=2)
+            case 1:
+                instructions += [f"cpy {count} {counter}", *body, f"jnz {counter} -2"]
+            case 2:
+                copy = rng.choice([f"cpy {count} {counter}", f"cpy {source} {counter}"])
+                instructions += [
+                    f"cpy {count} {source}", f"cpy {-outer_step * rng.randint(1, 4)} {outer}",
+                    copy, *body, f"jnz {counter} -2", f"{steps[outer_step]} {outer}", f"jnz {outer} -5"
+                ]
+            case 3:
+                # Enter the add-loop at its second instruction, which terminates whichever register it steps
+                instructions += [f"cpy {count} {counter}", "jnz 1 2", *body, f"jnz {counter} -2"]
+    return instructions
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_programs(seed: int):
+    rng = random.Random(seed)
+    instructions = generate_terminating_program(rng, rng.randint(1, 6))
+    interpreted, compiled, optimised = run_all_ways(instructions)
+    assert interpreted == compiled == optimised
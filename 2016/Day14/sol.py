@@ -18,12 +18,15 @@ References
 - https://www.geeksforgeeks.org/python/md5-hash-python/
 - https://en.wikipedia.org/wiki/Cryptographic_nonce
 - https://cryptopals.com/
-- https://docs.python.org/3/library/functools.html
+- https://docs.python.org/3/library/collections.html#collections.deque
+- https://docs.python.org/3/library/concurrent.futures.html#processpoolexecutor
 
 """
 import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, Future
 from typing import Iterator, Callable
-import functools
+import itertools
 import hashlib
 import re
 
@@ -37,24 +40,23 @@ def main():
         salt = file.read()
 
     print(f"Part 1: The answer is {solve_part_1(salt=salt)}")
-    print(f"Part 2: The answer is {solve_part_2(salt=salt)}")
+    print(f"Part 2: The answer is {solve_part_2(salt=salt, workers=os.cpu_count() or 1)}")
 
 
-def solve_part_1(salt: str) -> int:
+def solve_part_1(salt: str, workers: int=1) -> int:
     """"""
-    key_generator = generate_one_time_pad_keys(salt=salt)
+    key_generator = generate_one_time_pad_keys(salt=salt, workers=workers)
     one_time_pad_keys = [next(key_generator) for _ in range(64)]
     return one_time_pad_keys[63][0]
 
 
-def solve_part_2(salt: str) -> int:
+def solve_part_2(salt: str, workers: int=1) -> int:
     """"""
-    key_generator = generate_one_time_pad_keys(salt=salt, hash_function=stretched_md5_message_digest)
+    key_generator = generate_one_time_pad_keys(salt=salt, hash_function=stretched_md5_message_digest, workers=workers)
     one_time_pad_keys = [next(key_generator) for _ in range(64)]
     return one_time_pad_keys[63][0]
 
 
-@functools.cache
 def md5_message_digest(salt: str, idx: int) -> str:
     """"""
     message = salt + str(idx)
@@ -62,25 +64,94 @@ def md5_message_digest(salt: str, idx: int) -> str:
     return md5_hash.hexdigest()
 
 
-def generate_one_time_pad_keys(salt: str, hash_function: Callable[[str, int], str]=md5_message_digest) -> Iterator[tuple[int, str]]:
+# Number of subsequent hashes in the stream which are searched for a matching quintuple
+LOOKAHEAD: int = 1000
+# Number of consecutive hashes computed together as a single task
+BATCH_SIZE: int = 256
+
+TRIPLE_PATTERN = re.compile(r"(\w)\1\1")
+QUINTUPLE_PATTERN = re.compile(r"(\w)\1{4}")
+
+# Analysis of a single hash: the message digest, the character of its first triplet (if any),
+# and the set of characters which appear five times in a row
+HashAnalysis = tuple[str, str | None, frozenset[str]]
+
+
+def generate_one_time_pad_keys(
+    salt: str,
+    hash_function: Callable[[str, int], str]=md5_message_digest,
+    workers: int=1,
+    batch_size: int=BATCH_SIZE
+) -> Iterator[tuple[int, str]]:
     """Generate a given number of one-time pad keys from a pre-arranged salt
     A hash/message digest is a key only if:
     - It contains three of the same character in a row, like 777. Only consider the first such triplet in a hash.
     - One of the next 1000 hashes in the stream contains that same character five times in a row, like 77777.
+
+    Rather than rescanning the next 1000 hashes for each triplet found, a sliding window holds the analysis of
+    the next 1000 hashes in the stream, together with a count of how many of them contain each quintuple character.
+    Each hash is computed and scanned exactly once as it enters the window, and discarded once it falls behind,
+    so memory use is constant. Hashes are computed in batches, optionally across a pool of `workers` processes.
     """
+    analysed_hashes = generate_analysed_hashes(salt, hash_function, workers, batch_size)
+    window: deque[HashAnalysis] = deque(itertools.islice(analysed_hashes, LOOKAHEAD + 1))
+    quintuple_counts: Counter[str] = Counter(char for _, _, quintuples in window for char in quintuples)
+
     for i in range(0, 1 << 32):
-        candidate_key = hash_function(salt=salt, idx=i)
-        m = re.search(r"(\w)\1\1", candidate_key)
-        if m:
-            repeated_char = m.group(1)
-            for offset in range(1, 1001):
-                message_digest = hash_function(salt, idx=i+offset)
-                if re.search(repeated_char + r"{5}", message_digest):
-                    yield i, candidate_key
-                    break
-
-
-@functools.cache
+        # Evict the current hash from the window, which then spans indexes i+1 through i+1000
+        candidate_key, triple_char, quintuples = window.popleft()
+        quintuple_counts.subtract(quintuples)
+        if triple_char is not None and quintuple_counts[triple_char] > 0:
+            yield i, candidate_key
+
+        entering_hash = next(analysed_hashes)
+        window.append(entering_hash)
+        quintuple_counts.update(entering_hash[2])
+
+
+def generate_analysed_hashes(
+    salt: str,
+    hash_function: Callable[[str, int], str],
+    workers: int=1,
+    batch_size: int=BATCH_SIZE
+) -> Iterator[HashAnalysis]:
+    """Yield the analysis of each hash in the stream, in order of index, computed in batches of consecutive indexes.
+    With more than one worker, batches are computed in parallel across a process pool,
+    keeping a bounded number of batches in flight ahead of the consumer.
+    Closing the generator shuts down the pool without waiting for the batches in flight.
+    """
+    if not (isinstance(workers, int) and workers >= 1):
+        raise ValueError(f"Number of workers must be a positive integer, not {workers!r}")
+    batch_starts = range(0, 1 << 32, batch_size)
+    if workers == 1:
+        for start in batch_starts:
+            yield from analyse_hashes(salt, hash_function, start, start + batch_size)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        in_flight: deque[Future] = deque()
+        for start in batch_starts:
+            in_flight.append(executor.submit(analyse_hashes, salt, hash_function, start, start + batch_size))
+            if len(in_flight) >= 2 * workers:
+                yield from in_flight.popleft().result()
+    finally:
+        # The consumer usually stops early, closing this generator, so pending batches are cancelled and the
+        # batches already running are left to finish in the background, rather than waiting for them
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def analyse_hashes(salt: str, hash_function: Callable[[str, int], str], start: int, stop: int) -> list[HashAnalysis]:
+    """Compute and scan the hashes for a range of indexes, for use in the sliding window of `generate_one_time_pad_keys`"""
+    analysis: list[HashAnalysis] = []
+    for idx in range(start, stop):
+        message_digest = hash_function(salt=salt, idx=idx)
+        m = TRIPLE_PATTERN.search(message_digest)
+        quintuples = frozenset(QUINTUPLE_PATTERN.findall(message_digest)) if m else frozenset()
+        analysis.append((message_digest, m.group(1) if m else None, quintuples))
+    return analysis
+
+
 def stretched_md5_message_digest(salt: str, idx: int) -> str:
     """
     To implement key stretching, whenever you generate a hash, before you use it, you first find the MD5 hash of that hash, then the MD5 hash of that hash, and so on, a total of 2016 additional hashings.
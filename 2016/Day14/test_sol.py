@@ -4,9 +4,14 @@ References
 - https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
 """
 from typing import Callable
+import functools
+import itertools
+import os
+import time
 import pytest
 from sol import (
     md5_message_digest,
+    generate_analysed_hashes,
     stretched_md5_message_digest,
     generate_one_time_pad_keys,
     solve_part_1,
@@ -47,3 +52,50 @@ def test_solve_part_1():
 def test_solve_part_2():
     """Part 2 Test Case"""
     assert solve_part_2(salt="abc") == 22551
+
+
+@pytest.mark.parametrize(
+    "workers,batch_size",
+    [
+        (1, 1),
+        (1, 1000),
+        (2, 64),
+        (3, 500),
+    ]
+)
+def test_generate_one_time_pad_keys_in_batches(workers: int, batch_size: int):
+    key_generator = generate_one_time_pad_keys(salt="abc", workers=workers, batch_size=batch_size)
+    hash_indexes = [hash_idx for hash_idx, _ in itertools.islice(key_generator, 64)]
+    assert hash_indexes[:2] == [39, 92]
+    assert hash_indexes[63] == 22728
+
+
+def gated_md5_message_digest(gate_directory: str, salt: str, idx: int) -> str:
+    """Hash function which holds the start of every batch after the first until a release file appears in the gate
+    directory (or a few seconds pass), and records each held index as completed by writing a file
+    """
+    if idx >= 10 and idx % 10 == 0:
+        deadline = time.monotonic() + 5
+        while not os.path.exists(os.path.join(gate_directory, "release")) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        open(os.path.join(gate_directory, f"completed_{idx}"), 'w').close()
+    return md5_message_digest(salt=salt, idx=idx)
+
+
+def test_generate_analysed_hashes_stops_early(tmp_path):
+    """Closing the generator after the first batch returns while the batches in flight are still held at the gate,
+    rather than waiting for them to complete
+    """
+    hash_function = functools.partial(gated_md5_message_digest, str(tmp_path))
+    analysed_hashes = generate_analysed_hashes("abc", hash_function, workers=2, batch_size=10)
+    assert next(analysed_hashes)[0] == md5_message_digest(salt="abc", idx=0)
+    analysed_hashes.close()
+    completed = list(tmp_path.glob("completed_*"))
+    (tmp_path / "release").touch()
+    assert completed == []
+
+
+@pytest.mark.parametrize("workers", [0, -1, None, 1.5])
+def test_generate_analysed_hashes_invalid_workers(workers):
+    with pytest.raises(ValueError):
+        next(generate_analysed_hashes("abc", md5_message_digest, workers=workers))
@@ -18,12 +18,15 @@ References
 - https://docs.python.org/3/library/itertools.html#itertools.islice
 """
 import os
+import sys
 from collections.abc import Iterator
 import itertools
-import hashlib
 
 
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
+
+from common.hashing import generate_valid_md5_digests
 
 
 def main():
@@ -82,16 +85,10 @@ def generate_valid_md5_hash(key: str, difficulty: int) -> Iterator[str]:
     where the hash's hexadecimal representation starts with n zeroes, for some difficulty parameter `n`.
 
     An arbitrary upper bound is used for the size of the search space to prevent the hypothetical risk of an infinite loop
+    The search is delegated to the shared hashing kernel, so only the valid hashes are formatted in hexadecimal.
     """
-    if not (isinstance(difficulty, int) and 0 <= difficulty <= 32):
-        raise ValueError("Difficulty must be an integer between 0 and 32")
-
-    for i in range(0, 1 << 32):
-        message = key + str(i)
-        md5_hash = hashlib.md5(message.encode())
-        message_digest = md5_hash.hexdigest()
-        if message_digest.startswith("0" * difficulty):
-            yield message_digest
+    for _, digest in generate_valid_md5_digests(key, difficulty):
+        yield digest.hex()
 
 
 if __name__ == "__main__":
@@ -10,11 +10,22 @@ References:
 - https://en.wikipedia.org/wiki/Cellular_automaton
 - https://en.wikipedia.org/wiki/Von_Neumann_neighborhood
 - https://en.wikipedia.org/wiki/Moore_neighborhood
+- https://en.wikipedia.org/wiki/Sparse_matrix#Compressed_sparse_row_(CSR,_CRS_or_Yale_format)
+- https://numpy.org/doc/stable/reference/generated/numpy.bincount.html
 """
 import os
+import sys
 from collections.abc import Iterator, Callable
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 DIRPATH = os.path.dirname(__file__)
+sys.path.append(os.path.join(DIRPATH, os.pardir, os.pardir))
+
+from common.cellular_automata import CellGrid, CompiledRule, ArrayCellularAutomata
 
 
 def main():
@@ -31,107 +42,91 @@ def main():
 
 
 def solve_part_1(data: list[str]) -> int:
-    adjacency_seat_map = CellularAutomata(
+    adjacency_seat_map = ArrayCellularAutomata(
         initial_state=data,
-        cell_new_state_rule=SeatingUpdateRule(get_adjacent_neighbours, tolerance=4)
+        rule=CompiledRule.from_callable(SeatingUpdateRule(get_adjacent_neighbours, tolerance=4), states="L#.", counted_state="#")
     )
     adjacency_seat_map.evolve_n_generations(100)
     return adjacency_seat_map.count('#')
 
 
 def solve_part_2(data: list[str]) -> int:
-    visibility_seat_map = CellularAutomata(
-        initial_state=data,
-        cell_new_state_rule=SeatingUpdateRule(get_visible_neighbours, tolerance=5)
-    )
-    visibility_seat_map.evolve_n_generations(100)
-    return visibility_seat_map.count('#')
+    visibility_index = SeatNeighbourIndex(data, neighbourhood=visible_seat_positions)
+    return visibility_index.simulate_seating(tolerance=5, max_generations=100)
 
 
-class CellGrid:
-    """Finite two dimensional grid of cells represented by a list of strings of equal length.
-    The state of a cell is represented by a single character.
-    """
-    def __init__(self, state: list[str]):
-        self._state: list[str] = state
-
-    @property
-    def state(self) -> list[str]:
-        return self._state
-
-    @property
-    def height(self) -> int:
-        return len(self.state)
-
-    @property
-    def width(self) -> int:
-        return len(self.state[0]) if self.height > 0 else 0
-
-    def get_cell(self, i: int, j: int) -> str:
-        return self.state[i][j]
-
-    def count(self, cell_state: str) -> int:
-        """Count occurrences of a given cell state/character within the grid."""
-        return sum(row.count(cell_state) for row in self.state)
-
-    def adjacent_neighbourhood(self, i, j) -> Iterator[tuple[int, int]]:
-        """Yield all positions of adjacent neighbours to (i,j), not including itself."""
-        # Ensure we do not access out-of-bounds indexes when iterating over neighbours
-        x_start, x_end = max(i-1, 0), min(i+2, self.height)
-        y_start, y_end = max(j-1, 0), min(j+2, self.width)
-        for x in range(x_start, x_end):
-            for y in range(y_start, y_end):
-                if (x,y) != (i,j):
-                    yield (x,y)
-
-
-class CellularAutomata(CellGrid):
-    """A cellular automaton consists of
-    1. Grid: A regular grid of cells, each in one of a finite number of states
-    2. Neighourhood criteria: For each cell, a set of cells called its neighborhood is defined relative to the specified cell
-    3. Initial state: An initial state (time t = 0) is selected by assigning a state for each cell
-    4. New generation rule: A new generation is created (advancing t by 1),
-       according to some fixed rule that determines the new state of each cell
-       in terms of the current state of the cell and the states of the cells in its neighborhood.
+class SeatNeighbourIndex:
+    """Index of the neighbours of each seat in a fixed floor plan, in compressed sparse row (CSR) format.
+
+    Seats are numbered in row-major order, and the neighbours of seat k are the seats numbered
+    `neighbour_ids[offsets[k]:offsets[k+1]]`. Since the seat layout never changes, the lines of sight
+    (or any other neighbourhood) only need following once, when building the index, after which the number of
+    occupied neighbours of every seat is found by gathering the occupancy of the listed neighbours.
     """
-    def __init__(self, initial_state: list[str], cell_new_state_rule: Callable[[CellGrid, int, int], str]):
-        """Define a cellular automaton from an initial state and cell state update rule.
-        :param initial_state: An initial state (time t = 0) of a grid of cells, assigning a state for each cell
-        :param cell_new_state_rule: Returns the new state of cell (i,j) given its current state and the states of its neighbors.
+    def __init__(
+        self,
+        layout: list[str],
+        neighbourhood: Callable[[CellGrid, int, int], Iterator[tuple[int, int]]]=CellGrid.adjacent_neighbourhood,
+        use_numpy: bool | None=None
+    ):
+        """Build the index of a floor plan, where neighbourhood yields the positions of neighbouring cells of a seat,
+        of which only the seats are kept. By default, NumPy is used for the gather operations whenever it can be imported.
         """
-        super().__init__(initial_state)
-        self._cell_new_state_rule = cell_new_state_rule
-        self._t: int = 0
-
-    def grid_new_state(self) -> tuple[list[str], int]:
-        """Return tuple of new state after applying an update rule to each cell, together with how many cells have changed state.
-
-        `cell_new_state_rule` is some fixed rule that determines the new state of each cell
-        in terms of the current state of the cell and the states of the cells in its neighborhood.
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.use_numpy: bool = np is not None if use_numpy is None else use_numpy
+
+        cell_grid = CellGrid(layout)
+        self.seats: list[tuple[int, int]] = [
+            (i, j) for i, row in enumerate(layout) for j, cell in enumerate(row) if cell in {'L', '#'}
+        ]
+        seat_ids: dict[tuple[int, int], int] = {position: k for k, position in enumerate(self.seats)}
+        self.initially_occupied: list[bool] = [layout[i][j] == '#' for i, j in self.seats]
+
+        self.offsets: list[int] = [0]
+        self.neighbour_ids: list[int] = []
+        for i, j in self.seats:
+            self.neighbour_ids.extend(seat_ids[position] for position in neighbourhood(cell_grid, i, j) if position in seat_ids)
+            self.offsets.append(len(self.neighbour_ids))
+
+        if self.use_numpy:
+            self._neighbour_ids = np.array(self.neighbour_ids, dtype=np.intp)
+            # Seat whose neighbour list each entry of `neighbour_ids` belongs to
+            self._edge_seat_ids = np.repeat(np.arange(len(self.seats)), np.diff(self.offsets))
+
+    def occupied_neighbour_counts(self, occupied):
+        """Return the number of occupied neighbours of each seat, given the occupancy of each seat"""
+        if self.use_numpy:
+            return np.bincount(self._edge_seat_ids, weights=occupied[self._neighbour_ids], minlength=len(self.seats))
+        neighbour_ids = self.neighbour_ids
+        return [
+            sum(occupied[k] for k in neighbour_ids[start:stop])
+            for start, stop in zip(self.offsets, self.offsets[1:])
+        ]
+
+    def simulate_seating(self, tolerance: int, max_generations: int) -> int:
+        """Apply the seating rule of `SeatingUpdateRule` to every seat at once until no seats change state,
+        or up to a maximum number of generations, returning the number of occupied seats
         """
-        new_state: list[str] = []
-        num_changes: int = 0
-        # Apply the update rule to every cell simultaneously, storing the result in a new 2D array
-        for i in range(self.height):
-            new_row: str = ""
-            for j in range(self.width):
-                new_cell = self._cell_new_state_rule(self, i, j)
-                new_row += new_cell
-                num_changes += (new_cell != self.get_cell(i, j))
-            new_state.append(new_row)
-
-        return new_state, num_changes
-
-    def evolve_n_generations(self, n: int) -> None:
-        """Calculate the state of a cellular automaton after n new generations"""
-        for i in range(n):
-            new_state, num_changes = self.grid_new_state()
+        if self.use_numpy:
+            occupied = np.array(self.initially_occupied, dtype=bool)
+        else:
+            occupied = list(self.initially_occupied)
+
+        for i in range(max_generations):
+            counts = self.occupied_neighbour_counts(occupied)
+            if self.use_numpy:
+                new_occupied = np.where(occupied, counts < tolerance, counts == 0)
+                num_changes = int(np.count_nonzero(new_occupied != occupied))
+            else:
+                new_occupied = [count < tolerance if seat else count == 0 for seat, count in zip(occupied, counts)]
+                num_changes = sum(seat != new_seat for seat, new_seat in zip(occupied, new_occupied))
             if num_changes == 0:
-                # A stable, homogeneous state has been reached, so we can return early without further calculation
                 print(f"Reached equilibrium state after {i} iterations.")
                 break
-            self._state = new_state
-        self._t += n
+            occupied = new_occupied
+
+        return int(sum(occupied))
 
 
 class SeatingUpdateRule:
@@ -175,6 +170,21 @@ def get_visible_neighbours(cell_grid: CellGrid, i: int, j: int) -> Iterator[str]
         yield line_of_sight(cell_grid, i, j, direction)
 
 
+def visible_seat_positions(cell_grid: CellGrid, i: int, j: int) -> Iterator[tuple[int, int]]:
+    """Yield positions of the first seat visible in each of the eight lines-of-sight from cell (i,j), if any.
+    Floor never changes, so the lines of sight are followed once per seat, when building the neighbour lists
+    of a `SeatNeighbourIndex`, rather than at every generation.
+    """
+    for x_shift, y_shift in [(1,0), (1,1), (0,1), (-1,1), (-1,0), (-1,-1), (0,-1), (1,-1)]:
+        x_offset, y_offset = i + x_shift, j + y_shift
+        while (0 <= x_offset < cell_grid.height) and (0 <= y_offset < cell_grid.width):
+            if cell_grid.get_cell(x_offset, y_offset) in {'L', '#'}:
+                yield x_offset, y_offset
+                break
+            x_offset += x_shift
+            y_offset += y_shift
+
+
 def line_of_sight(cell_grid: CellGrid, i: int, j: int, direction: tuple[int, int]) -> str:
     """Return the state of the first seat visible from (i,j) when looking towards `direction`.
     Follow line of sight (i,j) + k * `direction`, k > 0 until we find an empty (L) or
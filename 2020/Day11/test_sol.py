@@ -0,0 +1,67 @@
+"""Testing functions for 2020 Day 11
+
+References
+- https://docs.pytest.org/en/stable/how-to/fixtures.html
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import random
+import pytest
+from sol import (
+    np,
+    solve_part_1,
+    solve_part_2,
+    CellGrid,
+    SeatNeighbourIndex,
+    SeatingUpdateRule,
+    get_adjacent_neighbours,
+    get_visible_neighbours,
+    visible_seat_positions
+)
+from common.cellular_automata import CellularAutomata
+
+BACKENDS = [False] + ([True] if np is not None else [])
+
+
+@pytest.fixture
+def example_layout() -> list[str]:
+    return [
+        "L.LL.LL.LL",
+        "LLLLLLL.LL",
+        "L.L.L..L..",
+        "LLLL.LL.LL",
+        "L.LL.LL.LL",
+        "L.LLLLL.LL",
+        "..L.L.....",
+        "LLLLLLLLLL",
+        "L.LLLLLL.L",
+        "L.LLLLL.LL"
+    ]
+
+
+def test_solve_part_1(example_layout: list[str]):
+    assert solve_part_1(example_layout) == 37
+
+
+def test_solve_part_2(example_layout: list[str]):
+    assert solve_part_2(example_layout) == 26
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize(
+    "get_neighbours,neighbourhood,tolerance",
+    [
+        (get_adjacent_neighbours, CellGrid.adjacent_neighbourhood, 4),
+        (get_visible_neighbours, visible_seat_positions, 5)
+    ]
+)
+def test_seat_neighbour_index_matches_cellular_automata(get_neighbours, neighbourhood, tolerance: int, seed: int, use_numpy: bool):
+    """Evolve random floor plans to equilibrium in a single call of each engine, where the sparse floor plans
+    make lines of sight reach seats far beyond the adjacent cells
+    """
+    rng = random.Random(seed)
+    layout = ["".join(rng.choice("LL#....") for _ in range(23)) for _ in range(19)]
+    expected = CellularAutomata(layout, SeatingUpdateRule(get_neighbours, tolerance))
+    expected.evolve_n_generations(100)
+    index = SeatNeighbourIndex(layout, neighbourhood=neighbourhood, use_numpy=use_numpy)
+    assert index.simulate_seating(tolerance, max_generations=100) == expected.count('#')
@@ -0,0 +1,46 @@
+"""Testing functions for 2025 Day 4
+
+References
+- https://docs.pytest.org/en/stable/how-to/fixtures.html
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import pytest
+from sol import identify_accessible_paper_roll
+from common.cellular_automata import np, CellularAutomata, CompiledRule, ArrayCellularAutomata
+
+BACKENDS = [False] + ([True] if np is not None else [])
+
+
+@pytest.fixture
+def example_grid() -> list[str]:
+    return [
+        "..@@.@@@@.",
+        "@@@.@@@.@@",
+        "@@@@@.@.@@",
+        "@.@@@@..@.",
+        "@@.@@@@.@@",
+        ".@@@@@@@.@",
+        ".@.@.@.@@@",
+        "@.@@@.@@@@",
+        ".@@@@@@@@.",
+        "@.@.@@@.@.",
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("incremental", [False, True])
+def test_paper_roll_removal(example_grid: list[str], incremental: bool, use_numpy: bool):
+    """Compare against applying the rule function to every cell of the grid in each generation"""
+    expected = CellularAutomata(example_grid, identify_accessible_paper_roll)
+    paper_roll_grid = ArrayCellularAutomata(
+        initial_state=example_grid,
+        rule=CompiledRule.from_callable(identify_accessible_paper_roll, states="@x.", counted_state="@"),
+        use_numpy=use_numpy
+    )
+    expected.evolve_n_generations(1)
+    paper_roll_grid.evolve_n_generations(1)
+    assert paper_roll_grid.state == expected.state
+    expected.evolve_n_generations(10_000)
+    paper_roll_grid.evolve_n_generations(10_000, incremental=incremental)
+    assert paper_roll_grid.state == expected.state
+    assert 0 < paper_roll_grid.count('x') < sum(row.count('@') for row in example_grid)
@@ -0,0 +1,5 @@
+"""Utilities shared between the solutions of several days' puzzles
+
+The solutions are run as scripts from within their own day's directory,
+so they add the repository root to `sys.path` before importing from this package.
+"""
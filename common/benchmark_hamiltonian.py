@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark comparing the shortest Hamiltonian path found by checking every permutation of the vertices
+against the Held-Karp algorithm with its table stored in an `array.array` or a NumPy array,
+on randomly generated complete graphs with symmetric weights, like the distances of 2015 Day 9
+
+Run from the repository root with `python -m common.benchmark_hamiltonian`
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+from collections.abc import Callable
+from time import perf_counter
+import itertools
+import random
+
+from common.hamiltonian import np, hamiltonian_path
+
+
+def generate_distances(n_vertices: int, seed: int=2015) -> dict[tuple[str, str], int]:
+    """Generate random symmetric distances between every pair of a number of locations"""
+    rng = random.Random(seed)
+    distances: dict[tuple[str, str], int] = {}
+    for start, end in itertools.combinations((f"Location{k}" for k in range(n_vertices)), 2):
+        distances[(start, end)] = distances[(end, start)] = rng.randint(1, 150)
+    return distances
+
+
+def shortest_path_by_permutations(distances: dict[tuple[str, str], int]) -> int:
+    """Reference implementation which calculates the length of the path through every permutation of the vertices"""
+    vertices = sorted({vertex for edge in distances for vertex in edge})
+    return min(
+        sum(distances[(loc_1, loc_2)] for loc_1, loc_2 in zip(route, route[1:]))
+        for route in itertools.permutations(vertices)
+    )
+
+
+def main(n_small: int=9, n_large: int=20):
+    implementations: dict[str, Callable[[dict[tuple[str, str], int]], int]] = {
+        "Every permutation": shortest_path_by_permutations,
+        "Held-Karp (array)": lambda distances: hamiltonian_path(distances, use_numpy=False)[0],
+    }
+    if np is not None:
+        implementations["Held-Karp (NumPy)"] = lambda distances: hamiltonian_path(distances, use_numpy=True)[0]
+
+    distances = generate_distances(n_small)
+    results: dict[str, int] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(distances)
+        t_stop = perf_counter()
+        print(f"{name}: {results[name]} for {n_small} locations in {(t_stop - t_start) * 1000:.1f} milliseconds")
+    assert len(set(results.values())) == 1, results
+
+    if np is not None:
+        distances = generate_distances(n_large)
+        t_start = perf_counter()
+        length, _ = hamiltonian_path(distances, use_numpy=True)
+        t_stop = perf_counter()
+        print(f"Held-Karp (NumPy): {length} for {n_large} locations in {(t_stop - t_start) * 1000:.1f} milliseconds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark comparing the throughput of the shared MD5 hashing kernel
+against hashing each message `key + str(i)` from scratch and comparing its `hexdigest()`
+
+Run from the repository root with `python -m common.benchmark_hashing`
+
+References
+- https://docs.python.org/3/library/time.html#time.perf_counter
+"""
+from collections.abc import Callable
+from time import perf_counter
+import hashlib
+
+from common.hashing import generate_valid_md5_digests
+
+
+def count_valid_hashes_naive(key: str, difficulty: int, start: int, stop: int) -> int:
+    """Reference implementation which builds, hashes, and formats every candidate message in full"""
+    count: int = 0
+    for i in range(start, stop):
+        message = key + str(i)
+        md5_hash = hashlib.md5(message.encode())
+        message_digest = md5_hash.hexdigest()
+        if message_digest.startswith("0" * difficulty):
+            count += 1
+    return count
+
+
+def count_valid_hashes_kernel(key: str, difficulty: int, start: int, stop: int) -> int:
+    return sum(1 for _ in generate_valid_md5_digests(key, difficulty, start, stop))
+
+
+def main(key: str="abcdef", difficulty: int=3, start: int=1_000_000, n_hashes: int=1_000_000):
+    implementations: dict[str, Callable[[str, int, int, int], int]] = {
+        "Naive (key + str(i), hexdigest)": count_valid_hashes_naive,
+        "Kernel (prefix reuse, digest bytes)": count_valid_hashes_kernel,
+    }
+    results: dict[str, int] = {}
+    timings: dict[str, float] = {}
+    for name, implementation in implementations.items():
+        t_start = perf_counter()
+        results[name] = implementation(key, difficulty, start, start + n_hashes)
+        timings[name] = perf_counter() - t_start
+    assert len(set(results.values())) == 1, results
+
+    baseline = timings[next(iter(timings))]
+    for name, elapsed in timings.items():
+        print(f"{name}: {n_hashes / elapsed / 1e6:.2f} million hashes per second ({baseline / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
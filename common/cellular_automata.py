@@ -0,0 +1,338 @@
+"""
+Cellular automata on finite two dimensional grids of cells, shared by 2015 Day 18, 2020 Day 11, and 2025 Day 4
+
+- `CellGrid` and `CellularAutomata` represent the grid as a list of strings and call a rule function per cell,
+  which can express any rule, such as those depending on the position of a cell or on lines of sight.
+- `ArrayCellularAutomata` stores the grid as an array of integer state codes, counts live neighbours for every cell
+  at once by adding shifted copies of the grid, and looks up each cell's new state in a table indexed by its
+  current state and neighbour count. It uses NumPy when available, otherwise rows of bytes, which can optionally
+  be evolved incrementally, re-evaluating only the cells around those which changed in the previous generation.
+- `CompiledRule` adapts an existing rule function into such a lookup table,
+  provided the rule is outer totalistic, i.e. depends only on the state of the cell
+  and on how many of its eight adjacent neighbours are in a particular state.
+
+References
+- https://en.wikipedia.org/wiki/Cellular_automaton
+- https://en.wikipedia.org/wiki/Moore_neighborhood
+- https://en.wikipedia.org/wiki/Life-like_cellular_automaton
+- https://numpy.org/doc/stable/user/basics.indexing.html#integer-array-indexing
+"""
+from __future__ import annotations
+from collections.abc import Iterator, Callable
+import itertools
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CellGrid:
+    """Finite two dimensional grid of cells represented by a list of strings of equal length.
+    The state of a cell is represented by a single character.
+    """
+    def __init__(self, state: list[str]):
+        self._state: list[str] = state
+
+    @property
+    def state(self) -> list[str]:
+        return self._state
+
+    @property
+    def height(self) -> int:
+        return len(self.state)
+
+    @property
+    def width(self) -> int:
+        return len(self.state[0]) if self.height > 0 else 0
+
+    def get_cell(self, i: int, j: int) -> str:
+        return self.state[i][j]
+
+    def count(self, cell_state: str) -> int:
+        """Count occurrences of a given cell state/character within the grid."""
+        return sum(row.count(cell_state) for row in self.state)
+
+    def adjacent_neighbourhood(self, i, j) -> Iterator[tuple[int, int]]:
+        """Yield all positions of adjacent neighbours to (i,j), not including itself."""
+        # Ensure we do not access out-of-bounds indexes when iterating over neighbours
+        x_start, x_end = max(i-1, 0), min(i+2, self.height)
+        y_start, y_end = max(j-1, 0), min(j+2, self.width)
+        for x in range(x_start, x_end):
+            for y in range(y_start, y_end):
+                if (x,y) != (i,j):
+                    yield (x,y)
+
+
+class CellularAutomata(CellGrid):
+    """A cellular automaton consists of
+    1. Grid: A regular grid of cells, each in one of a finite number of states
+    2. Neighourhood criteria: For each cell, a set of cells called its neighborhood is defined relative to the specified cell
+    3. Initial state: An initial state (time t = 0) is selected by assigning a state for each cell
+    4. New generation rule: A new generation is created (advancing t by 1),
+       according to some fixed rule that determines the new state of each cell
+       in terms of the current state of the cell and the states of the cells in its neighborhood.
+    """
+    def __init__(self, initial_state: list[str], cell_new_state_rule: Callable[[CellGrid, int, int], str]):
+        """Define a cellular automaton from an initial state and cell state update rule.
+        :param initial_state: An initial state (time t = 0) of a grid of cells, assigning a state for each cell
+        :param cell_new_state_rule: Returns the new state of cell (i,j) given its current state and the states of its neighbors.
+        """
+        super().__init__(initial_state)
+        self._cell_new_state_rule = cell_new_state_rule
+        self._t: int = 0
+
+    def grid_new_state(self) -> tuple[list[str], int]:
+        """Return tuple of new state after applying an update rule to each cell, together with how many cells have changed state.
+
+        `cell_new_state_rule` is some fixed rule that determines the new state of each cell
+        in terms of the current state of the cell and the states of the cells in its neighborhood.
+        """
+        new_state: list[str] = []
+        num_changes: int = 0
+        # Apply the update rule to every cell simultaneously, storing the result in a new 2D array
+        for i in range(self.height):
+            new_row: str = ""
+            for j in range(self.width):
+                new_cell = self._cell_new_state_rule(self, i, j)
+                new_row += new_cell
+                num_changes += (new_cell != self.get_cell(i, j))
+            new_state.append(new_row)
+
+        return new_state, num_changes
+
+    def evolve_n_generations(self, n: int) -> None:
+        """Calculate the state of a cellular automaton after n new generations"""
+        for i in range(n):
+            new_state, num_changes = self.grid_new_state()
+            if num_changes == 0:
+                # A stable, homogeneous state has been reached, so we can return early without further calculation
+                print(f"Reached equilibrium state after {i} iterations.")
+                break
+            self._state = new_state
+        self._t += n
+
+
+class CompiledRule:
+    """Outer totalistic cell update rule, stored as a lookup table of the new state of a cell
+    indexed by the cell's current state and the number of its adjacent neighbours in the `counted_state`.
+    """
+    def __init__(self, states: str, counted_state: str, table: dict[str, list[str]]):
+        """
+        :param states: The characters representing each possible state of a cell
+        :param counted_state: The state of the neighbours which are counted by the rule, such as live cells
+        :param table: Maps each state to a list of nine new states, indexed by the neighbour count from 0 to 8
+        """
+        if counted_state not in states:
+            raise ValueError(f"Counted state {counted_state!r} is not one of the states {states!r}")
+        if set(table) != set(states) or any(len(new_states) != 9 for new_states in table.values()):
+            raise ValueError("Table must list the new state for each of 0 to 8 neighbours, for every state")
+        if any(new_state not in states for new_states in table.values() for new_state in new_states):
+            raise ValueError("Table must only contain the given states")
+        self.states: str = states
+        self.counted_state: str = counted_state
+        self.table: dict[str, list[str]] = table
+
+    @classmethod
+    def from_callable(cls, rule: Callable[[CellGrid, int, int], str], states: str, counted_state: str) -> CompiledRule:
+        """Compile a rule function for `CellularAutomata` into a lookup table by evaluating it at the centre of
+        3x3 grids covering each combination of cell state and neighbour count.
+        The neighbourhood is filled in several arrangements, with each of the other states as background,
+        to check that the rule really only depends on the number of counted neighbours.
+        Rules which depend on the position of the cell within the grid cannot be detected, and should instead
+        be expressed with the `fixed_cells` of an `ArrayCellularAutomata`.
+        """
+        background_states = [state for state in states if state != counted_state] or [counted_state]
+        neighbour_positions = [(x, y) for x in range(3) for y in range(3) if (x, y) != (1, 1)]
+        table: dict[str, list[str]] = {}
+        for state in states:
+            table[state] = []
+            for n_counted in range(9):
+                outcomes: set[str] = set()
+                for background in background_states:
+                    # Place the counted neighbours first, last, and alternately around the neighbourhood
+                    for arrangement in (neighbour_positions, neighbour_positions[::-1], neighbour_positions[::2] + neighbour_positions[1::2]):
+                        grid = [[background] * 3 for _ in range(3)]
+                        grid[1][1] = state
+                        for x, y in arrangement[:n_counted]:
+                            grid[x][y] = counted_state
+                        outcomes.add(rule(CellGrid(["".join(row) for row in grid]), 1, 1))
+                if len(outcomes) != 1:
+                    raise ValueError(
+                        f"Rule is not outer totalistic: a {state!r} cell with {n_counted} {counted_state!r} neighbours "
+                        f"can become any of {sorted(outcomes)}"
+                    )
+                table[state].append(outcomes.pop())
+        return cls(states, counted_state, table)
+
+
+class ArrayCellularAutomata:
+    """Cellular automaton with an outer totalistic rule, evolving the whole grid at once.
+
+    Cell states are stored as integer codes (their index in the rule's `states`), in a 2D NumPy array if available,
+    otherwise in a list of bytearrays. For each generation, the number of counted neighbours of every cell
+    is found by adding the eight shifted copies of a zero-padded mask of the counted cells,
+    then each cell's new state code is looked up in the compiled rule's table.
+    """
+    def __init__(
+        self,
+        initial_state: list[str],
+        rule: CompiledRule,
+        fixed_cells: dict[tuple[int, int], str] | None=None,
+        use_numpy: bool | None=None
+    ):
+        """Define a cellular automaton from an initial state and compiled update rule.
+        :param initial_state: An initial state (time t = 0) of a grid of cells, assigning a state for each cell
+        :param rule: The compiled rule, whose states must include every state in the initial state
+        :param fixed_cells: Positions of cells which are stuck in a given state, regardless of the rule
+        :param use_numpy: Whether to use NumPy arrays, by default whenever NumPy can be imported
+        """
+        if use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+        self.use_numpy: bool = np is not None if use_numpy is None else use_numpy
+        self.rule = rule
+        self._t: int = 0
+
+        codes: dict[str, int] = {state: code for code, state in enumerate(rule.states)}
+        self._counted_code: int = codes[rule.counted_state]
+        # Flattened lookup table of new state codes, indexed by `9 * state_code + neighbour_count`
+        flat_table: list[int] = [codes[new_state] for state in rule.states for new_state in rule.table[state]]
+        self._fixed_cells: list[tuple[int, int, int]] = [(i, j, codes[state]) for (i, j), state in (fixed_cells or {}).items()]
+
+        rows: list[bytearray] = [bytearray(codes[cell] for cell in row) for row in initial_state]
+        if self.use_numpy:
+            self._table = np.array(flat_table, dtype=np.uint8)
+            self._state = np.array([list(row) for row in rows], dtype=np.uint8)
+        else:
+            self._table = bytes(flat_table)
+            self._state = rows
+        self._apply_fixed_cells(self._state)
+
+    @property
+    def height(self) -> int:
+        return len(self._state)
+
+    @property
+    def width(self) -> int:
+        return len(self._state[0]) if self.height > 0 else 0
+
+    @property
+    def t(self) -> int:
+        return self._t
+
+    @property
+    def state(self) -> list[str]:
+        """The grid as a list of strings, in the same representation as `CellGrid`"""
+        return ["".join(self.rule.states[code] for code in row) for row in self._state]
+
+    def count(self, cell_state: str) -> int:
+        """Count occurrences of a given cell state/character within the grid."""
+        if cell_state not in self.rule.states:
+            return 0
+        code = self.rule.states.index(cell_state)
+        if self.use_numpy:
+            return int(np.count_nonzero(self._state == code))
+        return sum(row.count(code) for row in self._state)
+
+    def _apply_fixed_cells(self, state) -> None:
+        for i, j, code in self._fixed_cells:
+            state[i][j] = code
+
+    def neighbour_counts(self):
+        """Return the number of adjacent neighbours in the counted state, for every cell"""
+        if self.use_numpy:
+            padded = np.zeros((self.height + 2, self.width + 2), dtype=np.uint8)
+            padded[1:-1, 1:-1] = self._state == self._counted_code
+            counts = np.zeros((self.height, self.width), dtype=np.uint8)
+            for dx, dy in itertools.product(range(3), repeat=2):
+                if (dx, dy) != (1, 1):
+                    counts += padded[dx:dx + self.height, dy:dy + self.width]
+            return counts
+
+        counted_code = self._counted_code
+        zero_row = [0] * (self.width + 2)
+        padded_rows = [zero_row] + [[0, *(code == counted_code for code in row), 0] for row in self._state] + [zero_row]
+        counts: list[list[int]] = []
+        for above, middle, below in zip(padded_rows, padded_rows[1:], padded_rows[2:]):
+            # Sum each column of the 3x3 neighbourhood, then sum three adjacent columns, excluding the cell itself
+            column_sums = [a + b + c for a, b, c in zip(above, middle, below)]
+            counts.append([
+                left + centre + right - cell
+                for left, centre, right, cell in zip(column_sums, column_sums[1:], column_sums[2:], middle[1:])
+            ])
+        return counts
+
+    def grid_new_state(self) -> tuple:
+        """Return tuple of new state after applying the rule to each cell, together with how many cells have changed state."""
+        counts = self.neighbour_counts()
+        if self.use_numpy:
+            new_state = self._table[9 * self._state.astype(np.intp) + counts]
+            self._apply_fixed_cells(new_state)
+            return new_state, int(np.count_nonzero(new_state != self._state))
+
+        table = self._table
+        new_state = [
+            bytearray(table[9 * code + count] for code, count in zip(row, row_counts))
+            for row, row_counts in zip(self._state, counts)
+        ]
+        self._apply_fixed_cells(new_state)
+        num_changes = sum(
+            sum(old != new for old, new in zip(row, new_row)) if row != new_row else 0
+            for row, new_row in zip(self._state, new_state)
+        )
+        return new_state, num_changes
+
+    def evolve_n_generations(self, n: int, incremental: bool=False) -> None:
+        """Calculate the state of a cellular automaton after n new generations
+
+        In incremental mode, and without NumPy, each generation only re-evaluates the active frontier of cells which
+        changed state in the previous generation, together with their neighbours, since the state and neighbour count
+        of any other cell are the same as in the previous generation, so its state cannot change either.
+        This is faster when few cells change per generation, such as when approaching equilibrium.
+        With NumPy, evaluating the whole grid at once is faster still, so the mode has no effect.
+        """
+        if incremental and not self.use_numpy:
+            self._evolve_active_frontier(n)
+            return
+        for i in range(n):
+            new_state, num_changes = self.grid_new_state()
+            if num_changes == 0:
+                # A stable, homogeneous state has been reached, so we can return early without further calculation
+                print(f"Reached equilibrium state after {i} iterations.")
+                break
+            self._state = new_state
+        self._t += n
+
+    def _evolve_active_frontier(self, n: int) -> None:
+        """Evolve the rows of bytes in place for n generations, keeping the neighbour count of every cell up to date
+        as cells enter and leave the counted state, and only re-evaluating the cells around those which changed
+        """
+        state, table, counted_code = self._state, self._table, self._counted_code
+        height, width = self.height, self.width
+        counts: list[list[int]] = self.neighbour_counts()
+        fixed_cells: set[tuple[int, int]] = {(i, j) for i, j, _ in self._fixed_cells}
+        active_cells: set[tuple[int, int]] = set(itertools.product(range(height), range(width)))
+        for generation in range(n):
+            changes: list[tuple[int, int, int]] = []
+            for i, j in active_cells:
+                code = state[i][j]
+                new_code = table[9 * code + counts[i][j]]
+                if new_code != code and (i, j) not in fixed_cells:
+                    changes.append((i, j, new_code))
+            if not changes:
+                # A stable, homogeneous state has been reached, so we can return early without further calculation
+                print(f"Reached equilibrium state after {generation} iterations.")
+                break
+
+            # Apply every change only after all of the new states are known, so that cells update simultaneously
+            active_cells = set()
+            for i, j, new_code in changes:
+                delta = (new_code == counted_code) - (state[i][j] == counted_code)
+                state[i][j] = new_code
+                for x in range(max(i - 1, 0), min(i + 2, height)):
+                    row_counts = counts[x]
+                    for y in range(max(j - 1, 0), min(j + 2, width)):
+                        active_cells.add((x, y))
+                        if delta and (x, y) != (i, j):
+                            row_counts[y] += delta
+        self._t += n
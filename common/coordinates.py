@@ -0,0 +1,100 @@
+"""
+Compact coordinates on a 2D grid, shared by puzzles which walk long paths and record the positions visited,
+such as 2015 Day 3 (houses visited by Santa) and 2016 Day 1 (first location visited twice by the taxi)
+
+Allocating a new `Vector` object for every step, and hashing it into a set of visited positions, dominates the time
+and memory taken to walk a long path. Instead, a position (i, j) is packed into the single integer `i * STRIDE + j`:
+- packing is linear, so adding packed positions adds the vectors, and a walk is a running sum of packed steps,
+  which `itertools.accumulate` computes without running any Python code per step
+- small integers are stored and hashed more cheaply than objects, so sets of visited positions are compact
+- the positions of a straight line of steps form a `range` of packed integers, which sets can be updated from directly
+Coordinates must satisfy `abs(j) <= STRIDE // 2` for the packing to be unique, and `i` is unbounded.
+The stride is odd rather than a power of two, so that both coordinates affect the low bits of a packed position.
+Sets choose the slot of an integer from the low bits of its hash (the integer itself), so with a power of two stride
+all positions with the same second coordinate would collide.
+
+The `Vector` dataclass remains as a facade for code which works with the coordinates of individual positions,
+and converts to and from packed integers.
+
+References
+- https://docs.python.org/3/library/itertools.html#itertools.accumulate
+- https://docs.python.org/3/library/stdtypes.html#ranges
+- https://docs.python.org/3/library/dataclasses.html
+"""
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+import itertools
+
+
+# Multiplier of the first coordinate in a packed position, an odd number large enough for the second coordinate
+STRIDE: int = 3_000_000_019
+_HALF_STRIDE: int = STRIDE // 2
+
+
+def pack(i: int, j: int) -> int:
+    """Pack the coordinates of a position into a single integer"""
+    return i * STRIDE + j
+
+
+def unpack(position: int) -> tuple[int, int]:
+    """Return the coordinates of a packed position"""
+    j = (position + _HALF_STRIDE) % STRIDE - _HALF_STRIDE
+    return (position - j) // STRIDE, j
+
+
+def manhattan_norm(position: int) -> int:
+    """Return the L1 (taxicab) distance of a packed position from the origin"""
+    i, j = unpack(position)
+    return abs(i) + abs(j)
+
+
+@dataclass(frozen=True)
+class Vector:
+    i: int
+    j: int
+
+    def __add__(self, other):
+        return Vector(self.i + other.i, self.j + other.j)
+
+    def __sub__(self, other):
+        return Vector(self.i - other.i, self.j - other.j)
+
+    def __mul__(self, scalar: int):
+        return Vector(self.i * scalar, self.j * scalar)
+
+    def __rmul__(self, scalar: int):
+        """Swap order of operands to re-use implementation of __mul__
+        https://docs.python.org/3/reference/datamodel.html#emulating-numeric-types
+        """
+        return self * scalar
+
+    def __abs__(self):
+        return abs(self.i) + abs(self.j)
+
+    @property
+    def packed(self) -> int:
+        return pack(self.i, self.j)
+
+    @classmethod
+    def from_packed(cls, position: int):
+        return cls(*unpack(position))
+
+
+# Packed unit steps of the arrows used in puzzle inputs, and of the cardinal directions clockwise from North
+ARROW_STEPS: dict[str, int] = {'^': pack(0, 1), 'v': pack(0, -1), '>': pack(1, 0), '<': pack(-1, 0)}
+CARDINAL_STEPS: list[int] = [pack(0, 1), pack(1, 0), pack(0, -1), pack(-1, 0)]
+
+
+def walk(steps: Iterable[int], start: int=0) -> Iterator[int]:
+    """Yield the packed positions of a walk from the start position, including the start, taking each packed step in turn"""
+    return itertools.accumulate(steps, initial=start)
+
+
+def walk_arrows(arrows: str, start: int=0) -> Iterator[int]:
+    """Yield the packed positions of a walk from the start position, including the start, following a string of arrows"""
+    return walk(map(ARROW_STEPS.__getitem__, arrows), start)
+
+
+def line(start: int, step: int, distance: int) -> range:
+    """Return the packed positions reached by taking `distance` steps in a straight line from (and excluding) the start"""
+    return range(start + step, start + step * (distance + 1), step) if distance > 0 else range(0)
@@ -0,0 +1,140 @@
+"""
+Optimal Hamiltonian paths and cycles by the Held-Karp dynamic programming algorithm,
+shared by 2015 Day 9 (routes through every location) and 2015 Day 13 (circular seating arrangements)
+
+Graphs are given as dictionaries of weights of directed edges `(u, v) -> weight`, as read from the puzzle inputs,
+where pairs missing from the dictionary are not joined by an edge. Weights are minimised or maximised.
+
+The table `best[mask, k]` holds the best weight of a path which visits exactly the set of vertices in the bitmask `mask`
+and ends at vertex k, and is filled in by extending the best paths over `mask` without k by a final edge to k.
+This takes O(n^2 2^n) time rather than the O(n!) of checking every permutation, so 20 or more vertices are feasible.
+The table is stored as a flat array of `2^n * n` floating point numbers (which represent integers exactly,
+and infinity for unreachable entries), either a NumPy array, filled in one layer of equally sized masks at a time,
+or otherwise an `array.array` filled in one entry at a time.
+
+References
+- https://en.wikipedia.org/wiki/Held%E2%80%93Karp_algorithm
+- https://en.wikipedia.org/wiki/Hamiltonian_path
+- https://docs.python.org/3/library/array.html
+- https://numpy.org/doc/stable/user/basics.indexing.html#integer-array-indexing
+"""
+from array import array
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def hamiltonian_path(
+    weights: dict[tuple[str, str], int], maximise: bool=False, use_numpy: bool | None=None
+) -> tuple[int, list[str]]:
+    """Return the minimum (or maximum) total weight of a path visiting every vertex exactly once, with such a path.
+    Raises ValueError if there is no such path.
+    """
+    return _optimal_route(weights, maximise, cycle=False, use_numpy=use_numpy)
+
+
+def hamiltonian_cycle(
+    weights: dict[tuple[str, str], int], maximise: bool=False, use_numpy: bool | None=None
+) -> tuple[int, list[str]]:
+    """Return the minimum (or maximum) total weight of a cycle visiting every vertex exactly once, with such a cycle
+    (listed from its first vertex, without repeating it at the end). Raises ValueError if there is no such cycle.
+    """
+    return _optimal_route(weights, maximise, cycle=True, use_numpy=use_numpy)
+
+
+def _optimal_route(
+    weights: dict[tuple[str, str], int], maximise: bool, cycle: bool, use_numpy: bool | None
+) -> tuple[int, list[str]]:
+    if use_numpy and np is None:
+        raise ImportError("NumPy is not installed")
+    if use_numpy is None:
+        use_numpy = np is not None
+
+    vertices: list[str] = sorted({vertex for edge in weights for vertex in edge})
+    n = len(vertices)
+    if n == 0:
+        raise ValueError("The graph has no vertices")
+    index: dict[str, int] = {vertex: k for k, vertex in enumerate(vertices)}
+    # Weight matrix, negated when maximising so that the table is always minimised
+    sign = -1 if maximise else 1
+    matrix: list[list[float]] = [[math.inf] * n for _ in range(n)]
+    for (u, v), weight in weights.items():
+        if u != v:
+            matrix[index[u]][index[v]] = sign * weight
+
+    # Paths start at any vertex, while cycles are rotated to start at vertex 0
+    starts: list[int] = [0] if cycle else list(range(n))
+    table = _held_karp_table_numpy(matrix, starts) if use_numpy else _held_karp_table(matrix, starts)
+
+    full_mask = (1 << n) - 1
+    if cycle and n > 1:
+        totals = [table[full_mask * n + k] + matrix[k][0] for k in range(n)]
+    else:
+        totals = [table[full_mask * n + k] for k in range(n)]
+    best = min(totals)
+    if best == math.inf:
+        raise ValueError(f"The graph has no Hamiltonian {'cycle' if cycle else 'path'}")
+
+    # Trace back the route from its last vertex, finding a predecessor which achieves each entry of the table
+    last = totals.index(best)
+    route: list[int] = [last]
+    mask = full_mask
+    while mask != 1 << last:
+        previous_mask = mask ^ (1 << last)
+        last = next(
+            j for j in range(n)
+            if previous_mask >> j & 1 and table[previous_mask * n + j] + matrix[j][last] == table[mask * n + last]
+        )
+        route.append(last)
+        mask = previous_mask
+    route.reverse()
+    return int(sign * best), [vertices[k] for k in route]
+
+
+def _held_karp_table(matrix: list[list[float]], starts: list[int]) -> array:
+    """Fill in the flat table of best path weights `table[mask * n + k]` one entry at a time, taking masks in
+    increasing numerical order, so that every mask is complete before any larger mask which contains it
+    """
+    n = len(matrix)
+    table = array('d', [math.inf]) * (n << n)
+    for k in starts:
+        table[(1 << k) * n + k] = 0
+    for mask in range(1, 1 << n):
+        members: list[int] = [j for j in range(n) if mask >> j & 1]
+        if len(members) == 1:
+            continue
+        for k in members:
+            previous_mask = mask ^ (1 << k)
+            offset = previous_mask * n
+            table[mask * n + k] = min(table[offset + j] + matrix[j][k] for j in members if j != k)
+    return table
+
+
+def _held_karp_table_numpy(matrix: list[list[float]], starts: list[int]):
+    """Fill in the table of best path weights with NumPy, one layer of masks with the same number of vertices at a time,
+    and for each final vertex k, extending the paths over every mask in the layer without k at once.
+    Returns a flat view of the table, indexed by `mask * n + k`.
+    """
+    n = len(matrix)
+    weights = np.array(matrix, dtype=np.float64)
+    table = np.full((1 << n, n), np.inf)
+    for k in starts:
+        table[1 << k, k] = 0
+
+    masks = np.arange(1 << n)
+    sizes = np.zeros(1 << n, dtype=np.int64)
+    for k in range(n):
+        sizes += (masks >> k) & 1
+    order = np.argsort(sizes, kind="stable")
+    layer_bounds = np.cumsum(np.bincount(sizes, minlength=n + 1))
+
+    for size in range(2, n + 1):
+        layer = order[layer_bounds[size - 1]:layer_bounds[size]]
+        for k in range(n):
+            ending_at_k = layer[(layer >> k) & 1 == 1]
+            previous = table[ending_at_k ^ (1 << k)]
+            table[ending_at_k, k] = (previous + weights[:, k]).min(axis=1)
+    return table.reshape(-1)
@@ -0,0 +1,65 @@
+"""
+Shared MD5 hashing kernel for puzzles which search for hashes of a key followed by an increasing integer index
+Used by 2015 Day 4 and 2016 Day 5
+
+Rather than building and hashing the message `key + str(i)` from scratch for every candidate index:
+- The key is hashed once, and copies of the partially updated hash object are taken with `hashlib.md5().copy()`
+- Indexes are split into a block number and a three digit remainder, so that each block number is formatted
+  and hashed once per thousand candidates, and the remainders come from a precomputed table of byte strings
+- Leading zeroes are tested on the raw 16-byte `digest()` rather than formatting a 32-character `hexdigest()`
+
+References
+- https://docs.python.org/3/library/hashlib.html#hashlib.hash.copy
+- https://docs.python.org/3/library/stdtypes.html#printf-style-bytes-formatting
+"""
+from collections.abc import Iterator
+import hashlib
+
+
+# Exclusive upper bound on the size of the search space, to prevent the hypothetical risk of an infinite loop
+INDEX_LIMIT: int = 1 << 32
+# Number of consecutive indexes sharing a hashed block number prefix
+BLOCK_SIZE: int = 1000
+
+# Indexes in the first block are written without leading zeroes, whereas later blocks have zero-padded remainders
+_UNPADDED_SUFFIXES: list[bytes] = [b"%d" % j for j in range(BLOCK_SIZE)]
+_PADDED_SUFFIXES: list[bytes] = [b"%03d" % j for j in range(BLOCK_SIZE)]
+
+
+def has_leading_zero_nibbles(digest: bytes, n: int) -> bool:
+    """Check whether the hexadecimal representation of a message digest starts with at least n zeroes,
+    without formatting it. Each byte holds two hexadecimal digits (nibbles), the first in its high four bits.
+    """
+    n_bytes, odd = divmod(n, 2)
+    return digest.startswith(bytes(n_bytes)) and (not odd or digest[n_bytes] < 0x10)
+
+
+def generate_valid_md5_digests(key: str, difficulty: int, start: int=0, stop: int=INDEX_LIMIT) -> Iterator[tuple[int, bytes]]:
+    """Yield pairs of index and message digest, in increasing order of index from `start` up to (not including) `stop`,
+    for each index where the MD5 hash of the input key concatenated with the index
+    starts with n zeroes in its hexadecimal representation, for some difficulty parameter `n`.
+    """
+    if not (isinstance(difficulty, int) and 0 <= difficulty <= 32):
+        raise ValueError("Difficulty must be an integer between 0 and 32")
+
+    n_bytes, odd = divmod(difficulty, 2)
+    zero_bytes = bytes(n_bytes)
+    key_hash = hashlib.md5(key.encode())
+
+    for block in range(max(start, 0) // BLOCK_SIZE, -(-stop // BLOCK_SIZE)):
+        if block == 0:
+            copy_prefix_hash, suffixes = key_hash.copy, _UNPADDED_SUFFIXES
+        else:
+            prefix_hash = key_hash.copy()
+            prefix_hash.update(b"%d" % block)
+            copy_prefix_hash, suffixes = prefix_hash.copy, _PADDED_SUFFIXES
+
+        offset = block * BLOCK_SIZE
+        for j in range(max(start - offset, 0), min(stop - offset, BLOCK_SIZE)):
+            md5_hash = copy_prefix_hash()
+            md5_hash.update(suffixes[j])
+            digest = md5_hash.digest()
+            # Deliberately inlines `has_leading_zero_nibbles`, with its constants hoisted out of the loop,
+            # as a function call per candidate index is a noticeable share of the time taken to hash it
+            if digest.startswith(zero_bytes) and (not odd or digest[n_bytes] < 0x10):
+                yield offset + j, digest
@@ -0,0 +1,109 @@
+"""Testing functions for the shared cellular automata
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://en.wikipedia.org/wiki/Glider_(Conway%27s_Game_of_Life)
+"""
+import random
+import pytest
+from common.cellular_automata import np, CellGrid, CellularAutomata, CompiledRule, ArrayCellularAutomata
+
+BACKENDS = [False] + ([True] if np is not None else [])
+
+
+def conways_rule_of_life(cell_grid: CellGrid, i: int, j: int) -> str:
+    live_neighbours: int = sum(cell_grid.get_cell(x,y) == '#' for (x,y) in cell_grid.adjacent_neighbourhood(i,j))
+    if cell_grid.get_cell(i,j) == '#':
+        return '#' if live_neighbours in {2, 3} else '.'
+    return '#' if live_neighbours == 3 else '.'
+
+
+def test_compile_rule_from_callable():
+    rule = CompiledRule.from_callable(conways_rule_of_life, states="#.", counted_state="#")
+    assert rule.table == {
+        '#': ['.', '.', '#', '#', '.', '.', '.', '.', '.'],
+        '.': ['.', '.', '.', '#', '.', '.', '.', '.', '.'],
+    }
+
+
+def test_compile_rule_rejects_non_totalistic_rule():
+    def rule(cell_grid: CellGrid, i: int, j: int) -> str:
+        return cell_grid.get_cell(i-1, j)
+    with pytest.raises(ValueError):
+        CompiledRule.from_callable(rule, states="#.", counted_state="#")
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_array_cellular_automata_matches_cellular_automata(use_numpy: bool, seed: int):
+    rng = random.Random(seed)
+    initial_state = ["".join(rng.choice("#..") for _ in range(17)) for _ in range(13)]
+    expected = CellularAutomata(initial_state, conways_rule_of_life)
+    actual = ArrayCellularAutomata(
+        initial_state, CompiledRule.from_callable(conways_rule_of_life, "#.", "#"), use_numpy=use_numpy
+    )
+    for _ in range(5):
+        expected.evolve_n_generations(1)
+        actual.evolve_n_generations(1)
+        assert actual.state == expected.state
+    assert actual.count('#') == expected.count('#')
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_array_cellular_automata_glider(use_numpy: bool):
+    glider = [".#....", "..#...", "###...", "......", "......", "......"]
+    automaton = ArrayCellularAutomata(glider, CompiledRule.from_callable(conways_rule_of_life, "#.", "#"), use_numpy=use_numpy)
+    automaton.evolve_n_generations(4)
+    assert automaton.state == ["......", "..#...", "...#..", ".###..", "......", "......"]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_array_cellular_automata_fixed_cells(use_numpy: bool):
+    automaton = ArrayCellularAutomata(
+        ["#..", "...", "..."], CompiledRule.from_callable(conways_rule_of_life, "#.", "#"),
+        fixed_cells={(0, 0): '#', (2, 2): '#'}, use_numpy=use_numpy
+    )
+    assert automaton.state == ["#..", "...", "..#"]
+    automaton.evolve_n_generations(3)
+    assert automaton.state == ["#..", "...", "..#"]
+
+
+def accessible_paper_roll_rule(cell_grid: CellGrid, i: int, j: int) -> str:
+    """Remove rolls of paper (@) with fewer than four adjacent rolls, as in 2025 Day 4"""
+    live_neighbours: int = sum(cell_grid.get_cell(x,y) == '@' for (x,y) in cell_grid.adjacent_neighbourhood(i,j))
+    return 'x' if cell_grid.get_cell(i,j) == '@' and live_neighbours < 4 else cell_grid.get_cell(i,j)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+@pytest.mark.parametrize(
+    "rule,states,counted_state,generations",
+    [
+        (conways_rule_of_life, "#.", "#", [1, 40]),
+        (conways_rule_of_life, "#.", "#", [200]),
+        (accessible_paper_roll_rule, "@x.", "@", [1, 10_000]),
+        (accessible_paper_roll_rule, "@x.", "@", [10_000]),
+    ]
+)
+def test_array_cellular_automata_incremental_evolution(rule, states: str, counted_state: str, generations: list[int], seed: int):
+    """Evolving only the active frontier matches evolving the whole grid, over many generations in a single call,
+    with and without fixed cells
+    """
+    rng = random.Random(seed)
+    initial_state = ["".join(rng.choice(states[0] * 2 + states[-1]) for _ in range(23)) for _ in range(17)]
+    compiled_rule = CompiledRule.from_callable(rule, states, counted_state)
+    for fixed_cells in [None, {(0, 0): states[0], (16, 22): states[0], (8, 11): states[-1]}]:
+        expected = ArrayCellularAutomata(initial_state, compiled_rule, fixed_cells=fixed_cells, use_numpy=False)
+        actual = ArrayCellularAutomata(initial_state, compiled_rule, fixed_cells=fixed_cells, use_numpy=False)
+        for n in generations:
+            expected.evolve_n_generations(n)
+            actual.evolve_n_generations(n, incremental=True)
+            assert actual.state == expected.state
+            assert actual.t == expected.t
+
+
+def test_array_cellular_automata_incremental_glider():
+    """A glider travels across an otherwise empty grid, so the active frontier moves with it"""
+    glider = [".#....", "..#...", "###...", "......", "......", "......"]
+    automaton = ArrayCellularAutomata(glider, CompiledRule.from_callable(conways_rule_of_life, "#.", "#"), use_numpy=False)
+    automaton.evolve_n_generations(4, incremental=True)
+    assert automaton.state == ["......", "..#...", "...#..", ".###..", "......", "......"]
@@ -0,0 +1,64 @@
+"""Testing functions for the shared compact coordinates
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import pytest
+from common.coordinates import STRIDE, Vector, pack, unpack, manhattan_norm, walk_arrows, line
+
+
+@pytest.mark.parametrize(
+    "i,j",
+    [
+        (0, 0),
+        (3, -4),
+        (-3, 4),
+        (-1, -1),
+        (10 ** 12, -(10 ** 9)),
+        (-5, STRIDE // 2 - 1),
+        (7, -(STRIDE // 2)),
+    ]
+)
+def test_pack_unpack(i: int, j: int):
+    assert unpack(pack(i, j)) == (i, j)
+    assert manhattan_norm(pack(i, j)) == abs(i) + abs(j)
+    assert Vector.from_packed(pack(i, j)) == Vector(i, j)
+    assert Vector(i, j).packed == pack(i, j)
+
+
+@pytest.mark.parametrize(
+    "u,v",
+    [
+        (Vector(1, 2), Vector(-3, 4)),
+        (Vector(-1, -1), Vector(1, 1)),
+        (Vector(0, -7), Vector(5, 0)),
+    ]
+)
+def test_packed_arithmetic(u: Vector, v: Vector):
+    assert Vector.from_packed(u.packed + v.packed) == u + v
+    assert Vector.from_packed(u.packed - v.packed) == u - v
+    assert Vector.from_packed(3 * u.packed) == 3 * u
+
+
+@pytest.mark.parametrize(
+    "arrows,expected",
+    [
+        ("", [Vector(0, 0)]),
+        ("^>v<", [Vector(0, 0), Vector(0, 1), Vector(1, 1), Vector(1, 0), Vector(0, 0)]),
+        ("<<v", [Vector(0, 0), Vector(-1, 0), Vector(-2, 0), Vector(-2, -1)]),
+    ]
+)
+def test_walk_arrows(arrows: str, expected: list[Vector]):
+    assert list(map(Vector.from_packed, walk_arrows(arrows))) == expected
+
+
+@pytest.mark.parametrize(
+    "start,step,distance,expected",
+    [
+        (Vector(0, 0), Vector(0, -1), 3, [Vector(0, -1), Vector(0, -2), Vector(0, -3)]),
+        (Vector(2, -1), Vector(-1, 0), 2, [Vector(1, -1), Vector(0, -1)]),
+        (Vector(2, -1), Vector(1, 0), 0, []),
+    ]
+)
+def test_line(start: Vector, step: Vector, distance: int, expected: list[Vector]):
+    assert list(map(Vector.from_packed, line(start.packed, step.packed, distance))) == expected
@@ -0,0 +1,76 @@
+"""Testing functions for the shared Held-Karp route optimiser
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+- https://adventofcode.com/2015/day/9
+- https://adventofcode.com/2015/day/13
+"""
+import itertools
+import random
+import pytest
+from common.hamiltonian import np, hamiltonian_path, hamiltonian_cycle
+
+BACKENDS = [False] + ([True] if np is not None else [])
+
+EXAMPLE_DISTANCES = {("London", "Dublin"): 464, ("London", "Belfast"): 518, ("Dublin", "Belfast"): 141}
+EXAMPLE_DISTANCES |= {(end, start): distance for (start, end), distance in EXAMPLE_DISTANCES.items()}
+
+EXAMPLE_PAYOFFS = {
+    ("Alice", "Bob"): 54, ("Alice", "Carol"): -79, ("Alice", "David"): -2,
+    ("Bob", "Alice"): 83, ("Bob", "Carol"): -7, ("Bob", "David"): -63,
+    ("Carol", "Alice"): -62, ("Carol", "Bob"): 60, ("Carol", "David"): 55,
+    ("David", "Alice"): 46, ("David", "Bob"): -7, ("David", "Carol"): 41,
+}
+
+
+def route_weight(route: list[str], weights: dict[tuple[str, str], int], cycle: bool) -> int:
+    edges = list(zip(route, route[1:])) + ([(route[-1], route[0])] if cycle else [])
+    return sum(weights[edge] for edge in edges)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("maximise, expected", [(False, 605), (True, 982)])
+def test_example_paths(use_numpy: bool, maximise: bool, expected: int):
+    weight, route = hamiltonian_path(EXAMPLE_DISTANCES, maximise=maximise, use_numpy=use_numpy)
+    assert weight == expected
+    assert sorted(route) == ["Belfast", "Dublin", "London"]
+    assert route_weight(route, EXAMPLE_DISTANCES, cycle=False) == expected
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_example_seating_cycle(use_numpy: bool):
+    # Both neighbours' payoffs count for each pair of adjacent guests
+    weights = {(u, v): EXAMPLE_PAYOFFS[(u, v)] + EXAMPLE_PAYOFFS[(v, u)] for (u, v) in EXAMPLE_PAYOFFS}
+    weight, route = hamiltonian_cycle(weights, maximise=True, use_numpy=use_numpy)
+    assert weight == 330
+    assert route_weight(route, weights, cycle=True) == 330
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+@pytest.mark.parametrize("cycle", [False, True])
+@pytest.mark.parametrize("maximise", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_matches_brute_force_on_directed_graphs(use_numpy: bool, cycle: bool, maximise: bool, seed: int):
+    rng = random.Random(seed)
+    vertices = [f"v{k}" for k in range(7)]
+    weights = {(u, v): rng.randint(-50, 100) for u, v in itertools.permutations(vertices, 2)}
+    optimum = max if maximise else min
+    expected = optimum(route_weight(route, weights, cycle) for route in itertools.permutations(vertices))
+
+    solver = hamiltonian_cycle if cycle else hamiltonian_path
+    weight, route = solver(weights, maximise=maximise, use_numpy=use_numpy)
+    assert weight == expected
+    assert sorted(route) == vertices
+    assert route_weight(route, weights, cycle) == expected
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_missing_edges(use_numpy: bool):
+    # A star graph has no Hamiltonian path beyond three vertices, and a path graph has exactly one up to reversal
+    star = {("hub", leaf): 1 for leaf in "abc"} | {(leaf, "hub"): 1 for leaf in "abc"}
+    with pytest.raises(ValueError):
+        hamiltonian_path(star, use_numpy=use_numpy)
+    line = {("a", "b"): 1, ("b", "c"): 2, ("c", "d"): 3}
+    assert hamiltonian_path(line, use_numpy=use_numpy) == (6, ["a", "b", "c", "d"])
+    with pytest.raises(ValueError):
+        hamiltonian_cycle(line, use_numpy=use_numpy)
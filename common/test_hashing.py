@@ -0,0 +1,56 @@
+"""Testing functions for the shared MD5 hashing kernel
+
+References
+- https://docs.pytest.org/en/latest/how-to/parametrize.html#parametrizemark
+"""
+import hashlib
+import itertools
+import pytest
+from common.hashing import has_leading_zero_nibbles, generate_valid_md5_digests
+
+
+@pytest.mark.parametrize(
+    "digest,n,expected",
+    [
+        (bytes.fromhex("000001dbbfa3a5c83a2d506429c7b00e"), 5, True),
+        (bytes.fromhex("000001dbbfa3a5c83a2d506429c7b00e"), 6, False),
+        (bytes.fromhex("0000001dbfa3a5c83a2d506429c7b00e"), 6, True),
+        (bytes.fromhex("f0000000000000000000000000000000"), 1, False),
+        (bytes.fromhex("f0000000000000000000000000000000"), 0, True),
+    ]
+)
+def test_has_leading_zero_nibbles(digest: bytes, n: int, expected: bool):
+    assert has_leading_zero_nibbles(digest, n) == expected
+
+
+@pytest.mark.parametrize("difficulty", [0, 1, 2, 3])
+@pytest.mark.parametrize(
+    "start,stop",
+    [
+        (0, 3000),
+        (995, 1005),
+        (1234, 5678),
+        (999_990, 1_000_010),
+    ]
+)
+def test_generate_valid_md5_digests_matches_direct_hashing(start: int, stop: int, difficulty: int):
+    """Every index in range is checked, and the digests match hashing the full message from scratch,
+    with the leading zeroes tested by the kernel agreeing with both the hexadecimal digest and `has_leading_zero_nibbles`
+    for even and odd difficulties
+    """
+    expected = [
+        (i, hashlib.md5(f"abc{i}".encode()).digest())
+        for i in range(start, stop)
+        if hashlib.md5(f"abc{i}".encode()).hexdigest().startswith("0" * difficulty)
+    ]
+    assert list(generate_valid_md5_digests("abc", difficulty, start, stop)) == expected
+    assert expected == [
+        (i, digest) for i, digest in ((i, hashlib.md5(f"abc{i}".encode()).digest()) for i in range(start, stop))
+        if has_leading_zero_nibbles(digest, difficulty)
+    ]
+
+
+def test_generate_valid_md5_digests():
+    """First three valid hashes from the 2016 Day 5 example"""
+    digests = itertools.islice(generate_valid_md5_digests("abc", 5), 3)
+    assert [(i, digest.hex()[5]) for i, digest in digests] == [(3231929, "1"), (5017308, "8"), (5278568, "f")]